@@ -5,10 +5,10 @@ from collections import defaultdict
 from django.contrib.auth import get_user_model
 from django.db.models import (
     Avg, Count, Sum, Q, F, Value, CharField, IntegerField,
-    Case, When,
+    Case, When, Exists, OuterRef, Window,
 )
 from django.db.models.functions import (
-    ExtractHour, ExtractWeekDay, TruncMonth,
+    ExtractHour, ExtractWeekDay, FirstValue, RowNumber, TruncMonth,
 )
 from django.utils import timezone
 
@@ -20,6 +20,14 @@ from users.models import UserActivity, Referral
 
 User = get_user_model()
 
+# Rows fetched per round trip when streaming CSV exports
+CSV_EXPORT_CHUNK_SIZE = 2000
+
+# Approximate size of each chunk handed to the HTTP response
+_CSV_BUFFER_SIZE = 64 * 1024
+
+_CSV_DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
 
 class AnalyticsService:
     """
@@ -199,13 +207,17 @@ class AnalyticsService:
         Comprehensive ATS analytics:
 
         - top_job_titles: top 10 most-analysed job titles
-        - avg_score_by_category: average of each category key inside
-          ATSScore.analysis JSON (keyword, skills, structure, formatting)
+        - avg_score_by_category: average keyword, skills, structure and
+          formatting sub-score (ATSScore.keyword_score etc.)
         - score_distribution: count of scores in 5 buckets
           (0-20, 21-40, 41-60, 61-80, 81-100)
         - most_common_missing_keywords: top 20 keywords from KeywordMatch
           where found=False, ordered by frequency
+        - result_cache: hit/miss counters of the ATS result cache
         """
+        # Imported lazily: ats_checker.services loads the NLP pipeline
+        from ats_checker.services import get_result_cache_stats as ats_result_cache_stats
+
         # Top 10 job titles
         top_job_titles = list(
             ATSScore.objects
@@ -214,29 +226,8 @@ class AnalyticsService:
             .order_by('-count')[:10]
         )
 
-        # Average score by analysis category
-        # The analysis JSON is expected to have keys like:
-        # {"keyword": 75, "skills": 80, "structure": 60, "formatting": 90}
-        # We iterate in Python because JSON key extraction varies by DB backend.
-        categories = ['keyword', 'skills', 'structure', 'formatting']
-        category_totals = {c: [] for c in categories}
-
-        for entry in ATSScore.objects.values_list('analysis', flat=True).iterator():
-            if isinstance(entry, dict):
-                for cat in categories:
-                    val = entry.get(cat)
-                    if val is not None:
-                        try:
-                            category_totals[cat].append(float(val))
-                        except (TypeError, ValueError):
-                            pass
-
-        avg_score_by_category = {}
-        for cat, values in category_totals.items():
-            if values:
-                avg_score_by_category[cat] = round(sum(values) / len(values), 2)
-            else:
-                avg_score_by_category[cat] = None
+        # Average score by analysis category, from the indexed sub-score columns
+        avg_score_by_category = _avg_score_by_category()
 
         # Score distribution
         score_distribution = list(
@@ -267,6 +258,31 @@ class AnalyticsService:
             'avg_score_by_category': avg_score_by_category,
             'score_distribution': score_distribution,
             'most_common_missing_keywords': missing_keywords,
+            'result_cache': ats_result_cache_stats(),
+        }
+
+    @staticmethod
+    def get_stage_timings(limit=5000):
+        """
+        p50/p95/p99 milliseconds per pipeline stage:
+
+        - ats.analyze: from ``ATSScore.analysis['timings']`` of the
+          latest ``limit`` analyses
+        - ats.optimize, cover_letter.generate: from the sample window
+          kept by ``ats_checker.timing`` (shared through Redis)
+        """
+        from ats_checker.timing import recent_samples, stage_percentiles
+
+        ats_timings = (
+            ATSScore.objects
+            .filter(analysis__has_key='timings')
+            .order_by('-id')
+            .values_list('analysis__timings', flat=True)[:limit]
+        )
+        return {
+            'ats.analyze': stage_percentiles(ats_timings),
+            'ats.optimize': stage_percentiles(recent_samples('ats.optimize')),
+            'cover_letter.generate': stage_percentiles(recent_samples('cover_letter.generate')),
         }
 
     @staticmethod
@@ -280,38 +296,83 @@ class AnalyticsService:
         - avg_score_improvement: for users with multiple ATS scores,
           compute the average difference between their latest and earliest
           scores to approximate improvement over time
+        - improvement_by_cohort: the same average per signup month
+        - improvement_by_template: the same average per template of the
+          resume behind each user's latest score
+
+        The improvement figures come from a single window-function query
+        over ATSScore partitioned by user.
         """
-        total_suggestions = OptimizationSuggestion.objects.count()
-        applied_count = OptimizationSuggestion.objects.filter(applied=True).count()
+        suggestion_counts = OptimizationSuggestion.objects.aggregate(
+            total=Count('id'),
+            applied=Count('id', filter=Q(applied=True)),
+        )
+        total_suggestions = suggestion_counts['total']
+        applied_count = suggestion_counts['applied']
         applied_rate = (
             round((applied_count / total_suggestions) * 100, 2)
             if total_suggestions > 0
             else 0
         )
 
-        # Average score improvement: for each user who has 2+ ATS scores,
-        # compare latest score vs earliest score.
-        users_with_scores = (
+        # One row per user with 2+ ATS scores: the latest score, carrying
+        # the earliest one and the score count as window annotations.
+        by_user = Window(expression=Count('id'), partition_by=[F('user_id')])
+        oldest_first = [F('created_at').asc(), F('id').asc()]
+        newest_first = [F('created_at').desc(), F('id').desc()]
+        latest_scores = (
             ATSScore.objects
-            .values('user_id')
-            .annotate(score_count=Count('id'))
-            .filter(score_count__gte=2)
+            .annotate(
+                score_count=by_user,
+                earliest_score=Window(
+                    expression=FirstValue('score'),
+                    partition_by=[F('user_id')],
+                    order_by=oldest_first,
+                ),
+                recency=Window(
+                    expression=RowNumber(),
+                    partition_by=[F('user_id')],
+                    order_by=newest_first,
+                ),
+            )
+            .filter(recency=1, score_count__gte=2)
+            .order_by()
+            .values_list(
+                'score', 'earliest_score', 'user__created_at',
+                'resume__template_id', 'resume__template__name',
+            )
         )
 
         improvements = []
-        for entry in users_with_scores:
-            user_scores = ATSScore.objects.filter(
-                user_id=entry['user_id']
-            ).order_by('created_at')
-            earliest = user_scores.first()
-            latest = user_scores.last()
-            if earliest and latest and earliest.pk != latest.pk:
-                improvements.append(latest.score - earliest.score)
-
-        avg_score_improvement = (
-            round(sum(improvements) / len(improvements), 2)
-            if improvements
-            else 0
+        cohorts = defaultdict(list)
+        templates = defaultdict(list)
+        for latest, earliest, signed_up, template_id, template_name in latest_scores.iterator():
+            improvement = latest - earliest
+            improvements.append(improvement)
+            cohorts[timezone.localtime(signed_up).strftime('%Y-%m')].append(improvement)
+            templates[(template_id, template_name)].append(improvement)
+
+        avg_score_improvement = _average(improvements)
+
+        improvement_by_cohort = [
+            {
+                'cohort': cohort,
+                'users': len(values),
+                'avg_score_improvement': _average(values),
+            }
+            for cohort, values in sorted(cohorts.items())
+        ]
+        improvement_by_template = sorted(
+            (
+                {
+                    'template_id': template_id,
+                    'template': template_name,
+                    'users': len(values),
+                    'avg_score_improvement': _average(values),
+                }
+                for (template_id, template_name), values in templates.items()
+            ),
+            key=lambda entry: -entry['users'],
         )
 
         return {
@@ -319,6 +380,8 @@ class AnalyticsService:
             'applied_count': applied_count,
             'applied_rate': applied_rate,
             'avg_score_improvement': avg_score_improvement,
+            'improvement_by_cohort': improvement_by_cohort,
+            'improvement_by_template': improvement_by_template,
         }
 
     @staticmethod
@@ -336,68 +399,117 @@ class AnalyticsService:
         Returns a string containing the CSV data.
         Raises ValueError for unsupported data_type.
         """
-        output = io.StringIO()
-        writer = csv.writer(output)
-
-        if data_type == 'users':
-            writer.writerow([
-                'ID', 'Username', 'Email', 'Full Name', 'Role',
-                'Is Verified', 'Is Subscribed', 'Created At',
-            ])
-            today = timezone.now().date()
-            users = User.objects.filter(is_deleted=False).order_by('id')
-            for user in users:
-                is_subscribed = Subscription.objects.filter(
-                    user=user,
-                    status='active',
-                    end_date__gte=today,
-                ).exists()
-                writer.writerow([
-                    user.id,
-                    user.username,
-                    user.email,
-                    user.full_name,
-                    user.role,
-                    user.is_verified,
-                    is_subscribed,
-                    user.created_at.strftime('%Y-%m-%d %H:%M:%S'),
-                ])
-
-        elif data_type == 'transactions':
-            writer.writerow([
-                'ID', 'User', 'Amount', 'Currency', 'Status',
-                'Payment Method', 'Transaction ID', 'Created At',
-            ])
-            transactions = Transaction.objects.select_related('user').order_by('-created_at')
-            for txn in transactions:
-                writer.writerow([
-                    txn.id,
-                    txn.user.username,
-                    str(txn.amount),
-                    txn.currency,
-                    txn.status,
-                    txn.payment_method,
-                    txn.transaction_id,
-                    txn.created_at.strftime('%Y-%m-%d %H:%M:%S'),
-                ])
-
-        elif data_type == 'scores':
-            writer.writerow([
-                'ID', 'User', 'Resume Title', 'Job Title',
-                'Score', 'Created At',
-            ])
-            scores = ATSScore.objects.select_related('user', 'resume').order_by('-created_at')
-            for s in scores:
-                writer.writerow([
-                    s.id,
-                    s.user.username,
-                    s.resume.title,
-                    s.job_title,
-                    s.score,
-                    s.created_at.strftime('%Y-%m-%d %H:%M:%S'),
-                ])
-
-        else:
-            raise ValueError(f"Unsupported data_type: {data_type}")
+        return ''.join(AnalyticsService.stream_csv(data_type))
 
-        return output.getvalue()
+    @staticmethod
+    def stream_csv(data_type, chunk_size=CSV_EXPORT_CHUNK_SIZE):
+        """
+        Return an iterator of CSV text chunks for *data_type* (see
+        ``export_csv``), for use with ``StreamingHttpResponse``.
+
+        Rows are read with ``.iterator(chunk_size=...)`` -- a server-side
+        cursor on PostgreSQL -- as plain tuples, so memory stays flat
+        however many rows are exported.
+
+        Raises ValueError for unsupported data_type before any query runs.
+        """
+        if data_type not in CSV_EXPORTS:
+            raise ValueError(f"Unsupported data_type: {data_type}")
+        header, rows = CSV_EXPORTS[data_type]()
+        return _csv_chunks(header, rows.iterator(chunk_size=chunk_size))
+
+
+def _average(values):
+    return round(sum(values) / len(values), 2) if values else 0
+
+
+# avg_score_by_category key -> ATSScore sub-score column
+_SCORE_CATEGORIES = {
+    'keyword': 'keyword_score',
+    'skills': 'skills_score',
+    'structure': 'structure_score',
+    'formatting': 'formatting_score',
+}
+
+
+def _avg_score_by_category():
+    """Average each indexed sub-score column in one aggregate query."""
+    averages = ATSScore.objects.aggregate(**{
+        category: Avg(column) for category, column in _SCORE_CATEGORIES.items()
+    })
+    return {
+        category: round(value, 2) if value is not None else None
+        for category, value in averages.items()
+    }
+
+
+def _users_export():
+    today = timezone.now().date()
+    active_subscription = Subscription.objects.filter(
+        user=OuterRef('pk'),
+        status='active',
+        end_date__gte=today,
+    )
+    rows = (
+        User.objects.filter(is_deleted=False)
+        .annotate(has_active_subscription=Exists(active_subscription))
+        .order_by('id')
+        .values_list(
+            'id', 'username', 'email', 'full_name', 'role',
+            'is_verified', 'has_active_subscription', 'created_at',
+        )
+    )
+    header = [
+        'ID', 'Username', 'Email', 'Full Name', 'Role',
+        'Is Verified', 'Is Subscribed', 'Created At',
+    ]
+    return header, rows
+
+
+def _transactions_export():
+    rows = (
+        Transaction.objects.order_by('-created_at')
+        .values_list(
+            'id', 'user__username', 'amount', 'currency', 'status',
+            'payment_method', 'transaction_id', 'created_at',
+        )
+    )
+    header = [
+        'ID', 'User', 'Amount', 'Currency', 'Status',
+        'Payment Method', 'Transaction ID', 'Created At',
+    ]
+    return header, rows
+
+
+def _scores_export():
+    rows = (
+        ATSScore.objects.order_by('-created_at')
+        .values_list('id', 'user__username', 'resume__title', 'job_title', 'score', 'created_at')
+    )
+    header = [
+        'ID', 'User', 'Resume Title', 'Job Title',
+        'Score', 'Created At',
+    ]
+    return header, rows
+
+
+CSV_EXPORTS = {
+    'users': _users_export,
+    'transactions': _transactions_export,
+    'scores': _scores_export,
+}
+
+
+def _csv_chunks(header, rows):
+    """Format *rows* as CSV, yielding roughly ``_CSV_BUFFER_SIZE`` characters at a time."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    for row in rows:
+        # created_at is always the last column
+        writer.writerow(row[:-1] + (row[-1].strftime(_CSV_DATETIME_FORMAT),))
+        if buffer.tell() >= _CSV_BUFFER_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
@@ -0,0 +1,60 @@
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+from subscriptions.models import Subscription, SubscriptionPlan
+
+User = get_user_model()
+
+
+@pytest.fixture
+def users(db):
+    plan = SubscriptionPlan.objects.create(name='Pro', price=499, duration_months=1)
+    today = timezone.now().date()
+    for i in range(12):
+        user = User.objects.create_user(
+            username=f'member{i}', email=f'member{i}@example.com', password='TestPass123!',
+        )
+        if i % 2:
+            Subscription.objects.create(
+                user=user, plan=plan, status='active',
+                start_date=today, end_date=today + timedelta(days=30),
+            )
+
+
+def test_users_csv_export_within_query_budget(admin_client, users, query_inspector):
+    response = admin_client.get('/api/v1/analytics/export/', {'type': 'users'})
+    assert response.status_code == 200
+    lines = b''.join(response.streaming_content).decode().splitlines()
+
+    report = next(report for report in query_inspector if report.view == 'ExportCSVView')
+    assert report.budget is not None
+    assert report.count <= report.budget
+
+    rows = [line.split(',') for line in lines[1:] if line.startswith(tuple('0123456789'))]
+    subscribed = {row[1]: row[6] for row in rows}
+    assert subscribed['member1'] == 'True'
+    assert subscribed['member2'] == 'False'
+
+
+def test_avg_score_by_category_ignores_unparseable_scores(sample_user):
+    from ats_checker.models import ATSScore
+    from resumes.models import Resume
+
+    from .services import AnalyticsService
+
+    resume = Resume.objects.create(user=sample_user, title='CV')
+    for analysis in (
+        {'keyword_match': {'score': 20}, 'formatting': {'score': 'n/a'}},
+        {'keyword_match': {'score': 40}, 'formatting': {'score': 80}},
+    ):
+        score = ATSScore(user=sample_user, resume=resume, job_title='Dev', job_description='...', score=50)
+        score.set_analysis(analysis)
+        score.save()
+
+    averages = AnalyticsService.get_ats_stats()['avg_score_by_category']
+    assert averages['keyword'] == 30.0
+    assert averages['formatting'] == 80.0
+    assert averages['skills'] is None
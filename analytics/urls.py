@@ -6,6 +6,7 @@ from analytics.views import (
     UserActivityHeatmapView,
     TemplateUsageView,
     ATSStatsView,
+    StageTimingsView,
     OptimizationImpactView,
     ExportCSVView,
 )
@@ -16,6 +17,7 @@ urlpatterns = [
     path('user-activity-heatmap/', UserActivityHeatmapView.as_view(), name='user-activity-heatmap'),
     path('template-usage/', TemplateUsageView.as_view(), name='template-usage'),
     path('ats/', ATSStatsView.as_view(), name='ats-stats'),
+    path('stage-timings/', StageTimingsView.as_view(), name='stage-timings'),
     path('optimization-impact/', OptimizationImpactView.as_view(), name='optimization-impact'),
     path('export/', ExportCSVView.as_view(), name='export-csv'),
 ]
@@ -1,4 +1,4 @@
-from django.http import HttpResponse
+from django.http import StreamingHttpResponse
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
@@ -69,6 +69,19 @@ class ATSStatsView(APIView):
         return Response(data, status=status.HTTP_200_OK)
 
 
+class StageTimingsView(APIView):
+    """
+    GET: Return p50/p95/p99 timings per stage of the ATS analysis,
+    resume optimization and cover letter pipelines.
+    Admin only.
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        data = AnalyticsService.get_stage_timings()
+        return Response(data, status=status.HTTP_200_OK)
+
+
 class OptimizationImpactView(APIView):
     """
     GET: Return optimization suggestion impact data.
@@ -83,11 +96,13 @@ class OptimizationImpactView(APIView):
 
 class ExportCSVView(APIView):
     """
-    GET: Export data as CSV.
+    GET: Export data as CSV, streamed as rows are read.
     Query parameter ?type= must be one of: users, transactions, scores.
     Admin only.
     """
     permission_classes = [IsAdminUser]
+    # Enforced by the query_inspector test fixture (resumeit.query_inspector)
+    query_budget = 1
 
     def get(self, request):
         data_type = request.query_params.get('type')
@@ -99,10 +114,10 @@ class ExportCSVView(APIView):
             )
 
         try:
-            csv_content = AnalyticsService.export_csv(data_type)
+            chunks = AnalyticsService.stream_csv(data_type)
         except ValueError as e:
             return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
-        response = HttpResponse(csv_content, content_type='text/csv')
+        response = StreamingHttpResponse(chunks, content_type='text/csv')
         response['Content-Disposition'] = f'attachment; filename="resumeit_{data_type}.csv"'
         return response
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import ATSScore, KeywordMatch, OptimizationSuggestion, JobTitleSynonym
+from .models import ATSScore, ATSScoreBatch, KeywordMatch, OptimizationSuggestion, JobTitleSynonym
 
 
 class KeywordMatchInline(admin.TabularInline):
@@ -48,6 +48,17 @@ class ATSScoreAdmin(admin.ModelAdmin):
     )
 
 
+@admin.register(ATSScoreBatch)
+class ATSScoreBatchAdmin(admin.ModelAdmin):
+    """
+    Admin configuration for the ATSScoreBatch model.
+    """
+    list_display = ('user', 'job_title', 'status', 'created_at', 'completed_at')
+    list_filter = ('status', 'created_at')
+    search_fields = ('user__username', 'user__email', 'job_title')
+    readonly_fields = ('created_at', 'completed_at')
+
+
 @admin.register(KeywordMatch)
 class KeywordMatchAdmin(admin.ModelAdmin):
     """
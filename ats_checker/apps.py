@@ -4,4 +4,7 @@ from django.apps import AppConfig
 class AtsCheckerConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'ats_checker'
-    verbose_name = 'ATS Score Checker'
\ No newline at end of file
+    verbose_name = 'ATS Score Checker'
+
+    def ready(self):
+        import ats_checker.signals  # noqa
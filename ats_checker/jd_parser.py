@@ -10,6 +10,9 @@ so the optimizer only processes actual requirements and responsibilities.
 import re
 from typing import Dict, List, Optional
 
+from .nlp.skill_matcher import get_skill_matcher
+from .nlp.skills_db import SKILL_DISPLAY_NAMES
+
 
 # Section header patterns (case-insensitive)
 _RELEVANT_HEADERS = re.compile(
@@ -251,35 +254,6 @@ class JobDescriptionParser:
 
     def _extract_skills_from_text(self, text: str) -> List[str]:
         """Extract technology/skill names from clean description text."""
-        # Common tech skills pattern
-        known_skills = [
-            "Python", "JavaScript", "TypeScript", "Java", "C++", "C#", "Go", "Rust",
-            "Ruby", "PHP", "Swift", "Kotlin", "Scala", "R", "MATLAB",
-            "React", "React.js", "Angular", "Vue", "Vue.js", "Next.js", "Nuxt",
-            "Node.js", "Express", "Django", "Flask", "FastAPI", "Spring Boot",
-            "Rails", "Laravel", "ASP.NET",
-            "AWS", "Azure", "GCP", "Docker", "Kubernetes", "Terraform",
-            "PostgreSQL", "MySQL", "MongoDB", "Redis", "Elasticsearch",
-            "Git", "Jenkins", "CI/CD", "GitHub Actions",
-            "REST", "GraphQL", "gRPC", "WebSocket",
-            "HTML", "CSS", "SASS", "LESS", "Tailwind",
-            "Redux", "Flux", "Webpack", "Vite", "Babel",
-            "Jest", "Mocha", "Cypress", "Selenium", "Pytest",
-            "Machine Learning", "Deep Learning", "NLP", "Computer Vision",
-            "TensorFlow", "PyTorch", "scikit-learn", "Pandas", "NumPy",
-            "SQL", "NoSQL", "ETL", "Data Pipeline",
-            "Agile", "Scrum", "Kanban", "JIRA",
-            "Linux", "Unix", "Shell Scripting", "Bash",
-            "Microservices", "Serverless", "Event-Driven",
-            "OAuth", "JWT", "SSO", "LDAP",
-            "Figma", "Sketch", "Adobe XD",
-        ]
-        found = []
-        text_lower = text.lower()
-        for skill in known_skills:
-            # Case-insensitive search with word boundary
-            pattern = re.compile(r"\b" + re.escape(skill) + r"\b", re.IGNORECASE)
-            if pattern.search(text):
-                found.append(skill)
-
-        return found
+        display = {name.lower(): name for name in SKILL_DISPLAY_NAMES}
+        mentioned = set(get_skill_matcher().find_terms(text))
+        return [name for term, name in display.items() if term in mentioned]
@@ -0,0 +1,63 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ats_checker.nlp import KeywordMatcher, SynonymExpander
+from ats_checker.nlp.skills_db import SKILLS_DB
+
+_GENERAL_WORDS = [
+    'developer', 'developers', 'engineer', 'engineering', 'manage', 'managed',
+    'management', 'lead', 'leading', 'design', 'designed', 'testing', 'tested',
+    'deploy', 'deployment', 'analysis', 'analyze', 'scalable', 'scaling',
+    'optimize', 'optimization', 'mentor', 'mentoring', 'collaborate',
+    'collaboration', 'architecture', 'architect', 'automate', 'automation',
+    'programmer', 'programming', 'support', 'supported', 'build', 'building',
+]
+
+
+class Command(BaseCommand):
+    help = 'Compare pairwise are_related matching against KeywordMatcher'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--size', type=int, default=30, help='Keywords per side (default 30)')
+        parser.add_argument('--repeat', type=int, default=20, help='Timed iterations (default 20)')
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        size, repeat = options['size'], options['repeat']
+        rng = random.Random(options['seed'])
+
+        vocabulary = sorted(_GENERAL_WORDS + [s for skills in SKILLS_DB.values() for s in skills])
+        job_keywords = rng.sample(vocabulary, size)
+        resume_keywords = rng.sample(vocabulary, size)
+
+        expander = SynonymExpander()
+
+        def pairwise():
+            return [
+                any(expander.are_related(jk, rk) for rk in resume_keywords)
+                for jk in job_keywords
+            ]
+
+        def batched():
+            matcher = KeywordMatcher(resume_keywords, expander)
+            return [matcher.matches(jk) for jk in job_keywords]
+
+        # Warm up lazy NLTK / synonym-index loading outside the timed region
+        expected = pairwise()
+        if batched() != expected:
+            raise CommandError('KeywordMatcher results differ from pairwise are_related')
+
+        timings = {}
+        for name, func in (('pairwise', pairwise), ('batched', batched)):
+            start = time.perf_counter()
+            for _ in range(repeat):
+                func()
+            timings[name] = (time.perf_counter() - start) / repeat
+
+        speedup = timings['pairwise'] / timings['batched'] if timings['batched'] else float('inf')
+        self.stdout.write(f'{size}x{size} keywords, {sum(expected)} matched, {repeat} iterations')
+        self.stdout.write(f'  pairwise are_related: {timings["pairwise"] * 1000:.2f} ms')
+        self.stdout.write(f'  KeywordMatcher:       {timings["batched"] * 1000:.2f} ms')
+        self.stdout.write(self.style.SUCCESS(f'Identical results, {speedup:.1f}x faster'))
@@ -0,0 +1,51 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ats_checker.nlp.keyword_extractor import _load_spacy_model
+from ats_checker.nlp.pipeline_profiles import PROFILES, disabled_components
+
+_SAMPLE_TEXT = """
+Senior Backend Engineer. We are looking for an engineer who has built and
+operated microservices in Python and Go on Kubernetes. The platform was
+migrated to AWS by a small team, and our APIs are consumed by millions of
+users. You will own CI/CD pipelines, mentor junior developers and work with
+PostgreSQL, Redis and Kafka. Experience with machine learning is a plus.
+"""
+
+
+class Command(BaseCommand):
+    help = 'Measure spaCy throughput for the full pipeline and each pipeline profile'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--docs', type=int, default=200, help='Documents per run (default 200)')
+        parser.add_argument('--batch-size', type=int, default=32, help='nlp.pipe batch size')
+
+    def handle(self, *args, **options):
+        nlp = _load_spacy_model()
+        if nlp is None:
+            raise CommandError('No spaCy English model is installed; nothing to benchmark.')
+
+        texts = [_SAMPLE_TEXT] * options['docs']
+        self.stdout.write(f"{nlp.meta.get('name')} pipeline: {', '.join(nlp.pipe_names)}")
+
+        rates = {}
+        for profile in PROFILES:
+            disabled = disabled_components(nlp, profile)
+            # Warm up before timing
+            list(nlp.pipe(texts[:4], disable=disabled))
+            start = time.perf_counter()
+            for _ in nlp.pipe(texts, batch_size=options['batch_size'], disable=disabled):
+                pass
+            elapsed = time.perf_counter() - start
+            rates[profile] = len(texts) / elapsed if elapsed else 0
+            active = [name for name in nlp.pipe_names if name not in disabled]
+            self.stdout.write(
+                f"  {profile:<11} {rates[profile]:8.1f} docs/s  [{', '.join(active) or 'tokenizer only'}]"
+            )
+
+        for profile, rate in rates.items():
+            if profile != 'full' and rates['full']:
+                self.stdout.write(self.style.SUCCESS(
+                    f"{profile}: {rate / rates['full']:.1f}x the full pipeline"
+                ))
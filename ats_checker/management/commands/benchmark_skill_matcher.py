@@ -0,0 +1,87 @@
+import re
+import time
+
+from django.core.management.base import BaseCommand
+
+from ats_checker.nlp.skill_matcher import SkillMatcher, get_skill_matcher
+from ats_checker.nlp.skills_db import SKILL_DISPLAY_NAMES, SKILLS_DB, is_known_skill
+
+_SAMPLE_JD = """
+Senior Backend Engineer
+
+What you'll do:
+- Design and build microservices in Python, Go and C++ running on Kubernetes.
+- Own our CI/CD pipelines (GitHub Actions, Jenkins) and infrastructure as code with Terraform.
+- Build REST and GraphQL APIs with Django, FastAPI and Node.js; some legacy ASP.NET and C#.
+- Work with PostgreSQL, Redis, Elasticsearch and Kafka on AWS and Google Cloud Platform.
+
+Requirements:
+- 5+ years of experience with Python or Java; JavaScript/TypeScript and React.js a plus.
+- Experience with machine learning pipelines, pandas, NumPy and scikit-learn.
+- Strong communication, leadership and problem solving skills; Agile / Scrum.
+"""
+
+
+def _legacy_parser_skills(text):
+    """The per-skill regex loop the job description parser used to run."""
+    found = []
+    for skill in SKILL_DISPLAY_NAMES:
+        pattern = re.compile(r"\b" + re.escape(skill) + r"\b", re.IGNORECASE)
+        if pattern.search(text):
+            found.append(skill)
+    return found
+
+
+def _legacy_token_skills(text):
+    """Token-at-a-time lookup against the skills database."""
+    return [w for w in re.findall(r"\S+", text.lower()) if len(w) > 2 and is_known_skill(w.strip(".,;:()"))]
+
+
+class Command(BaseCommand):
+    help = 'Compare the Aho-Corasick skill matcher against the per-skill regex scan'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeat', type=int, default=200, help='Timed iterations (default 200)')
+        parser.add_argument('--scale', type=int, default=4, help='Copies of the sample JD per text (default 4)')
+
+    def handle(self, *args, **options):
+        repeat = options['repeat']
+        text = _SAMPLE_JD * options['scale']
+
+        start = time.perf_counter()
+        SkillMatcher([s for skills in SKILLS_DB.values() for s in skills] + SKILL_DISPLAY_NAMES)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        matcher = get_skill_matcher()
+        display = {name.lower(): name for name in SKILL_DISPLAY_NAMES}
+
+        def automaton():
+            mentioned = set(matcher.find_terms(text))
+            return [name for term, name in display.items() if term in mentioned]
+
+        runs = (
+            ('per-skill regex (parser)', lambda: _legacy_parser_skills(text)),
+            ('token lookup (extractor)', lambda: _legacy_token_skills(text)),
+            ('Aho-Corasick matcher', automaton),
+        )
+        timings = {}
+        for name, func in runs:
+            func()
+            start = time.perf_counter()
+            for _ in range(repeat):
+                func()
+            timings[name] = (time.perf_counter() - start) / repeat * 1000
+
+        self.stdout.write(f'{len(text)} chars, {len(matcher.terms)} terms, {repeat} iterations')
+        self.stdout.write(f'  automaton build (once per process): {build_ms:.2f} ms')
+        for name, elapsed in timings.items():
+            self.stdout.write(f'  {name:<26} {elapsed:.3f} ms')
+
+        legacy = set(_legacy_parser_skills(text))
+        current = set(automaton())
+        if legacy != current:
+            self.stdout.write(f'  only regex:     {sorted(legacy - current)}')
+            self.stdout.write(f'  only automaton: {sorted(current - legacy)}')
+
+        speedup = timings['per-skill regex (parser)'] / timings['Aho-Corasick matcher']
+        self.stdout.write(self.style.SUCCESS(f'Matcher is {speedup:.1f}x faster than the regex scan'))
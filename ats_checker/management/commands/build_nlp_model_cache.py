@@ -0,0 +1,42 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ats_checker.nlp.model_cache import cached_pipeline_path, load_pipeline
+from ats_checker.nlp.multilang import LANGUAGE_MODELS
+
+
+class Command(BaseCommand):
+    help = 'Save every installed spaCy pipeline with the skills EntityRuler to NLP_MODEL_CACHE_DIR'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--lang', action='append', default=None,
+            help='Only build pipelines for this language code (repeatable)',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            import spacy  # noqa: F401
+        except ImportError:
+            raise CommandError('spaCy is not installed. Install it with: pip install spacy')
+
+        langs = options['lang'] or list(LANGUAGE_MODELS)
+        model_names = list(dict.fromkeys(
+            name for lang in langs for name in LANGUAGE_MODELS.get(lang, ())
+        ))
+
+        built = 0
+        for model_name in model_names:
+            path = cached_pipeline_path(model_name)
+            if path is None:
+                continue
+            start = time.perf_counter()
+            load_pipeline(model_name)
+            built += 1
+            self.stdout.write(f'  {model_name}: {path} ({time.perf_counter() - start:.1f}s)')
+
+        if not built:
+            self.stdout.write(self.style.WARNING('No spaCy models are installed; nothing to cache.'))
+            return
+        self.stdout.write(self.style.SUCCESS(f'Cached {built} spaCy pipeline(s)'))
@@ -0,0 +1,43 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ats_checker.nlp.wordnet_lookup import WordNetLookup, build_lookup_file, default_lookup_path
+
+
+class Command(BaseCommand):
+    help = 'Compile NLTK WordNet into the memory-mapped lookup file used by SynonymExpander'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--output',
+            default=None,
+            help='Destination path (defaults to settings.WORDNET_LOOKUP_PATH)',
+        )
+
+    def handle(self, *args, **options):
+        path = options['output'] or default_lookup_path()
+
+        try:
+            import nltk
+        except ImportError:
+            raise CommandError('NLTK is not installed. Install it with: pip install nltk')
+
+        nltk.download('wordnet', quiet=True)
+        nltk.download('omw-1.4', quiet=True)
+
+        start = time.perf_counter()
+        try:
+            records = build_lookup_file(path)
+        except LookupError as exc:
+            raise CommandError(f'WordNet corpus is not available: {exc}')
+        elapsed = time.perf_counter() - start
+
+        # Sanity check: the file must open and resolve a common word
+        lookup = WordNetLookup(path)
+        if not lookup.synset_ids('developer'):
+            raise CommandError(f'{path} was written but does not resolve "developer"')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Wrote {records} WordNet records to {path} in {elapsed:.1f}s'
+        ))
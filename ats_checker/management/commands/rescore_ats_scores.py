@@ -0,0 +1,164 @@
+import hashlib
+import json
+import os
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from ats_checker.models import ATSScore, KeywordMatch, OptimizationSuggestion
+from ats_checker.services import ATSScoreAnalyzer, _keyword_extractor
+
+
+def _jd_hash(ats_score):
+    text = f"{ats_score.job_title} {ats_score.job_description}"
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class Command(BaseCommand):
+    help = 'Re-score historical ATSScore rows in bulk (resumable)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=500,
+                            help='Rows fetched, scored and written per chunk (default 500)')
+        parser.add_argument('--batch-size', type=int, default=settings.ATS_BATCH_SIZE,
+                            help='nlp.pipe batch size')
+        parser.add_argument('--n-process', type=int, default=settings.ATS_BATCH_N_PROCESS,
+                            help='nlp.pipe worker processes')
+        parser.add_argument('--checkpoint',
+                            default=os.path.join(settings.BASE_DIR, 'rescore_ats_scores.checkpoint'),
+                            help='File recording the last re-scored ATSScore id')
+        parser.add_argument('--restart', action='store_true',
+                            help='Ignore an existing checkpoint and start from the first row')
+        parser.add_argument('--limit', type=int, default=None,
+                            help='Stop after this many rows')
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        if chunk_size < 1:
+            raise CommandError('--chunk-size must be at least 1')
+        self.batch_size = options['batch_size']
+        self.n_process = options['n_process']
+        checkpoint = options['checkpoint']
+
+        state = {'last_id': 0, 'processed': 0}
+        if not options['restart'] and os.path.exists(checkpoint):
+            with open(checkpoint) as fp:
+                state.update(json.load(fp))
+            self.stdout.write(
+                f"Resuming after ATSScore id {state['last_id']} "
+                f"({state['processed']} rows already re-scored)"
+            )
+
+        queryset = (
+            ATSScore.objects.filter(id__gt=state['last_id'])
+            .select_related('resume')
+            .order_by('id')
+        )
+        total = queryset.count()
+        if options['limit'] is not None:
+            total = min(total, options['limit'])
+        self.stdout.write(f'Re-scoring {total} ATS scores in chunks of {chunk_size}')
+
+        done = 0
+        start = time.perf_counter()
+        chunk = []
+        for ats_score in queryset.iterator(chunk_size=chunk_size):
+            if done + len(chunk) >= total:
+                break
+            chunk.append(ats_score)
+            if len(chunk) == chunk_size:
+                done += self._process_chunk(chunk, state, checkpoint)
+                chunk = []
+                self._report(done, total, start)
+        if chunk:
+            done += self._process_chunk(chunk, state, checkpoint)
+            self._report(done, total, start)
+
+        elapsed = time.perf_counter() - start
+        if os.path.exists(checkpoint) and (options['limit'] is None or done < options['limit']):
+            # Ran to the end of the table: the next run starts fresh
+            os.remove(checkpoint)
+        self.stdout.write(self.style.SUCCESS(
+            f'Re-scored {done} ATS scores in {elapsed:.1f}s '
+            f'({done / elapsed if elapsed else 0:.1f} rows/s)'
+        ))
+
+    def _process_chunk(self, chunk, state, checkpoint):
+        """Score *chunk*, write it back and advance the checkpoint."""
+        # Group rows sharing a job description so it is extracted once
+        groups = {}
+        for ats_score in chunk:
+            groups.setdefault(_jd_hash(ats_score), []).append(ats_score)
+
+        texts = [ATSScoreAnalyzer.resume_to_text(a.resume.content) for a in chunk]
+        resume_keywords = dict(zip(
+            (a.id for a in chunk),
+            _keyword_extractor.extract_keywords_batch(
+                texts, batch_size=self.batch_size, n_process=self.n_process
+            ),
+        ))
+        resume_texts = dict(zip((a.id for a in chunk), texts))
+
+        now = timezone.now()
+        analyzers = []
+        for rows in groups.values():
+            first = rows[0]
+            job_keywords = _keyword_extractor.extract_keywords(
+                first.job_title + " " + first.job_description
+            )
+            for ats_score in rows:
+                analyzer = ATSScoreAnalyzer(ats_score)
+                # _calculate_keyword_match annotates the dicts in place
+                analyzer.job_keywords = [dict(kw) for kw in job_keywords]
+                analyzer.resume_keywords = resume_keywords[ats_score.id]
+                analyzer.score_resume(resume_texts[ats_score.id])
+                ats_score.score = analyzer.score
+                ats_score.set_analysis(analyzer.analysis)
+                ats_score.suggestions = analyzer.suggestions
+                ats_score.updated_at = now
+                analyzers.append(analyzer)
+
+        ids = [a.id for a in chunk]
+        with transaction.atomic():
+            ATSScore.objects.bulk_update(
+                chunk,
+                ['score', 'analysis', *ATSScore.SUBSCORE_FIELDS, 'suggestions', 'updated_at'],
+                batch_size=500,
+            )
+            # Suggestions the user already applied are kept
+            KeywordMatch.objects.filter(ats_score_id__in=ids).delete()
+            OptimizationSuggestion.objects.filter(ats_score_id__in=ids, applied=False).delete()
+            KeywordMatch.objects.bulk_create(
+                [m for a in analyzers for m in a.build_keyword_matches()], batch_size=1000
+            )
+            # ...and not re-added as a fresh, unapplied copy
+            applied = set(
+                OptimizationSuggestion.objects.filter(ats_score_id__in=ids, applied=True)
+                .values_list('ats_score_id', 'section', 'suggested_text')
+            )
+            OptimizationSuggestion.objects.bulk_create(
+                [
+                    o for a in analyzers for o in a.build_optimization_suggestions()
+                    if (o.ats_score_id, o.section, o.suggested_text) not in applied
+                ],
+                batch_size=1000,
+            )
+
+        state['last_id'] = chunk[-1].id
+        state['processed'] += len(chunk)
+        tmp_path = f'{checkpoint}.tmp'
+        with open(tmp_path, 'w') as fp:
+            json.dump(state, fp)
+        os.replace(tmp_path, checkpoint)
+        return len(chunk)
+
+    def _report(self, done, total, start):
+        elapsed = time.perf_counter() - start
+        rate = done / elapsed if elapsed else 0
+        remaining = (total - done) / rate if rate else 0
+        self.stdout.write(
+            f'  {done}/{total} rows ({rate:.1f} rows/s, ~{remaining:.0f}s remaining)'
+        )
@@ -0,0 +1,77 @@
+# Generated by Django 5.2.18 on 2026-10-17 23:36
+
+from django.db import migrations, models
+
+
+# Frozen copies of ats_checker.models.SUBSCORE_SOURCES and
+# subscores_from_analysis as of this migration
+SUBSCORE_SOURCES = {
+    "keyword_score": "keyword_match",
+    "skills_score": "skills_gap",
+    "structure_score": "structure",
+    "formatting_score": "formatting",
+}
+
+
+def subscores_from_analysis(analysis):
+    subscores = {}
+    for column, section in SUBSCORE_SOURCES.items():
+        value = None
+        if isinstance(analysis, dict) and isinstance(analysis.get(section), dict):
+            try:
+                value = float(analysis[section]["score"])
+            except (KeyError, TypeError, ValueError):
+                value = None
+        subscores[column] = value
+    return subscores
+
+
+def backfill_subscores(apps, schema_editor):
+    ATSScore = apps.get_model("ats_checker", "ATSScore")
+    batch = []
+    for pk, analysis in ATSScore.objects.order_by().values_list("id", "analysis").iterator(chunk_size=2000):
+        batch.append(ATSScore(id=pk, **subscores_from_analysis(analysis)))
+        if len(batch) >= 2000:
+            ATSScore.objects.bulk_update(batch, list(SUBSCORE_SOURCES))
+            batch = []
+    if batch:
+        ATSScore.objects.bulk_update(batch, list(SUBSCORE_SOURCES))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ats_checker", "0005_atsscorebatch"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="atsscore",
+            name="formatting_score",
+            field=models.FloatField(
+                blank=True, db_index=True, null=True, verbose_name="Formatting Score"
+            ),
+        ),
+        migrations.AddField(
+            model_name="atsscore",
+            name="keyword_score",
+            field=models.FloatField(
+                blank=True, db_index=True, null=True, verbose_name="Keyword Match Score"
+            ),
+        ),
+        migrations.AddField(
+            model_name="atsscore",
+            name="skills_score",
+            field=models.FloatField(
+                blank=True, db_index=True, null=True, verbose_name="Skills Score"
+            ),
+        ),
+        migrations.AddField(
+            model_name="atsscore",
+            name="structure_score",
+            field=models.FloatField(
+                blank=True, db_index=True, null=True, verbose_name="Structure Score"
+            ),
+        ),
+        migrations.RunPython(backfill_subscores, migrations.RunPython.noop),
+    ]
@@ -5,20 +5,85 @@ from django.utils.translation import gettext_lazy as _
 User = get_user_model()
 
 
+class ATSScoreBatch(models.Model):
+    """
+    Model for scoring one job description against many resumes at once.
+    """
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('processing', 'Processing'),
+        ('completed', 'Completed'),
+        ('failed', 'Failed'),
+    ]
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='ats_score_batches')
+    job_title = models.CharField(_('Job Title'), max_length=255)
+    job_description = models.TextField(_('Job Description'))
+    resume_ids = models.JSONField(_('Resume IDs'), default=list)
+    status = models.CharField(_('Status'), max_length=20, choices=STATUS_CHOICES, default='pending')
+    error = models.TextField(_('Error'), blank=True)
+    created_at = models.DateTimeField(_('Created At'), auto_now_add=True)
+    completed_at = models.DateTimeField(_('Completed At'), null=True, blank=True)
+
+    class Meta:
+        verbose_name = _('ATS Score Batch')
+        verbose_name_plural = _('ATS Score Batches')
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.user.username} - {self.job_title} ({len(self.resume_ids)} resumes)"
+
+
+# Sub-score column -> section of ``ATSScore.analysis`` holding its ``score``
+SUBSCORE_SOURCES = {
+    'keyword_score': 'keyword_match',
+    'skills_score': 'skills_gap',
+    'structure_score': 'structure',
+    'formatting_score': 'formatting',
+}
+
+
+def subscores_from_analysis(analysis):
+    """Return ``{column: score or None}`` read from an analysis dict."""
+    subscores = {}
+    for column, section in SUBSCORE_SOURCES.items():
+        value = None
+        if isinstance(analysis, dict) and isinstance(analysis.get(section), dict):
+            try:
+                value = float(analysis[section]['score'])
+            except (KeyError, TypeError, ValueError):
+                value = None
+        subscores[column] = value
+    return subscores
+
+
 class ATSScore(models.Model):
     """
     Model for storing ATS scores for resumes.
+
+    The category sub-scores inside ``analysis`` are also stored in their
+    own indexed columns so analytics can aggregate them in SQL; assign
+    ``analysis`` through ``set_analysis`` to keep them in sync.
     """
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='ats_scores')
     resume = models.ForeignKey('resumes.Resume', on_delete=models.CASCADE, related_name='ats_scores')
+    batch = models.ForeignKey(
+        ATSScoreBatch, on_delete=models.SET_NULL, null=True, blank=True, related_name='scores'
+    )
     job_title = models.CharField(_('Job Title'), max_length=255)
     job_description = models.TextField(_('Job Description'))
     score = models.PositiveIntegerField(_('ATS Score'), help_text='Score out of 100')
     analysis = models.JSONField(_('Analysis Results'), default=dict)
+    keyword_score = models.FloatField(_('Keyword Match Score'), null=True, blank=True, db_index=True)
+    skills_score = models.FloatField(_('Skills Score'), null=True, blank=True, db_index=True)
+    structure_score = models.FloatField(_('Structure Score'), null=True, blank=True, db_index=True)
+    formatting_score = models.FloatField(_('Formatting Score'), null=True, blank=True, db_index=True)
     suggestions = models.JSONField(_('Improvement Suggestions'), default=list)
     created_at = models.DateTimeField(_('Created At'), auto_now_add=True)
     updated_at = models.DateTimeField(_('Updated At'), auto_now=True)
-    
+
+    SUBSCORE_FIELDS = tuple(SUBSCORE_SOURCES)
+
     class Meta:
         verbose_name = _('ATS Score')
         verbose_name_plural = _('ATS Scores')
@@ -27,6 +92,12 @@ class ATSScore(models.Model):
     def __str__(self):
         return f"{self.user.username} - {self.resume.title} - {self.score}%"
 
+    def set_analysis(self, analysis):
+        """Assign ``analysis`` and the sub-score columns derived from it."""
+        self.analysis = analysis
+        for column, value in subscores_from_analysis(analysis).items():
+            setattr(self, column, value)
+
 
 class KeywordMatch(models.Model):
     """
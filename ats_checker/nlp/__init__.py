@@ -28,6 +28,7 @@ Quick start::
 
 from .keyword_extractor import SpaCyKeywordExtractor
 from .synonym_expander import SynonymExpander
+from .keyword_matcher import KeywordMatcher
 from .text_analyzer import TextAnalyzer
 from .skills_db import SKILLS_DB, get_skill_category, is_known_skill
 from .multilang import (
@@ -39,6 +40,7 @@ from .multilang import (
 __all__ = [
     "SpaCyKeywordExtractor",
     "SynonymExpander",
+    "KeywordMatcher",
     "TextAnalyzer",
     "SKILLS_DB",
     "get_skill_category",
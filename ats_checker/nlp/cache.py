@@ -0,0 +1,201 @@
+"""
+Content-addressed cache for spaCy keyword extraction results.
+
+The ATS analyzer, the resume optimizer and the cover-letter generator all
+run ``SpaCyKeywordExtractor.extract_keywords`` over the same job-description
+and resume text.  Parsing with ``en_core_web_lg`` dominates the cost of
+those calls, so the ranked keyword list is cached per process, keyed by a
+hash of the normalized text, the loaded model name and the
+``SKILLS_DB`` fingerprint (so editing the skills database never serves
+keywords categorized under the old one).
+
+Two layers are used:
+
+1. A process-local LRU bounded by an approximate byte budget
+   (``NLP_KEYWORD_CACHE_MAX_BYTES``).
+2. Optionally, the Django cache (Redis in production) so that Celery
+   workers and web workers share results (``NLP_KEYWORD_CACHE_SHARED``).
+
+Only the extracted keyword dicts are cached -- every consumer reads the
+Doc solely through ``extract_keywords``, and the JSON payload is a small
+fraction of the size of a serialized ``DocBin``.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import threading
+from collections import OrderedDict
+from typing import List, Optional
+
+from .model_cache import skills_fingerprint
+
+logger = logging.getLogger(__name__)
+
+# Default process-local budget (bytes of JSON payload)
+_DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+# Default TTL for the shared (Django cache) layer, in seconds
+_DEFAULT_SHARED_TTL = 3600
+
+_HORIZONTAL_WS_RE = re.compile(r"[ \t\f\v]+")
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize *text* before hashing and parsing.
+
+    Line endings are unified and runs of horizontal whitespace collapsed;
+    newlines are kept because spaCy uses them as sentence hints.
+    """
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return _HORIZONTAL_WS_RE.sub(" ", text).strip()
+
+
+def make_key(text: str, model_name: str) -> str:
+    """Return the content-addressed cache key for *text* under *model_name*."""
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return f"nlp:kw:{model_name}:{skills_fingerprint()}:{digest}"
+
+
+class KeywordCache:
+    """
+    Thread-safe LRU cache of keyword lists with a byte budget.
+
+    The size of an entry is approximated by the length of its JSON
+    encoding, which is also what the shared layer stores.
+    """
+
+    def __init__(self, max_bytes: int = _DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[List[dict]]:
+        """Return a copy of the cached keyword list for *key*, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return _copy(entry[0])
+
+        shared = _shared_get(key)
+        with self._lock:
+            if shared is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        self._store(key, shared, json.dumps(shared))
+        return _copy(shared)
+
+    def set(self, key: str, keywords: List[dict]) -> None:
+        """Store *keywords* under *key* in the local and shared layers."""
+        payload = json.dumps(keywords)
+        self._store(key, _copy(keywords), payload)
+        _shared_set(key, payload)
+
+    def clear(self) -> None:
+        """Drop every locally cached entry (the shared layer is untouched)."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and current occupancy."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def _store(self, key: str, keywords: List[dict], payload: str) -> None:
+        size = len(payload)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= old[1]
+            self._entries[key] = (keywords, size)
+            self._size += size
+            while self._size > self.max_bytes and self._entries:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+
+
+def _copy(keywords: List[dict]) -> List[dict]:
+    """Shallow-copy each keyword dict; callers annotate them in place."""
+    return [dict(kw) for kw in keywords]
+
+
+# ---------------------------------------------------------------------------
+# Shared layer (Django cache)
+# ---------------------------------------------------------------------------
+
+
+def _shared_settings():
+    try:
+        from django.conf import settings
+
+        return (
+            getattr(settings, "NLP_KEYWORD_CACHE_SHARED", False),
+            getattr(settings, "CACHE_TTL_NLP_KEYWORDS", _DEFAULT_SHARED_TTL),
+        )
+    except Exception:
+        return False, _DEFAULT_SHARED_TTL
+
+
+def _shared_get(key: str) -> Optional[List[dict]]:
+    enabled, _ = _shared_settings()
+    if not enabled:
+        return None
+    try:
+        from django.core.cache import cache
+
+        payload = cache.get(key)
+        return json.loads(payload) if payload else None
+    except Exception as exc:
+        logger.debug("Shared keyword cache read failed: %s", exc)
+        return None
+
+
+def _shared_set(key: str, payload: str) -> None:
+    enabled, ttl = _shared_settings()
+    if not enabled:
+        return
+    try:
+        from django.core.cache import cache
+
+        cache.set(key, payload, ttl)
+    except Exception as exc:
+        logger.debug("Shared keyword cache write failed: %s", exc)
+
+
+# ---------------------------------------------------------------------------
+# Process-wide instance
+# ---------------------------------------------------------------------------
+
+_keyword_cache: Optional[KeywordCache] = None
+
+
+def get_keyword_cache() -> KeywordCache:
+    """Return the process-wide keyword cache, creating it on first use."""
+    global _keyword_cache
+    if _keyword_cache is None:
+        max_bytes = _DEFAULT_MAX_BYTES
+        try:
+            from django.conf import settings
+
+            max_bytes = getattr(settings, "NLP_KEYWORD_CACHE_MAX_BYTES", max_bytes)
+        except Exception:
+            pass
+        _keyword_cache = KeywordCache(max_bytes=max_bytes)
+    return _keyword_cache
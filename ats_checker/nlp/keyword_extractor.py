@@ -9,9 +9,13 @@ common technology skills.
 import logging
 import re
 from collections import Counter
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from .skills_db import SKILLS_DB, get_skill_category, is_known_skill
+from .cache import get_keyword_cache, make_key, normalize_text
+from .model_cache import load_pipeline
+from .pipeline_profiles import pipe_profile, run_profile
+from .skill_matcher import get_skill_matcher
+from .skills_db import get_skill_category, is_known_skill
 
 logger = logging.getLogger(__name__)
 
@@ -30,7 +34,7 @@ def _load_spacy_model():
         return _nlp
 
     try:
-        import spacy
+        import spacy  # noqa: F401
     except ImportError:
         logger.warning(
             "spaCy is not installed. Install it with: pip install spacy"
@@ -39,9 +43,9 @@ def _load_spacy_model():
 
     for model_name in ("en_core_web_lg", "en_core_web_md", "en_core_web_sm"):
         try:
-            _nlp = spacy.load(model_name)
+            # Includes the skills EntityRuler; see ``ats_checker.nlp.model_cache``
+            _nlp = load_pipeline(model_name)
             logger.info("Loaded spaCy model: %s", model_name)
-            _add_entity_ruler(_nlp)
             return _nlp
         except OSError:
             continue
@@ -53,44 +57,6 @@ def _load_spacy_model():
     return None
 
 
-def _add_entity_ruler(nlp):
-    """
-    Add a custom EntityRuler with patterns for common tech skills so that
-    they are recognized as SKILL entities even when the base model misses
-    them.
-    """
-    try:
-        ruler = nlp.add_pipe("entity_ruler", before="ner")
-    except ValueError:
-        # entity_ruler already exists (e.g. model reloaded in tests)
-        return
-
-    patterns = []
-    # Build patterns from the skills database
-    for category, skills in SKILLS_DB.items():
-        if category == "soft_skills":
-            # Soft skills are usually multi-word; still useful to tag them
-            label = "SOFT_SKILL"
-        else:
-            label = "SKILL"
-
-        for skill in skills:
-            tokens = skill.split()
-            if len(tokens) == 1:
-                patterns.append(
-                    {"label": label, "pattern": [{"LOWER": skill.lower()}]}
-                )
-            else:
-                patterns.append(
-                    {
-                        "label": label,
-                        "pattern": [{"LOWER": t.lower()} for t in tokens],
-                    }
-                )
-
-    ruler.add_patterns(patterns)
-
-
 # ---------------------------------------------------------------------------
 # Stopwords that should never surface as keywords
 # ---------------------------------------------------------------------------
@@ -144,13 +110,107 @@ class SpaCyKeywordExtractor:
         """
         if not text or not text.strip():
             return []
+        return self._cached_ranked(text)[: self.max_keywords]
+
+    def extract_keywords_batch(
+        self, texts: List[str], batch_size: int = 32, n_process: int = 1
+    ) -> List[List[dict]]:
+        """
+        Extract keywords from many texts, parsing cache misses with
+        ``nlp.pipe``.
+
+        Returns one keyword list per input text, each identical to what
+        ``extract_keywords`` would return for that text.
+        """
+        normalized = [normalize_text(t) if t and t.strip() else "" for t in texts]
+        cache = get_keyword_cache()
+        model_name = self.model_name
+
+        results: List[Optional[List[dict]]] = [None] * len(normalized)
+        pending: dict[str, List[int]] = {}
+        for index, text in enumerate(normalized):
+            if not text:
+                results[index] = []
+                continue
+            ranked = cache.get(make_key(text, model_name))
+            if ranked is not None:
+                results[index] = ranked
+            else:
+                # Duplicate texts in the batch are parsed once
+                pending.setdefault(text, []).append(index)
 
+        if pending:
+            miss_texts = list(pending)
+            if self.nlp is None:
+                parsed = [self._fallback_extract(t) for t in miss_texts]
+            else:
+                docs = pipe_profile(
+                    self.nlp, miss_texts, "keywords",
+                    batch_size=batch_size, n_process=n_process,
+                )
+                parsed = [self._ranked_from_doc(doc) for doc in docs]
+            for text, ranked in zip(miss_texts, parsed):
+                cache.set(make_key(text, model_name), ranked)
+                for index in pending[text]:
+                    results[index] = [dict(kw) for kw in ranked]
+
+        return [ranked[: self.max_keywords] for ranked in results]
+
+    def extract_candidates(self, text: str) -> Tuple[Counter, dict]:
+        """
+        Return the uncapped candidate counts and categories for *text*.
+
+        Candidates from several texts (e.g. resume sections) can be summed
+        and passed to ``rank_candidates`` to rank them as one document.
+        """
+        candidates: Counter = Counter()
+        category_map: dict[str, str] = {}
+        if not text or not text.strip():
+            return candidates, category_map
+        for kw in self._cached_ranked(text):
+            candidates[kw["keyword"]] = kw["count"]
+            category_map[kw["keyword"]] = kw["category"]
+        return candidates, category_map
+
+    def rank_candidates(self, candidates: Counter, category_map: dict) -> List[dict]:
+        """Rank merged candidates exactly like ``extract_keywords`` does."""
+        return self._rank_and_format(candidates, category_map)[: self.max_keywords]
+
+    @property
+    def model_name(self) -> str:
+        """Identifier of the loaded pipeline, used to key cached results."""
+        if self.nlp is None:
+            return "fallback"
+        meta = self.nlp.meta
+        return f"{meta.get('lang', 'xx')}_{meta.get('name', 'unknown')}-{meta.get('version', '0')}"
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _cached_ranked(self, text: str) -> List[dict]:
+        """Return every ranked candidate for *text*, via the keyword cache."""
+        # Identical text (e.g. one JD scored against many resumes) is
+        # parsed once per process; see ``ats_checker.nlp.cache``.
+        text = normalize_text(text)
+        cache = get_keyword_cache()
+        key = make_key(text, self.model_name)
+        ranked = cache.get(key)
+        if ranked is None:
+            ranked = self._extract_ranked(text)
+            cache.set(key, ranked)
+        return ranked
+
+    def _extract_ranked(self, text: str) -> List[dict]:
+        """Run the full extraction and return every ranked candidate."""
         # If spaCy is not available, fall back to simple extraction
         if self.nlp is None:
             return self._fallback_extract(text)
 
-        doc = self.nlp(text)
+        return self._ranked_from_doc(run_profile(self.nlp, text, "keywords"))
 
+    def _ranked_from_doc(self, doc) -> List[dict]:
+        """Collect and rank keyword candidates from a parsed Doc."""
         # Collect candidate keywords from three sources
         candidates: Counter = Counter()
         category_map: dict[str, str] = {}
@@ -165,13 +225,7 @@ class SpaCyKeywordExtractor:
         # 3. Individual tokens that are known skills
         self._collect_known_skill_tokens(doc, candidates, category_map)
 
-        # Build the result list
-        results = self._rank_and_format(candidates, category_map)
-        return results[: self.max_keywords]
-
-    # ------------------------------------------------------------------
-    # Internal helpers
-    # ------------------------------------------------------------------
+        return self._rank_and_format(candidates, category_map)
 
     def _collect_entities(
         self, doc, candidates: Counter, category_map: dict
@@ -225,16 +279,14 @@ class SpaCyKeywordExtractor:
     def _collect_known_skill_tokens(
         self, doc, candidates: Counter, category_map: dict
     ) -> None:
-        """Check individual tokens against the skills database."""
-        for token in doc:
-            if token.is_stop or token.is_punct or token.is_space:
+        """Count skills-database mentions found by the Aho–Corasick matcher."""
+        stop_words = self.nlp.Defaults.stop_words
+        for _, _, term in get_skill_matcher().find_all(doc.text):
+            if len(term) <= _MIN_KEYWORD_LENGTH or term in stop_words:
                 continue
-            word = token.text.lower().strip()
-            if len(word) <= _MIN_KEYWORD_LENGTH:
-                continue
-            if is_known_skill(word):
-                candidates[word] += 1
-                category_map.setdefault(word, get_skill_category(word) or "technical")
+            if is_known_skill(term):
+                candidates[term] += 1
+                category_map.setdefault(term, get_skill_category(term) or "technical")
 
     def _rank_and_format(
         self, candidates: Counter, category_map: dict
@@ -293,7 +345,7 @@ class SpaCyKeywordExtractor:
             else:
                 category_map.setdefault(word, "general")
 
-        return self._rank_and_format(counter, category_map)[: self.max_keywords]
+        return self._rank_and_format(counter, category_map)
 
     # ------------------------------------------------------------------
     # Utilities
@@ -0,0 +1,86 @@
+"""
+Batched keyword-relatedness matching.
+
+``SynonymExpander.are_related`` compares one pair of words at a time, so
+checking every job keyword against every resume keyword re-stems and
+re-fetches WordNet synsets J x R times.  ``KeywordMatcher`` precomputes,
+once per analysis, the exact-word set, the Porter stem set, the union of
+WordNet synset ids and the synonym-group ids of the resume keywords.  Each
+job keyword is then resolved with a handful of set lookups.
+
+The result is identical to::
+
+    any(expander.are_related(keyword, r) for r in resume_keywords)
+
+Usage::
+
+    matcher = KeywordMatcher(kw["keyword"] for kw in resume_keywords)
+    if matcher.matches("engineer"):
+        ...
+"""
+
+from typing import FrozenSet, Iterable, Optional, Set
+
+from .synonym_expander import SynonymExpander
+from .synonym_index import get_synonym_index
+
+
+class KeywordMatcher:
+    """
+    Answer "is *keyword* related to any of these words?" in O(1) per keyword.
+
+    Args:
+        words:    The fixed side of the comparison (usually resume keywords).
+        expander: ``SynonymExpander`` supplying stems and synset ids.
+    """
+
+    def __init__(self, words: Iterable[str], expander: Optional[SynonymExpander] = None):
+        self.expander = expander or SynonymExpander()
+        self.index = get_synonym_index()
+
+        self.words: FrozenSet[str] = frozenset(
+            w.strip().lower() for w in words if w and w.strip()
+        )
+
+        stems: Set[str] = set()
+        synsets: Set[str] = set()
+        groups: Set[int] = set()
+        for word in self.words:
+            stem = self.expander.stem(word)
+            if stem is not None:
+                stems.add(stem)
+            synsets.update(self.expander.synset_ids(word))
+            group_id = self.index.group_id(word)
+            if group_id is not None:
+                groups.add(group_id)
+
+        self.stems: FrozenSet[str] = frozenset(stems)
+        self.synsets: FrozenSet[str] = frozenset(synsets)
+        self.groups: FrozenSet[int] = frozenset(groups)
+
+    def matches(self, keyword: str) -> bool:
+        """Return True if *keyword* is related to any of the indexed words."""
+        word = keyword.strip().lower()
+        if not self.words:
+            return False
+
+        if word in self.words:
+            return True
+
+        # Stem check
+        if self.stems:
+            stem = self.expander.stem(word)
+            if stem is not None and stem in self.stems:
+                return True
+
+        # WordNet synset overlap
+        if self.synsets and not self.synsets.isdisjoint(self.expander.synset_ids(word)):
+            return True
+
+        # Database synonym check
+        if self.groups:
+            group_id = self.index.group_id(word)
+            if group_id is not None and group_id in self.groups:
+                return True
+
+        return False
@@ -0,0 +1,176 @@
+"""
+Disk cache of customized spaCy pipelines.
+
+Every pipeline the ATS checker uses gets a ``SKILL`` / ``SOFT_SKILL``
+entity ruler built from ``SKILLS_DB``.  Rather than rebuilding thousands of
+patterns in each process, the customized pipeline is written once with
+``nlp.to_disk`` and later processes ``spacy.load`` it directly.
+
+Cache directories live under ``NLP_MODEL_CACHE_DIR`` and are named::
+
+    <model name>-<model version>-<fingerprint>
+
+where the fingerprint hashes ``SKILLS_DB``, the ruler layout and the spaCy
+version, so editing the skills database (or upgrading spaCy or the model
+package) transparently triggers a rebuild.  Directories are written under a
+temporary name and renamed into place, so concurrent workers never load a
+half-written pipeline.
+
+Usage::
+
+    from ats_checker.nlp.model_cache import load_pipeline
+
+    nlp = load_pipeline("en_core_web_lg")  # raises OSError if not installed
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from functools import lru_cache
+from typing import List, Optional
+
+from .skills_db import SKILLS_DB
+
+logger = logging.getLogger(__name__)
+
+# Bump when the ruler's patterns or placement change
+RULER_VERSION = 1
+
+
+@lru_cache(maxsize=1)
+def skills_fingerprint() -> str:
+    """Return a short hash of everything that shapes the skill ruler."""
+    try:
+        import spacy
+
+        spacy_version = spacy.__version__
+    except ImportError:
+        # Still keys the regex fallback's cached keywords by SKILLS_DB
+        spacy_version = None
+
+    payload = json.dumps(
+        {
+            "skills": {category: sorted(skills) for category, skills in SKILLS_DB.items()},
+            "ruler": RULER_VERSION,
+            "spacy": spacy_version,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def build_skill_patterns() -> List[dict]:
+    """Return EntityRuler token patterns for every skill in ``SKILLS_DB``."""
+    patterns = []
+    for category, skills in SKILLS_DB.items():
+        # Soft skills are usually multi-word; still useful to tag them
+        label = "SOFT_SKILL" if category == "soft_skills" else "SKILL"
+        for skill in skills:
+            patterns.append(
+                {"label": label, "pattern": [{"LOWER": t.lower()} for t in skill.split()]}
+            )
+    return patterns
+
+
+def add_skill_ruler(nlp) -> None:
+    """
+    Add the skills EntityRuler to *nlp*, ahead of ``ner`` when there is one.
+
+    Pipelines without a statistical NER component (some language models)
+    get the ruler appended at the end.
+    """
+    if "entity_ruler" in nlp.pipe_names:
+        # Already customized (e.g. loaded from the cache)
+        return
+    if "ner" in nlp.pipe_names:
+        ruler = nlp.add_pipe("entity_ruler", before="ner")
+    else:
+        ruler = nlp.add_pipe("entity_ruler")
+    ruler.add_patterns(build_skill_patterns())
+
+
+def cache_dir() -> str:
+    """Return the configured cache root (``NLP_MODEL_CACHE_DIR``)."""
+    try:
+        from django.conf import settings
+
+        path = getattr(settings, "NLP_MODEL_CACHE_DIR", None)
+        if path:
+            return str(path)
+    except Exception:
+        pass
+    return os.path.join(os.path.dirname(__file__), "data", "models")
+
+
+def cached_pipeline_path(model_name: str) -> Optional[str]:
+    """
+    Return the cache directory for *model_name*, or None if the model
+    package is not installed.
+    """
+    import spacy
+
+    version = spacy.util.get_package_version(model_name)
+    if version is None:
+        return None
+    return os.path.join(cache_dir(), f"{model_name}-{version}-{skills_fingerprint()}")
+
+
+def load_pipeline(model_name: str):
+    """
+    Load *model_name* with the skill ruler, from the disk cache if possible.
+
+    Raises ``OSError`` when the model package is not installed, like
+    ``spacy.load``.
+    """
+    import spacy
+
+    path = cached_pipeline_path(model_name)
+    if path is None:
+        raise OSError(f"spaCy model '{model_name}' is not installed")
+
+    if os.path.isdir(path):
+        try:
+            return spacy.load(path)
+        except Exception as exc:
+            logger.warning("Discarding unreadable cached pipeline %s: %s", path, exc)
+            shutil.rmtree(path, ignore_errors=True)
+
+    nlp = spacy.load(model_name)
+    add_skill_ruler(nlp)
+    try:
+        _write_pipeline(nlp, path)
+    except OSError as exc:
+        logger.warning("Could not cache pipeline %s at %s: %s", model_name, path, exc)
+    return nlp
+
+
+def _write_pipeline(nlp, path: str) -> None:
+    """Write *nlp* to *path* atomically and prune stale siblings."""
+    root = os.path.dirname(path)
+    os.makedirs(root, exist_ok=True)
+    tmp_path = tempfile.mkdtemp(prefix=".tmp-", dir=root)
+    try:
+        nlp.to_disk(tmp_path)
+        os.rename(tmp_path, path)
+    except OSError:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        if os.path.isdir(path):
+            # Another worker finished first
+            return
+        raise
+    logger.info("Cached customized spaCy pipeline at %s", path)
+
+    # Older builds of the same model (previous SKILLS_DB or model version)
+    model_name = os.path.basename(path).rsplit("-", 2)[0]
+    for entry in os.listdir(root):
+        stale = os.path.join(root, entry)
+        if (
+            stale != path
+            and entry.rsplit("-", 2)[0] == model_name
+            and entry.count("-") >= 2
+            and os.path.isdir(stale)
+        ):
+            shutil.rmtree(stale, ignore_errors=True)
@@ -17,6 +17,9 @@ import logging
 import re
 from typing import Dict, List, Optional, Tuple
 
+from .model_cache import load_pipeline
+from .pipeline_profiles import run_profile
+
 logger = logging.getLogger(__name__)
 
 # Cache loaded models
@@ -100,14 +103,15 @@ def load_model(lang: str):
     """
     Load and return the spaCy NLP model for the given language.
 
-    The model is cached after first load. Falls back to the
+    The model is cached after first load and carries the same skills
+    EntityRuler as the English pipeline. Falls back to the
     multi-language model if the language-specific model is unavailable.
     """
     if lang in _models:
         return _models[lang]
 
     try:
-        import spacy
+        import spacy  # noqa: F401
     except ImportError:
         logger.warning("spaCy is not installed.")
         return None
@@ -116,7 +120,7 @@ def load_model(lang: str):
 
     for model_name in model_names:
         try:
-            model = spacy.load(model_name)
+            model = load_pipeline(model_name)
             _models[lang] = model
             logger.info("Loaded spaCy model '%s' for language '%s'", model_name, lang)
             return model
@@ -127,7 +131,7 @@ def load_model(lang: str):
     if lang != 'xx':
         for model_name in LANGUAGE_MODELS['xx']:
             try:
-                model = spacy.load(model_name)
+                model = load_pipeline(model_name)
                 _models[lang] = model
                 logger.info("Loaded fallback model '%s' for language '%s'", model_name, lang)
                 return model
@@ -188,7 +192,7 @@ class MultiLangKeywordExtractor:
             extractor = SpaCyKeywordExtractor(max_keywords=self.max_keywords)
             return (lang, extractor.extract_keywords(text))
 
-        doc = nlp(text)
+        doc = run_profile(nlp, text, 'keywords')
         keywords = {}
 
         # Extract named entities
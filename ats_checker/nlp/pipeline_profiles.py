@@ -0,0 +1,76 @@
+"""
+Named spaCy pipeline profiles.
+
+Every call site shares the one pipeline loaded by ``_load_spacy_model``
+but needs only part of it:
+
+- ``keywords``   -- NER, the skills ``entity_ruler`` and ``doc.noun_chunks``
+                    (which needs the tagger and the dependency parser).
+- ``parser``     -- dependency labels and sentences, for passive-voice
+                    detection.
+- ``similarity`` -- ``Doc.similarity`` averages static word vectors, so no
+                    trained component has to run (``tok2vec`` is kept only
+                    for vector-less models, whose similarity uses the
+                    tensor).
+
+The remaining components are disabled *per call* through the ``disable``
+argument of ``nlp()`` / ``nlp.pipe()``.  Unlike ``nlp.select_pipes`` this
+does not mutate the shared pipeline, so it is safe across threads, and
+weights are never reloaded.
+
+Usage::
+
+    from ats_checker.nlp.pipeline_profiles import run_profile
+
+    doc = run_profile(nlp, text, "parser")
+"""
+
+import threading
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+# Components each profile needs; anything else in the pipeline is disabled
+PROFILES: Dict[str, frozenset] = {
+    # POS tags come from "tagger" + "attribute_ruler" in English models
+    # and from "morphologizer" in most others
+    "keywords": frozenset({
+        "tok2vec", "tagger", "morphologizer", "attribute_ruler", "parser", "entity_ruler", "ner",
+    }),
+    "parser": frozenset({
+        "tok2vec", "tagger", "morphologizer", "attribute_ruler", "parser", "senter", "sentencizer",
+    }),
+    "similarity": frozenset(),
+    "full": None,
+}
+
+_disabled_cache: Dict[Tuple[int, str], List[str]] = {}
+_lock = threading.Lock()
+
+
+def disabled_components(nlp, profile: str) -> List[str]:
+    """Return the pipe names of *nlp* that *profile* does not need."""
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown pipeline profile: {profile!r}")
+
+    key = (id(nlp), profile)
+    disabled = _disabled_cache.get(key)
+    if disabled is None:
+        keep = PROFILES[profile]
+        if keep is None:
+            disabled = []
+        else:
+            if profile == "similarity" and not nlp.vocab.vectors.size:
+                keep = keep | {"tok2vec"}
+            disabled = [name for name in nlp.pipe_names if name not in keep]
+        with _lock:
+            _disabled_cache[key] = disabled
+    return disabled
+
+
+def run_profile(nlp, text: str, profile: str):
+    """Process *text* with only the components *profile* needs."""
+    return nlp(text, disable=disabled_components(nlp, profile))
+
+
+def pipe_profile(nlp, texts: Iterable[str], profile: str, **kwargs) -> Iterator:
+    """``nlp.pipe`` counterpart of ``run_profile``; kwargs go to ``nlp.pipe``."""
+    return nlp.pipe(texts, disable=disabled_components(nlp, profile), **kwargs)
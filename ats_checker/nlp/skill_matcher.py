@@ -0,0 +1,143 @@
+"""
+Single-pass skill mention matcher (Aho–Corasick).
+
+Finds every known skill -- including multi-word ones such as "spring boot"
+and symbol-bearing ones such as "c++", "c#", "ci/cd" and "node.js" -- in
+one linear scan of the text, instead of one regex (or one dictionary
+probe) per skill.
+
+A mention only counts when it is not glued to a neighbouring word
+character, so "java" does not match inside "javascript" and ".net" does
+not match inside "asp.net".  Unlike ``\\b`` this also works for terms that
+start or end with a symbol ("c++").  Overlapping mentions resolve to the
+leftmost, then longest, term: "c++" wins over "c", "react.js" over "react".
+
+Usage::
+
+    from ats_checker.nlp.skill_matcher import get_skill_matcher
+
+    for start, end, term in get_skill_matcher().find_all(text):
+        ...
+"""
+
+import re
+import threading
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .skills_db import SKILL_DISPLAY_NAMES, SKILLS_DB
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+def canonicalize(text: str) -> str:
+    """Lowercase *text* and collapse whitespace runs to single spaces."""
+    return _WHITESPACE_RE.sub(" ", text.lower())
+
+
+class SkillMatcher:
+    """
+    Aho–Corasick automaton over a fixed set of lowercase terms.
+
+    Args:
+        terms: The terms to match.  They are canonicalized the same way as
+               the scanned text, so matching is case-insensitive and
+               tolerant of whitespace differences.
+    """
+
+    def __init__(self, terms: Iterable[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # Terms ending at each node, own term first, then via fail links
+        self._out: List[Tuple[str, ...]] = [()]
+        self.terms = frozenset(t for t in (canonicalize(t).strip() for t in terms) if t)
+
+        for term in self.terms:
+            node = 0
+            for ch in term:
+                nxt = self._goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                node = nxt
+            self._out[node] = (term,)
+
+        # Breadth-first construction of failure links
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(ch, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def find_all(self, text: str) -> List[Tuple[int, int, str]]:
+        """
+        Return non-overlapping ``(start, end, term)`` mentions in *text*.
+
+        Offsets refer to ``canonicalize(text)``.
+        """
+        text = canonicalize(text)
+        goto, fail, out = self._goto, self._fail, self._out
+        length = len(text)
+
+        hits: List[Tuple[int, int, str]] = []
+        node = 0
+        for index, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if not out[node]:
+                continue
+            end = index + 1
+            if end < length and _is_word_char(text[end]):
+                continue
+            for term in out[node]:
+                start = end - len(term)
+                if start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                hits.append((start, end, term))
+
+        # Leftmost-longest, non-overlapping
+        hits.sort(key=lambda hit: (hit[0], hit[0] - hit[1]))
+        mentions: List[Tuple[int, int, str]] = []
+        last_end = 0
+        for start, end, term in hits:
+            if start >= last_end:
+                mentions.append((start, end, term))
+                last_end = end
+        return mentions
+
+    def find_terms(self, text: str) -> List[str]:
+        """Return the distinct terms mentioned in *text*, in order of appearance."""
+        return list(dict.fromkeys(term for _, _, term in self.find_all(text)))
+
+
+# ---------------------------------------------------------------------------
+# Process-wide instance
+# ---------------------------------------------------------------------------
+
+_skill_matcher: Optional[SkillMatcher] = None
+_lock = threading.Lock()
+
+
+def get_skill_matcher() -> SkillMatcher:
+    """Return the matcher over ``SKILLS_DB`` and ``SKILL_DISPLAY_NAMES``."""
+    global _skill_matcher
+    if _skill_matcher is None:
+        with _lock:
+            if _skill_matcher is None:
+                terms = [skill for skills in SKILLS_DB.values() for skill in skills]
+                terms.extend(SKILL_DISPLAY_NAMES)
+                _skill_matcher = SkillMatcher(terms)
+    return _skill_matcher
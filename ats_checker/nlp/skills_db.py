@@ -122,6 +122,32 @@ SKILLS_DB: dict[str, list[str]] = {
     ],
 }
 
+# Canonical capitalization of the skills reported by the job description
+# parser (``skills_mentioned``).  Matched together with ``SKILLS_DB`` by
+# ``ats_checker.nlp.skill_matcher``.
+SKILL_DISPLAY_NAMES: list[str] = [
+    "Python", "JavaScript", "TypeScript", "Java", "C++", "C#", "Go", "Rust",
+    "Ruby", "PHP", "Swift", "Kotlin", "Scala", "R", "MATLAB",
+    "React", "React.js", "Angular", "Vue", "Vue.js", "Next.js", "Nuxt",
+    "Node.js", "Express", "Django", "Flask", "FastAPI", "Spring Boot",
+    "Rails", "Laravel", "ASP.NET",
+    "AWS", "Azure", "GCP", "Docker", "Kubernetes", "Terraform",
+    "PostgreSQL", "MySQL", "MongoDB", "Redis", "Elasticsearch",
+    "Git", "Jenkins", "CI/CD", "GitHub Actions",
+    "REST", "GraphQL", "gRPC", "WebSocket",
+    "HTML", "CSS", "SASS", "LESS", "Tailwind",
+    "Redux", "Flux", "Webpack", "Vite", "Babel",
+    "Jest", "Mocha", "Cypress", "Selenium", "Pytest",
+    "Machine Learning", "Deep Learning", "NLP", "Computer Vision",
+    "TensorFlow", "PyTorch", "scikit-learn", "Pandas", "NumPy",
+    "SQL", "NoSQL", "ETL", "Data Pipeline",
+    "Agile", "Scrum", "Kanban", "JIRA",
+    "Linux", "Unix", "Shell Scripting", "Bash",
+    "Microservices", "Serverless", "Event-Driven",
+    "OAuth", "JWT", "SSO", "LDAP",
+    "Figma", "Sketch", "Adobe XD",
+]
+
 # Build a reverse-lookup index: lowercase skill -> category
 _SKILL_TO_CATEGORY: dict[str, str] = {}
 for _category, _skills in SKILLS_DB.items():
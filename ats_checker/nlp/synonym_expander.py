@@ -7,11 +7,19 @@ Provides two main capabilities:
 2. Checking whether two words are related (via shared stems or synsets).
 
 Domain-specific synonyms stored in the ``JobTitleSynonym`` model are used
-as a fallback when WordNet coverage is insufficient.
+as a fallback when WordNet coverage is insufficient.  They are read through
+the compiled in-memory ``SynonymIndex`` so lookups issue no queries.
+
+WordNet data is read from the precompiled ``WordNetLookup`` file when one
+has been built (``manage.py build_wordnet_lookup``); otherwise the NLTK
+corpus reader is used.
 """
 
 import logging
-from typing import List, Set
+from typing import FrozenSet, List, Optional, Set
+
+from .synonym_index import get_synonym_index
+from .wordnet_lookup import get_wordnet_lookup
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +33,8 @@ _stemmer = None
 def _ensure_nltk():
     """
     Download required NLTK data packages (once per process) and initialize
-    the Porter stemmer.
+    the Porter stemmer.  The WordNet corpus is skipped when a precompiled
+    lookup file is available.
     """
     global _nltk_ready, _stemmer
     if _nltk_ready:
@@ -35,8 +44,9 @@ def _ensure_nltk():
         import nltk
         from nltk.stem import PorterStemmer
 
-        nltk.download("wordnet", quiet=True)
-        nltk.download("omw-1.4", quiet=True)
+        if get_wordnet_lookup() is None:
+            nltk.download("wordnet", quiet=True)
+            nltk.download("omw-1.4", quiet=True)
 
         _stemmer = PorterStemmer()
         _nltk_ready = True
@@ -142,6 +152,12 @@ class SynonymExpander:
     @staticmethod
     def _wordnet_synonyms(keyword: str) -> Set[str]:
         """Retrieve lemma names from WordNet synsets for *keyword*."""
+        lookup = get_wordnet_lookup()
+        if lookup is not None:
+            names = {name.replace("_", " ").lower() for name in lookup.lemma_names(keyword)}
+            names.discard(keyword)
+            return names
+
         if not _ensure_nltk():
             return set()
 
@@ -161,32 +177,45 @@ class SynonymExpander:
             return set()
 
     @staticmethod
-    def _synsets_overlap(word1: str, word2: str) -> bool:
-        """Return True if *word1* and *word2* share a WordNet synset."""
+    def synset_ids(word: str) -> FrozenSet[str]:
+        """Return the names of every WordNet synset containing *word*."""
+        lookup = get_wordnet_lookup()
+        if lookup is not None:
+            return lookup.synset_ids(word)
+
         if not _ensure_nltk():
-            return False
+            return frozenset()
 
         try:
             from nltk.corpus import wordnet
 
-            synsets1 = set(wordnet.synsets(word1))
-            synsets2 = set(wordnet.synsets(word2))
-            return bool(synsets1 & synsets2)
+            return frozenset(synset.name() for synset in wordnet.synsets(word))
 
         except Exception:
-            return False
+            return frozenset()
+
+    @classmethod
+    def _synsets_overlap(cls, word1: str, word2: str) -> bool:
+        """Return True if *word1* and *word2* share a WordNet synset."""
+        return bool(cls.synset_ids(word1) & cls.synset_ids(word2))
 
     # ------------------------------------------------------------------
     # Stemmer helpers
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _stems_match(word1: str, word2: str) -> bool:
-        """Return True if both words reduce to the same Porter stem."""
+    def stem(word: str) -> Optional[str]:
+        """Return the Porter stem of *word*, or None if NLTK is missing."""
         stemmer = _get_stemmer()
         if stemmer is None:
-            return False
-        return stemmer.stem(word1) == stemmer.stem(word2)
+            return None
+        return stemmer.stem(word)
+
+    @classmethod
+    def _stems_match(cls, word1: str, word2: str) -> bool:
+        """Return True if both words reduce to the same Porter stem."""
+        stem1 = cls.stem(word1)
+        return stem1 is not None and stem1 == cls.stem(word2)
 
     # ------------------------------------------------------------------
     # Database (JobTitleSynonym) helpers
@@ -197,35 +226,10 @@ class SynonymExpander:
         """
         Look up domain-specific synonyms from the ``JobTitleSynonym`` model.
 
-        Returns an empty set if the model is unavailable (e.g. database not
-        migrated yet).
+        Returns every other term in *keyword*'s synonym group, or an empty
+        set if the keyword is unknown (or the table is unavailable).
         """
-        try:
-            from ats_checker.models import JobTitleSynonym
-
-            synonyms: Set[str] = set()
-
-            # Check if the keyword itself is a stored title
-            try:
-                entry = JobTitleSynonym.objects.get(title__iexact=keyword)
-                for syn in entry.synonyms:
-                    synonyms.add(str(syn).lower())
-            except JobTitleSynonym.DoesNotExist:
-                pass
-
-            # Also check if the keyword appears as a synonym of another title
-            entries = JobTitleSynonym.objects.all()
-            for entry in entries:
-                syn_list = [str(s).lower() for s in entry.synonyms]
-                if keyword in syn_list:
-                    synonyms.add(entry.title.lower())
-                    synonyms.update(syn_list)
-
-            return synonyms
-
-        except Exception as exc:
-            logger.debug("Database synonym lookup failed: %s", exc)
-            return set()
+        return get_synonym_index().synonyms(keyword)
 
     @staticmethod
     def _db_related(word1: str, word2: str) -> bool:
@@ -233,34 +237,4 @@ class SynonymExpander:
         Return True if *word1* and *word2* are linked through the
         ``JobTitleSynonym`` model.
         """
-        try:
-            from ats_checker.models import JobTitleSynonym
-
-            # Check word1 as title, word2 in synonyms
-            try:
-                entry = JobTitleSynonym.objects.get(title__iexact=word1)
-                if word2 in [str(s).lower() for s in entry.synonyms]:
-                    return True
-            except JobTitleSynonym.DoesNotExist:
-                pass
-
-            # Check word2 as title, word1 in synonyms
-            try:
-                entry = JobTitleSynonym.objects.get(title__iexact=word2)
-                if word1 in [str(s).lower() for s in entry.synonyms]:
-                    return True
-            except JobTitleSynonym.DoesNotExist:
-                pass
-
-            # Check if both appear in the same synonym group
-            for entry in JobTitleSynonym.objects.all():
-                group = {entry.title.lower()} | {
-                    str(s).lower() for s in entry.synonyms
-                }
-                if word1 in group and word2 in group:
-                    return True
-
-            return False
-
-        except Exception:
-            return False
+        return get_synonym_index().related(word1, word2)
@@ -0,0 +1,159 @@
+"""
+In-memory index of the domain-specific ``JobTitleSynonym`` table.
+
+The table is read once and compiled into synonym groups with a union-find:
+every stored title is merged with each of its synonyms, so terms that are
+linked through any chain of rows end up in the same group.  Lookups are
+then plain dictionary accesses with zero database queries.
+
+The index is rebuilt lazily after ``invalidate_synonym_index`` runs (wired
+to commits that save or delete a ``JobTitleSynonym``).  Other processes
+notice the change through a version counter kept in the Django cache,
+checked at most once every ``_VERSION_CHECK_INTERVAL`` seconds.
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, FrozenSet, Iterable, Optional, Sequence, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+_VERSION_KEY = "nlp:synonym_index:version"
+_VERSION_CHECK_INTERVAL = 30  # seconds
+
+
+class SynonymIndex:
+    """
+    Compiled synonym groups.
+
+    Args:
+        rows: Iterable of ``(title, synonyms)`` pairs, as stored in
+              ``JobTitleSynonym``.
+    """
+
+    def __init__(self, rows: Iterable[Tuple[str, Sequence]]):
+        parent: Dict[str, str] = {}
+
+        def find(term: str) -> str:
+            root = term
+            while parent[root] != root:
+                root = parent[root]
+            # Path compression
+            while parent[term] != root:
+                parent[term], term = root, parent[term]
+            return root
+
+        for title, synonyms in rows:
+            terms = [str(title).strip().lower()]
+            terms.extend(str(s).strip().lower() for s in (synonyms or []))
+            terms = [t for t in terms if t]
+            if not terms:
+                continue
+            for term in terms:
+                parent.setdefault(term, term)
+            root = find(terms[0])
+            for term in terms[1:]:
+                other = find(term)
+                if other != root:
+                    parent[other] = root
+
+        roots: Dict[str, int] = {}
+        members: Dict[int, Set[str]] = {}
+        self._group_of: Dict[str, int] = {}
+        for term in parent:
+            group_id = roots.setdefault(find(term), len(roots))
+            self._group_of[term] = group_id
+            members.setdefault(group_id, set()).add(term)
+
+        self._members: Dict[int, FrozenSet[str]] = {
+            gid: frozenset(terms) for gid, terms in members.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self._group_of)
+
+    def group_id(self, term: str) -> Optional[int]:
+        """Return the synonym-group id of *term*, or None if it is unknown."""
+        return self._group_of.get(term.strip().lower())
+
+    def synonyms(self, term: str) -> Set[str]:
+        """Return every other member of *term*'s synonym group."""
+        group_id = self.group_id(term)
+        if group_id is None:
+            return set()
+        return set(self._members[group_id] - {term.strip().lower()})
+
+    def related(self, word1: str, word2: str) -> bool:
+        """Return True if both words belong to the same synonym group."""
+        group_id = self.group_id(word1)
+        return group_id is not None and group_id == self.group_id(word2)
+
+
+# ---------------------------------------------------------------------------
+# Process-wide instance
+# ---------------------------------------------------------------------------
+
+_index: Optional[SynonymIndex] = None
+_index_version = None
+_checked_at = 0.0
+_lock = threading.Lock()
+
+
+def _shared_version():
+    try:
+        from django.core.cache import cache
+
+        return cache.get(_VERSION_KEY, 0)
+    except Exception:
+        return 0
+
+
+def _build_index() -> Optional[SynonymIndex]:
+    try:
+        from ats_checker.models import JobTitleSynonym
+
+        rows = list(JobTitleSynonym.objects.values_list("title", "synonyms"))
+    except Exception as exc:
+        # e.g. database not migrated yet
+        logger.debug("Could not load JobTitleSynonym rows: %s", exc)
+        return None
+    index = SynonymIndex(rows)
+    logger.info("Built synonym index: %d terms from %d titles", len(index), len(rows))
+    return index
+
+
+def get_synonym_index() -> SynonymIndex:
+    """Return the compiled synonym index, rebuilding it when stale."""
+    global _index, _index_version, _checked_at
+
+    now = time.monotonic()
+    index = _index
+    if index is not None and now - _checked_at < _VERSION_CHECK_INTERVAL:
+        return index
+
+    with _lock:
+        version = _shared_version()
+        if _index is None or version != _index_version:
+            built = _build_index()
+            if built is None:
+                # Serve an empty index until the next check; no version
+                # matches None, so that check tries the database again
+                built, version = SynonymIndex(()), None
+            _index, _index_version = built, version
+        _checked_at = now
+        return _index
+
+
+def invalidate_synonym_index() -> None:
+    """Drop the local index and tell other processes to rebuild theirs."""
+    global _index
+    with _lock:
+        _index = None
+    try:
+        from django.core.cache import cache
+
+        cache.add(_VERSION_KEY, 0, None)
+        cache.incr(_VERSION_KEY)
+    except Exception as exc:
+        logger.debug("Could not bump synonym index version: %s", exc)
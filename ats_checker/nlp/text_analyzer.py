@@ -10,8 +10,9 @@ the ``Resume`` model) or plain text as appropriate.
 import logging
 import re
 from collections import Counter
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Tuple
 
+from .pipeline_profiles import run_profile
 from .skills_db import get_skill_category, is_known_skill
 
 logger = logging.getLogger(__name__)
@@ -218,53 +219,74 @@ class TextAnalyzer:
         deductions = 0
 
         for section_name, section_data in resume_content.items():
-            section_text = self._section_to_text(section_data)
-            section_lower = section_name.lower()
+            section_deductions, section_issues = self.analyze_section_formatting(
+                section_name, section_data
+            )
+            deductions += section_deductions
+            issues.extend(section_issues)
 
-            # -- Content length --
-            length = len(section_text)
-            if length < _SECTION_LENGTH_MIN:
-                issues.append(
-                    f"Section '{section_name}' is very short ({length} chars). "
-                    "Consider adding more detail."
-                )
-                deductions += 5
-            elif length > _SECTION_LENGTH_MAX:
+        # Calculate score
+        score = max(0, 100 - deductions)
+
+        return {"score": score, "issues": issues}
+
+    def analyze_section_formatting(
+        self, section_name: str, section_data: Any
+    ) -> Tuple[int, list[str]]:
+        """
+        Run the ``analyze_formatting`` checks on a single section.
+
+        Returns:
+            ``(deductions, issues)`` -- the points this section subtracts
+            from the formatting score and its issue descriptions.
+        """
+        issues: list[str] = []
+        deductions = 0
+
+        section_text = self._section_to_text(section_data)
+        section_lower = section_name.lower()
+
+        # -- Content length --
+        length = len(section_text)
+        if length < _SECTION_LENGTH_MIN:
+            issues.append(
+                f"Section '{section_name}' is very short ({length} chars). "
+                "Consider adding more detail."
+            )
+            deductions += 5
+        elif length > _SECTION_LENGTH_MAX:
+            issues.append(
+                f"Section '{section_name}' is very long ({length} chars). "
+                "Consider being more concise."
+            )
+            deductions += 3
+
+        # -- Bullet point usage (experience / projects) --
+        if section_lower in ("experience", "projects"):
+            bullet_lines = [
+                line
+                for line in section_text.splitlines()
+                if line.strip().startswith(("-", "*", "\u2022"))
+            ]
+            total_lines = [
+                line for line in section_text.splitlines() if line.strip()
+            ]
+            if total_lines and not bullet_lines:
                 issues.append(
-                    f"Section '{section_name}' is very long ({length} chars). "
-                    "Consider being more concise."
+                    f"Section '{section_name}' does not use bullet points. "
+                    "Bullet points improve readability for ATS systems."
                 )
-                deductions += 3
-
-            # -- Bullet point usage (experience / projects) --
-            if section_lower in ("experience", "projects"):
-                bullet_lines = [
-                    line
-                    for line in section_text.splitlines()
-                    if line.strip().startswith(("-", "*", "\u2022"))
-                ]
-                total_lines = [
-                    line for line in section_text.splitlines() if line.strip()
-                ]
-                if total_lines and not bullet_lines:
-                    issues.append(
-                        f"Section '{section_name}' does not use bullet points. "
-                        "Bullet points improve readability for ATS systems."
-                    )
-                    deductions += 10
-
-            # -- Action verbs at start of experience entries --
-            if section_lower == "experience":
-                self._check_action_verbs(section_text, issues)
+                deductions += 10
 
-            # -- Date consistency --
-            if section_lower in ("experience", "education"):
-                self._check_date_consistency(section_text, section_name, issues)
+        # -- Action verbs at start of experience entries --
+        if section_lower == "experience":
+            self._check_action_verbs(section_text, issues)
 
-        # Calculate score
-        score = max(0, 100 - deductions)
+        # -- Date consistency --
+        if section_lower in ("experience", "education"):
+            self._check_date_consistency(section_text, section_name, issues)
 
-        return {"score": score, "issues": issues}
+        return deductions, issues
 
     def _check_action_verbs(self, text: str, issues: list[str]) -> None:
         """Check whether experience bullet points start with action verbs."""
@@ -441,7 +463,7 @@ class TextAnalyzer:
         if self.nlp is None:
             return results
 
-        doc = self.nlp(text)
+        doc = run_profile(self.nlp, text, "parser")
 
         for sent in doc.sents:
             has_passive = False
@@ -0,0 +1,165 @@
+"""
+Pre-fork warmup of the NLP stack.
+
+Loading spaCy (several hundred MB for ``en_core_web_lg``), the WordNet data
+and the skill patterns lazily means every gunicorn / Celery worker pays a
+multi-second penalty on its first request and holds a private copy of the
+model.  ``warmup()`` loads everything once in the master process, before
+workers are forked, so the pages are shared copy-on-write:
+
+- gunicorn: ``preload_app = True`` and ``when_ready`` in ``gunicorn.conf.py``
+- Celery:   the ``worker_init`` signal in ``resumeit/celery.py``
+
+``gc.freeze()`` then moves the loaded objects to the permanent generation;
+otherwise the first garbage collection in each child writes to every
+object header and un-shares the pages.
+
+Per-process state (database connections, the DB-backed synonym index) is
+not touched before the fork; ``after_fork()`` runs in each child.
+
+``nlp_status()`` backs the ``/api/v1/health/nlp/`` readiness probe.
+"""
+
+import gc
+import logging
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+_status: Dict[str, object] = {
+    "ready": False,
+    "load_seconds": None,
+    "spacy_model": None,
+    "components": {},
+    "warmed_in_pid": None,
+}
+_lock = threading.Lock()
+
+
+def warmup(freeze: bool = True) -> Dict[str, object]:
+    """
+    Load the spaCy model, skill matcher, WordNet data and stemmer.
+
+    Safe to call more than once; later calls return the recorded status.
+    Django must already be set up.
+    """
+    with _lock:
+        if _status["ready"]:
+            return dict(_status)
+
+        start = time.perf_counter()
+        components: Dict[str, float] = {}
+
+        def timed(name, loader):
+            step = time.perf_counter()
+            try:
+                loader()
+            except Exception as exc:
+                logger.warning("NLP warmup: failed to load %s: %s", name, exc)
+                return
+            components[name] = round(time.perf_counter() - step, 3)
+
+        from . import keyword_extractor, skill_matcher, synonym_expander, wordnet_lookup
+
+        timed("spacy", keyword_extractor._load_spacy_model)
+        timed("skill_matcher", skill_matcher.get_skill_matcher)
+        timed("wordnet_lookup", wordnet_lookup.get_wordnet_lookup)
+        timed("stemmer", synonym_expander._get_stemmer)
+        if wordnet_lookup.get_wordnet_lookup() is None:
+            timed("wordnet_corpus", _load_nltk_wordnet)
+        # Module-level extractor / analyzer instances used by the views
+        timed("ats_services", _import_services)
+
+        nlp = keyword_extractor._load_spacy_model()
+        _status.update(
+            ready=True,
+            load_seconds=round(time.perf_counter() - start, 3),
+            spacy_model=nlp.meta.get("name") if nlp is not None else None,
+            components=components,
+            warmed_in_pid=os.getpid(),
+        )
+
+        # Children must open their own database connections
+        from django.db import connections
+
+        connections.close_all()
+
+        if freeze:
+            gc.collect()
+            gc.freeze()
+
+        logger.info(
+            "NLP warmup finished in %.2fs (model=%s, pid=%s)",
+            _status["load_seconds"], _status["spacy_model"], os.getpid(),
+        )
+        return dict(_status)
+
+
+def after_fork() -> None:
+    """
+    Build the per-process state in a freshly forked worker.
+
+    The synonym index is read from the database and invalidated per
+    process, so it is built here rather than inherited from the master.
+    """
+    from .synonym_index import get_synonym_index
+
+    try:
+        get_synonym_index()
+    except Exception:
+        logger.exception("NLP warmup: failed to build the synonym index")
+
+
+def nlp_status() -> Dict[str, object]:
+    """Return the warmup status plus the current process's memory use."""
+    status = dict(_status)
+    status["pid"] = os.getpid()
+    status.update(_memory_usage())
+    return status
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _load_nltk_wordnet():
+    from nltk.corpus import wordnet
+
+    wordnet.ensure_loaded()
+
+
+def _import_services():
+    import ats_checker.services  # noqa: F401
+
+
+def _memory_usage() -> Dict[str, Optional[float]]:
+    """
+    Return resident and shared memory in MB.
+
+    ``shared_mb`` (Linux only) is the part of RSS shared with other
+    processes -- for a forked worker, mostly the preloaded model.
+    """
+    usage: Dict[str, Optional[float]] = {"rss_mb": None, "shared_mb": None}
+    try:
+        with open("/proc/self/smaps_rollup") as fp:
+            fields = {}
+            for line in fp:
+                parts = line.split()
+                if len(parts) >= 2 and parts[1].isdigit():
+                    fields[parts[0].rstrip(":")] = int(parts[1])
+        usage["rss_mb"] = round(fields.get("Rss", 0) / 1024, 1)
+        usage["shared_mb"] = round(
+            (fields.get("Shared_Clean", 0) + fields.get("Shared_Dirty", 0)) / 1024, 1
+        )
+    except OSError:
+        import resource
+
+        # Peak RSS: kilobytes on Linux, bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        divisor = 1024 * 1024 if os.uname().sysname == "Darwin" else 1024
+        usage["rss_mb"] = round(peak / divisor, 1)
+    return usage
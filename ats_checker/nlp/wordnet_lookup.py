@@ -0,0 +1,264 @@
+"""
+Precompiled, memory-mapped WordNet lookup table.
+
+``nltk.corpus.wordnet`` parses the whole WordNet index into Python objects
+the first time it is used, which is slow and costs every worker process a
+large amount of memory.  The synonym expander only needs two facts about a
+word -- the ids of the synsets containing it and the lemma names of those
+synsets -- so ``build_lookup_file`` (run via ``manage.py
+build_wordnet_lookup``) writes them to a sorted, tab-separated file that is
+``mmap``-ed read-only and binary-searched, so pages are shared between
+workers and loaded on demand.
+
+File layout (UTF-8, one record per line, sorted by word)::
+
+    # {"format": 1, "wordnet": "3.0", "substitutions": {...}}
+    <word>\\t<n synsets>\\t<n lemmas>\\t<v synsets>\\t<v lemmas>\\t...\\t<n exc>\\t...
+
+Each part-of-speech column holds space-separated names.  Inflected forms
+are resolved at lookup time with the same exception lists and suffix
+substitutions as ``WordNetCorpusReader._morphy``, applied once.  Older NLTK
+releases keep applying the substitutions while no form matches, so results
+approximate ``wordnet.synsets(word)`` and can miss a few multiply
+inflected forms those releases resolve.
+"""
+
+import json
+import logging
+import mmap
+import os
+import threading
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+
+# Same order as nltk.corpus.reader.wordnet.POS_LIST
+POS_LIST = ("n", "v", "a", "r")
+
+# Memoized (synset ids, lemma names) results per reader
+_MEMO_SIZE = 8192
+
+_HEADER_PREFIX = b"# "
+
+
+class WordNetLookup:
+    """
+    Read-only view over a lookup file built by ``build_lookup_file``.
+
+    Args:
+        path:      Path of the lookup file.
+        memo_size: Maximum number of resolved words kept in memory.
+    """
+
+    def __init__(self, path: str, memo_size: int = _MEMO_SIZE):
+        self.path = path
+        with open(path, "rb") as fp:
+            self._mm = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+        header_end = self._mm.find(b"\n")
+        header = self._mm[:header_end] if header_end != -1 else b""
+        if not header.startswith(_HEADER_PREFIX):
+            raise ValueError(f"{path} is not a WordNet lookup file")
+        meta = json.loads(header[len(_HEADER_PREFIX):])
+        if meta.get("format") != FORMAT_VERSION:
+            raise ValueError(
+                f"{path} has format {meta.get('format')}, expected {FORMAT_VERSION}"
+            )
+
+        self.wordnet_version: str = meta.get("wordnet", "")
+        self._substitutions: Dict[str, List[Tuple[str, str]]] = {
+            pos: [tuple(rule) for rule in rules]
+            for pos, rules in meta.get("substitutions", {}).items()
+        }
+        self._data_start = header_end + 1
+        self._resolve = lru_cache(maxsize=memo_size)(self._resolve_uncached)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def synset_ids(self, word: str) -> FrozenSet[str]:
+        """Return the names of the synsets containing *word* or its base forms."""
+        return self._resolve(word.lower())[0]
+
+    def lemma_names(self, word: str) -> FrozenSet[str]:
+        """Return the raw lemma names of those synsets (underscored)."""
+        return self._resolve(word.lower())[1]
+
+    def cache_info(self):
+        """Return ``functools.lru_cache`` statistics for the memo."""
+        return self._resolve.cache_info()
+
+    # ------------------------------------------------------------------
+    # Resolution (approximates WordNetCorpusReader.synsets / _morphy)
+    # ------------------------------------------------------------------
+
+    def _resolve_uncached(self, word: str) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+        synsets = set()
+        lemmas = set()
+        if not word:
+            return frozenset(), frozenset()
+
+        record = self._record(word)
+        for index, pos in enumerate(POS_LIST):
+            exceptions = record[len(POS_LIST) * 2 + index] if record else ""
+            if exceptions:
+                forms = exceptions.split()
+            else:
+                forms = [
+                    word[: -len(old)] + new
+                    for old, new in self._substitutions.get(pos, ())
+                    if word.endswith(old)
+                ]
+
+            seen = set()
+            for form in [word] + forms:
+                if form in seen:
+                    continue
+                seen.add(form)
+                form_record = record if form == word else self._record(form)
+                if not form_record or not form_record[index * 2]:
+                    continue
+                synsets.update(form_record[index * 2].split())
+                lemmas.update(form_record[index * 2 + 1].split())
+
+        return frozenset(synsets), frozenset(lemmas)
+
+    def _record(self, word: str) -> Optional[List[str]]:
+        """Binary-search the file for *word* and return its columns."""
+        target = word.encode("utf-8")
+        mm = self._mm
+        lo, hi = self._data_start, len(mm)
+
+        while lo < hi:
+            mid = (lo + hi) // 2
+            newline = mm.rfind(b"\n", lo, mid)
+            start = lo if newline == -1 else newline + 1
+            end = mm.find(b"\n", start)
+            if end == -1:
+                end = len(mm)
+
+            tab = mm.find(b"\t", start, end)
+            key = mm[start:tab if tab != -1 else end]
+            if key == target:
+                columns = mm[tab + 1:end].decode("utf-8").split("\t")
+                return columns
+            if key < target:
+                lo = end + 1
+            else:
+                hi = start
+        return None
+
+
+# ---------------------------------------------------------------------------
+# Builder
+# ---------------------------------------------------------------------------
+
+
+def build_lookup_file(path: str) -> int:
+    """
+    Compile the NLTK WordNet corpus into a lookup file at *path*.
+
+    The file is written to a temporary name and atomically renamed into
+    place, so running workers never observe a partial file.  Returns the
+    number of records written.
+    """
+    from nltk.corpus import wordnet
+    from nltk.corpus.reader.wordnet import WordNetCorpusReader
+
+    columns: Dict[str, List[set]] = {}
+
+    def row(word: str) -> List[set]:
+        return columns.setdefault(word, [set() for _ in range(len(POS_LIST) * 3)])
+
+    # Lemma -> synsets, per part of speech (the contents of index.<pos>)
+    for index, pos in enumerate(POS_LIST):
+        for synset in wordnet.all_synsets(pos):
+            names = [lemma.name() for lemma in synset.lemmas()]
+            for name in names:
+                cells = row(name.lower())
+                cells[index * 2].add(synset.name())
+                cells[index * 2 + 1].update(names)
+
+    # Irregular inflections (<pos>.exc)
+    exc_files = {"n": "noun", "v": "verb", "a": "adj", "r": "adv"}
+    for index, pos in enumerate(POS_LIST):
+        with wordnet.open(f"{exc_files[pos]}.exc") as fp:
+            for line in fp:
+                terms = line.split()
+                if terms:
+                    row(terms[0])[len(POS_LIST) * 2 + index].update(terms[1:])
+
+    meta = {
+        "format": FORMAT_VERSION,
+        "wordnet": wordnet.get_version(),
+        "substitutions": {
+            pos: WordNetCorpusReader.MORPHOLOGICAL_SUBSTITUTIONS[pos] for pos in POS_LIST
+        },
+    }
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp.{os.getpid()}"
+    with open(tmp_path, "w", encoding="utf-8", newline="\n") as fp:
+        fp.write("# " + json.dumps(meta, sort_keys=True) + "\n")
+        for word in sorted(columns, key=lambda w: w.encode("utf-8")):
+            cells = columns[word]
+            fp.write(word + "\t" + "\t".join(" ".join(sorted(c)) for c in cells) + "\n")
+    os.replace(tmp_path, path)
+
+    logger.info("Wrote WordNet lookup file %s (%d records)", path, len(columns))
+    return len(columns)
+
+
+# ---------------------------------------------------------------------------
+# Process-wide instance
+# ---------------------------------------------------------------------------
+
+_lookup: Optional[WordNetLookup] = None
+_lookup_loaded = False
+_lock = threading.Lock()
+
+
+def default_lookup_path() -> str:
+    """Return the configured lookup file path (``WORDNET_LOOKUP_PATH``)."""
+    try:
+        from django.conf import settings
+
+        path = getattr(settings, "WORDNET_LOOKUP_PATH", None)
+        if path:
+            return str(path)
+    except Exception:
+        pass
+    return os.path.join(os.path.dirname(__file__), "data", "wordnet_lookup.tsv")
+
+
+def get_wordnet_lookup() -> Optional[WordNetLookup]:
+    """
+    Return the process-wide lookup, or None if no lookup file is available.
+
+    Callers fall back to ``nltk.corpus.wordnet`` when this returns None.
+    """
+    global _lookup, _lookup_loaded
+    if _lookup_loaded:
+        return _lookup
+
+    with _lock:
+        if not _lookup_loaded:
+            path = default_lookup_path()
+            try:
+                _lookup = WordNetLookup(path)
+                logger.info("Using WordNet lookup file %s", path)
+            except FileNotFoundError:
+                logger.info(
+                    "WordNet lookup file %s not found; falling back to NLTK. "
+                    "Build it with: python manage.py build_wordnet_lookup",
+                    path,
+                )
+            except (OSError, ValueError) as exc:
+                logger.warning("Could not open WordNet lookup file %s: %s", path, exc)
+            _lookup_loaded = True
+    return _lookup
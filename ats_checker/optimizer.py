@@ -22,11 +22,13 @@ Usage::
 import copy
 import logging
 import re
+from collections import Counter
 from typing import Any, Dict, List, Optional, Set, Tuple
 
-from .nlp import SpaCyKeywordExtractor, SynonymExpander, TextAnalyzer
+from .nlp import KeywordMatcher, SpaCyKeywordExtractor, SynonymExpander, TextAnalyzer
 from .nlp.skills_db import SKILLS_DB, get_skill_category, is_known_skill
 from .nlp.text_analyzer import ACTION_VERBS
+from .timing import StageTimer
 
 logger = logging.getLogger(__name__)
 
@@ -137,6 +139,12 @@ class ResumeOptimizer:
         self.resume_keywords: List[dict] = []
         self.missing_keywords: List[dict] = []
         self.job_skill_names: Set[str] = set()
+        self._job_skill_matcher: Optional[KeywordMatcher] = None
+
+        # Incremental scoring state: per-section analysis, keyed by the
+        # top-level content key, plus memoized job-keyword synonyms
+        self._section_cache: Dict[str, dict] = {}
+        self._job_synonyms: Dict[str, List[str]] = {}
 
     # ──────────────────────────────────────────────────────────────────
     # Public API
@@ -153,26 +161,36 @@ class ResumeOptimizer:
             score_before       - estimated ATS score before optimization
             score_after        - estimated ATS score after optimization
             improvement        - score_after - score_before
+            timings            - milliseconds per step (see ``ats_checker.timing``)
         """
+        timer = StageTimer("ats.optimize")
         try:
             # 0. Pre-analysis: extract keywords from the job description and
             #    the *original* resume so we know what is missing.
-            self._extract_keywords()
+            with timer.stage("extract_keywords"):
+                self._extract_keywords()
 
             # 1. Calculate score BEFORE optimization
-            score_before = self._calculate_score(self.original_content)
+            with timer.stage("score_before"):
+                score_before = self._calculate_score(self.original_content)
 
             # 2. Run optimization steps (order matters)
-            self._optimize_summary()
-            self._optimize_skills()
-            self._optimize_experience()
-            self._optimize_projects()
+            with timer.stage("optimize_summary"):
+                self._optimize_summary()
+            with timer.stage("optimize_skills"):
+                self._optimize_skills()
+            with timer.stage("optimize_experience"):
+                self._optimize_experience()
+            with timer.stage("optimize_projects"):
+                self._optimize_projects()
 
             # 3. Calculate score AFTER optimization
-            score_after = self._calculate_score(self.optimized_content)
+            with timer.stage("score_after"):
+                score_after = self._calculate_score(self.optimized_content)
 
             # 4. Build change report
-            changes = self._generate_change_report()
+            with timer.stage("change_report"):
+                changes = self._generate_change_report()
 
             return {
                 "optimized_content": self.optimized_content,
@@ -181,6 +199,7 @@ class ResumeOptimizer:
                 "score_before": score_before,
                 "score_after": score_after,
                 "improvement": score_after - score_before,
+                "timings": timer.finish(),
             }
 
         except Exception as exc:
@@ -203,23 +222,18 @@ class ResumeOptimizer:
         jd_text = f"{self.job_title} {self.job_description}"
         self.job_keywords = _keyword_extractor.extract_keywords(jd_text)
 
-        resume_text = self._content_to_text(self.original_content)
-        self.resume_keywords = _keyword_extractor.extract_keywords(resume_text)
+        self.resume_keywords = self._analyze_sections(self.original_content)["keywords"]
 
         # Determine which job keywords are missing from the resume
         resume_kw_set = {kw["keyword"].lower() for kw in self.resume_keywords}
+        matcher = KeywordMatcher(resume_kw_set, _synonym_expander)
         self.missing_keywords = []
         for jk in self.job_keywords:
             kw_lower = jk["keyword"].lower()
             if kw_lower in resume_kw_set:
                 continue
             # Check synonym / stem match
-            found_via_synonym = False
-            for rkw in resume_kw_set:
-                if _synonym_expander.are_related(kw_lower, rkw):
-                    found_via_synonym = True
-                    break
-            if not found_via_synonym:
+            if not matcher.matches(kw_lower):
                 self.missing_keywords.append(jk)
 
         # Build a set of skill names from the job description for quick lookup
@@ -228,6 +242,7 @@ class ResumeOptimizer:
             kw_lower = jk["keyword"].lower()
             if is_known_skill(kw_lower) or jk.get("category") not in ("general", "organization", None):
                 self.job_skill_names.add(kw_lower)
+        self._job_skill_matcher = None
 
     # ──────────────────────────────────────────────────────────────────
     # Step 1 -- optimize professional summary
@@ -469,6 +484,7 @@ class ResumeOptimizer:
 
         missing_skills: List[str] = []
         seen: Set[str] = set()
+        current_matcher: Optional[KeywordMatcher] = None
 
         for kw in self.job_keywords:
             kw_text = kw["keyword"]
@@ -484,12 +500,9 @@ class ResumeOptimizer:
             # Also check if it appears anywhere in the resume text (synonym match)
             if kw_lower in resume_text_lower:
                 continue
-            found_synonym = False
-            for cs in current_skills:
-                if _synonym_expander.are_related(kw_lower, cs):
-                    found_synonym = True
-                    break
-            if found_synonym:
+            if current_matcher is None:
+                current_matcher = KeywordMatcher(current_skills, _synonym_expander)
+            if current_matcher.matches(kw_lower):
                 continue
 
             # Capitalize nicely
@@ -519,9 +532,10 @@ class ResumeOptimizer:
         if s_lower in self.job_skill_names:
             return (0, s_lower)
         # Check synonym match
-        for js in self.job_skill_names:
-            if _synonym_expander.are_related(s_lower, js):
-                return (1, s_lower)
+        if self._job_skill_matcher is None:
+            self._job_skill_matcher = KeywordMatcher(self.job_skill_names, _synonym_expander)
+        if self._job_skill_matcher.matches(s_lower):
+            return (1, s_lower)
         return (2, s_lower)
 
     @staticmethod
@@ -849,15 +863,16 @@ class ResumeOptimizer:
         STRUCTURE_WEIGHT = 0.15
         FORMATTING_WEIGHT = 0.15
 
-        resume_text = self._content_to_text(content)
+        analysis = self._analyze_sections(content)
+        resume_keywords = analysis["keywords"]
 
         # --- Keyword score ---
-        resume_keywords = _keyword_extractor.extract_keywords(resume_text)
-        resume_text_lower = resume_text.lower()
+        resume_text_lower = analysis["text"].lower()
         resume_kw_set = {kw["keyword"].lower() for kw in resume_keywords}
 
         total_weight = 0
         matched_weight = 0
+        matcher = None
         for kw in self.job_keywords:
             keyword = kw["keyword"]
             importance = kw.get("importance", "low")
@@ -866,16 +881,17 @@ class ResumeOptimizer:
 
             found = keyword.lower() in resume_text_lower
             if not found:
-                synonyms = _synonym_expander.expand(keyword)
+                synonyms = self._job_synonyms.get(keyword)
+                if synonyms is None:
+                    synonyms = self._job_synonyms[keyword] = _synonym_expander.expand(keyword)
                 for syn in synonyms:
                     if syn.lower() in resume_text_lower:
                         found = True
                         break
             if not found:
-                for rkw in resume_kw_set:
-                    if _synonym_expander.are_related(keyword, rkw):
-                        found = True
-                        break
+                if matcher is None:
+                    matcher = KeywordMatcher(resume_kw_set, _synonym_expander)
+                found = matcher.matches(keyword)
 
             if found:
                 matched_weight += weight
@@ -891,8 +907,7 @@ class ResumeOptimizer:
         structure_score = structure_result.get("score", 0)
 
         # --- Formatting score ---
-        formatting_result = _text_analyzer.analyze_formatting(content)
-        formatting_score = formatting_result.get("score", 0)
+        formatting_score = max(0, 100 - analysis["formatting_deductions"])
 
         # --- Weighted total ---
         score = int(
@@ -903,6 +918,69 @@ class ResumeOptimizer:
         )
         return min(100, max(0, score))
 
+    def _analyze_sections(self, content: dict) -> dict:
+        """
+        Analyze *content* section by section, reusing cached results.
+
+        A top-level section is re-analyzed only when a recorded change
+        touches it (see ``_changed_sections``) or its data differs from the
+        cached copy; otherwise its keyword candidates and formatting
+        deductions come from ``self._section_cache``.  Candidates of all
+        sections are summed and ranked as one document.
+
+        Returns a dict with keys:
+            text                   - plain text (as ``_content_to_text``)
+            keywords               - ranked resume keywords
+            formatting_deductions  - summed ``analyze_formatting`` deductions
+        """
+        if not isinstance(content, dict):
+            text = self._content_to_text(content)
+            return {
+                "text": text,
+                "keywords": _keyword_extractor.extract_keywords(text),
+                "formatting_deductions": 100,
+            }
+
+        changed = self._changed_sections()
+        texts: List[str] = []
+        candidates: Counter = Counter()
+        category_map: Dict[str, str] = {}
+        deductions = 0
+
+        for name, data in content.items():
+            entry = self._section_cache.get(name)
+            if entry is None or name in changed or entry["data"] != data:
+                section_text = self._section_text(data)
+                section_candidates, section_categories = _keyword_extractor.extract_candidates(
+                    section_text or ""
+                )
+                entry = {
+                    "data": copy.deepcopy(data),
+                    "text": section_text,
+                    "candidates": section_candidates,
+                    "categories": section_categories,
+                    "formatting_deductions": _text_analyzer.analyze_section_formatting(name, data)[0],
+                }
+                self._section_cache[name] = entry
+
+            if entry["text"] is not None:
+                texts.append(entry["text"])
+            candidates.update(entry["candidates"])
+            for keyword, category in entry["categories"].items():
+                category_map.setdefault(keyword, category)
+            deductions += entry["formatting_deductions"]
+
+        return {
+            "text": " ".join(texts),
+            "keywords": _keyword_extractor.rank_candidates(candidates, category_map),
+            "formatting_deductions": deductions,
+        }
+
+    def _changed_sections(self) -> Set[str]:
+        """Top-level content keys touched by recorded changes."""
+        # "personal.summary" -> "personal", "experience[0].description" -> "experience"
+        return {re.split(r"[.\[]", change["section"], maxsplit=1)[0] for change in self.changes_made}
+
     # ──────────────────────────────────────────────────────────────────
     # Change tracking
     # ──────────────────────────────────────────────────────────────────
@@ -944,26 +1022,34 @@ class ResumeOptimizer:
     # Utilities
     # ──────────────────────────────────────────────────────────────────
 
-    @staticmethod
-    def _content_to_text(content: dict) -> str:
+    @classmethod
+    def _content_to_text(cls, content: dict) -> str:
         """
         Convert resume content JSON to plain text (mirrors
         ``ATSScoreAnalyzer._get_resume_text``).
         """
         if isinstance(content, dict):
-            parts: List[str] = []
-            for section, data in content.items():
-                if isinstance(data, str):
-                    parts.append(data)
-                elif isinstance(data, list):
-                    for item in data:
-                        if isinstance(item, dict):
-                            parts.append(" ".join(str(v) for v in item.values()))
-                        else:
-                            parts.append(str(item))
-                elif isinstance(data, dict):
-                    parts.append(" ".join(str(v) for v in data.values()))
-            return " ".join(parts)
+            texts = (cls._section_text(data) for data in content.values())
+            return " ".join(text for text in texts if text is not None)
         elif isinstance(content, str):
             return content
         return str(content)
+
+    @staticmethod
+    def _section_text(data: Any) -> Optional[str]:
+        """
+        Plain text of one top-level section, or None if the section
+        contributes nothing to ``_content_to_text``.
+        """
+        parts: List[str] = []
+        if isinstance(data, str):
+            parts.append(data)
+        elif isinstance(data, list):
+            for item in data:
+                if isinstance(item, dict):
+                    parts.append(" ".join(str(v) for v in item.values()))
+                else:
+                    parts.append(str(item))
+        elif isinstance(data, dict):
+            parts.append(" ".join(str(v) for v in data.values()))
+        return " ".join(parts) if parts else None
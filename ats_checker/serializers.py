@@ -1,5 +1,6 @@
+from django.conf import settings
 from rest_framework import serializers
-from .models import ATSScore, KeywordMatch, OptimizationSuggestion, JobTitleSynonym
+from .models import ATSScore, ATSScoreBatch, KeywordMatch, OptimizationSuggestion, JobTitleSynonym
 from users.serializers import UserSerializer
 from resumes.serializers import ResumeSerializer
 from resumes.models import Resume
@@ -59,19 +60,99 @@ class ATSScoreCreateSerializer(serializers.ModelSerializer):
         user = self.context['request'].user
 
         # Check if user has premium subscription
-        has_premium = user.subscriptions.filter(status='active', plan__is_premium=True).exists()
-        if not has_premium:
+        if not user.is_subscribed:
             raise serializers.ValidationError({"error": "ATS Score Checker is a premium feature. Please upgrade your subscription."})
 
-        # Create ATS score (actual scoring will be done in the view)
+        # Create ATS score (actual scoring is done asynchronously or
+        # copied from a cached identical analysis)
         ats_score = ATSScore.objects.create(
             user=user,
+            score=0,
             **validated_data
         )
 
         return ats_score
 
 
+class ATSScoreBatchSerializer(serializers.ModelSerializer):
+    """
+    Serializer for the ATSScoreBatch model.
+    """
+    resume_count = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ATSScoreBatch
+        fields = ('id', 'job_title', 'status', 'error', 'resume_count', 'created_at', 'completed_at')
+        read_only_fields = fields
+
+    def get_resume_count(self, obj):
+        return len(obj.resume_ids)
+
+
+class ATSScoreBatchDetailSerializer(ATSScoreBatchSerializer):
+    """
+    Serializer for a single batch, including its resumes ranked by score.
+    """
+    results = serializers.SerializerMethodField()
+
+    class Meta(ATSScoreBatchSerializer.Meta):
+        fields = ATSScoreBatchSerializer.Meta.fields + ('job_description', 'results')
+        read_only_fields = fields
+
+    def get_results(self, obj):
+        scores = obj.scores.select_related('resume').order_by('-score', 'id')
+        results = []
+        for rank, ats_score in enumerate(scores, start=1):
+            keyword_match = ats_score.analysis.get('keyword_match', {})
+            results.append({
+                'rank': rank,
+                'ats_score_id': ats_score.id,
+                'resume_id': ats_score.resume_id,
+                'resume_title': ats_score.resume.title,
+                'score': ats_score.score,
+                'matched_keywords': keyword_match.get('matched_keywords', 0),
+                'total_keywords': keyword_match.get('total_keywords', 0),
+            })
+        return results
+
+
+class ATSScoreBatchCreateSerializer(serializers.ModelSerializer):
+    """
+    Serializer for creating an ATS score batch.
+    """
+    resume_ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        min_length=1,
+        max_length=settings.ATS_BATCH_MAX_RESUMES,
+    )
+
+    class Meta:
+        model = ATSScoreBatch
+        fields = ('resume_ids', 'job_title', 'job_description')
+
+    def validate_resume_ids(self, value):
+        resume_ids = list(dict.fromkeys(value))
+        user = self.context['request'].user
+        owned = set(
+            Resume.objects.filter(id__in=resume_ids, user=user).values_list('id', flat=True)
+        )
+        missing = [rid for rid in resume_ids if rid not in owned]
+        if missing:
+            raise serializers.ValidationError(f"Resumes not found: {missing}")
+        return resume_ids
+
+    def create(self, validated_data):
+        user = self.context['request'].user
+
+        # Batch scoring requires an active subscription
+        if not user.is_subscribed:
+            raise serializers.ValidationError({
+                "error": "Batch ATS scoring is a premium feature. Please upgrade your subscription.",
+            })
+
+        return ATSScoreBatch.objects.create(user=user, **validated_data)
+
+
 class JobTitleSynonymSerializer(serializers.ModelSerializer):
     """
     Serializer for the JobTitleSynonym model.
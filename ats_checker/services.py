@@ -3,11 +3,21 @@ Services for ATS Score Checker.
 Uses spaCy and NLTK for NLP-powered resume analysis.
 """
 import re
+import hashlib
+import json
 import logging
 from typing import List
 
-from .models import ATSScore, KeywordMatch, OptimizationSuggestion
-from .nlp import SpaCyKeywordExtractor, SynonymExpander, TextAnalyzer
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from resumes.models import Resume
+from .models import ATSScore, ATSScoreBatch, KeywordMatch, OptimizationSuggestion
+from .nlp import KeywordMatcher, SpaCyKeywordExtractor, SynonymExpander, TextAnalyzer
+from .nlp.cache import normalize_text
+from .timing import StageTimer
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +26,10 @@ _keyword_extractor = SpaCyKeywordExtractor()
 _synonym_expander = SynonymExpander()
 _text_analyzer = TextAnalyzer()
 
+# Bump whenever a change to the scoring pipeline alters results, so cached
+# results from the previous scorer are no longer served.
+SCORER_VERSION = 1
+
 
 class ATSScoreAnalyzer:
     """Analyzes resumes against job descriptions using spaCy/NLTK NLP pipeline."""
@@ -38,68 +52,88 @@ class ATSScoreAnalyzer:
         self.suggestions = []
         self.job_keywords = []
         self.resume_keywords = []
+        self.timer = StageTimer('ats.analyze', ats_score_id=ats_score_obj.id)
 
     def analyze(self) -> ATSScore:
         """Run the full analysis pipeline."""
         try:
             # 1. Extract keywords from job description and resume
-            self.job_keywords = _keyword_extractor.extract_keywords(
-                self.job_title + " " + self.job_description
-            )
-            resume_text = self._get_resume_text()
-            self.resume_keywords = _keyword_extractor.extract_keywords(resume_text)
-
-            # 2. Calculate keyword match score (with synonym expansion)
-            keyword_score = self._calculate_keyword_match(resume_text)
-
-            # 3. Calculate skills gap score
-            skills_gap = _text_analyzer.identify_skills_gap(self.resume_keywords, self.job_keywords)
-            skills_score = max(0, 100 - len(skills_gap) * 5)  # -5 per missing skill, min 0
-            self.analysis['skills_gap'] = {
-                'score': skills_score,
-                'missing_skills': skills_gap,
-            }
-
-            # 4. Analyze structure
-            structure_result = _text_analyzer.analyze_structure(self.resume_content)
-            structure_score = structure_result['score']
-            self.analysis['structure'] = structure_result
-
-            # 5. Analyze formatting
-            formatting_result = _text_analyzer.analyze_formatting(self.resume_content)
-            formatting_score = formatting_result['score']
-            self.analysis['formatting'] = formatting_result
-
-            # 6. Calculate overall score
-            self.score = int(
-                self.KEYWORD_WEIGHT * keyword_score
-                + self.SKILLS_WEIGHT * skills_score
-                + self.STRUCTURE_WEIGHT * structure_score
-                + self.FORMATTING_WEIGHT * formatting_score
-            )
-            self.score = min(100, max(0, self.score))
-
-            # 7. Generate suggestions
-            self._generate_suggestions(resume_text, skills_gap)
-
-            # 8. Save results
+            with self.timer.stage('extract_job_keywords'):
+                self.job_keywords = _keyword_extractor.extract_keywords(
+                    self.job_title + " " + self.job_description
+                )
+            with self.timer.stage('extract_resume_keywords'):
+                resume_text = self._get_resume_text()
+                self.resume_keywords = _keyword_extractor.extract_keywords(resume_text)
+
+            # 2-7. Score and generate suggestions
+            self.score_resume(resume_text)
+
+            # 8. Save results (the score row last, so its timings cover
+            #    the bulk inserts)
+            with self.timer.stage('save_details'):
+                self._save_keyword_matches()
+                self._save_optimization_suggestions()
+
+            self.analysis['timings'] = self.timer.finish(record=False)
             self.ats_score.score = self.score
-            self.ats_score.analysis = self.analysis
+            self.ats_score.set_analysis(self.analysis)
             self.ats_score.suggestions = self.suggestions
             self.ats_score.save()
 
-            self._save_keyword_matches()
-            self._save_optimization_suggestions()
-
+            cache_result(self)
             return self.ats_score
 
         except Exception as e:
             logger.error(f"Error analyzing resume: {str(e)}", exc_info=True)
             self.ats_score.score = 0
-            self.ats_score.analysis = {"error": str(e)}
+            self.ats_score.set_analysis({"error": str(e)})
             self.ats_score.save()
             return self.ats_score
 
+    def score_resume(self, resume_text: str) -> None:
+        """
+        Compute the score, analysis and suggestions from ``job_keywords``
+        and ``resume_keywords`` without touching the database.
+        """
+        # 2. Calculate keyword match score (with synonym expansion)
+        with self.timer.stage('keyword_match'):
+            keyword_score = self._calculate_keyword_match(resume_text)
+
+        # 3. Calculate skills gap score
+        with self.timer.stage('skills_gap'):
+            skills_gap = _text_analyzer.identify_skills_gap(self.resume_keywords, self.job_keywords)
+        skills_score = max(0, 100 - len(skills_gap) * 5)  # -5 per missing skill, min 0
+        self.analysis['skills_gap'] = {
+            'score': skills_score,
+            'missing_skills': skills_gap,
+        }
+
+        # 4. Analyze structure
+        with self.timer.stage('structure'):
+            structure_result = _text_analyzer.analyze_structure(self.resume_content)
+        structure_score = structure_result['score']
+        self.analysis['structure'] = structure_result
+
+        # 5. Analyze formatting
+        with self.timer.stage('formatting'):
+            formatting_result = _text_analyzer.analyze_formatting(self.resume_content)
+        formatting_score = formatting_result['score']
+        self.analysis['formatting'] = formatting_result
+
+        # 6. Calculate overall score
+        self.score = int(
+            self.KEYWORD_WEIGHT * keyword_score
+            + self.SKILLS_WEIGHT * skills_score
+            + self.STRUCTURE_WEIGHT * structure_score
+            + self.FORMATTING_WEIGHT * formatting_score
+        )
+        self.score = min(100, max(0, self.score))
+
+        # 7. Generate suggestions
+        with self.timer.stage('suggestions'):
+            self._generate_suggestions(resume_text, skills_gap)
+
     def _calculate_keyword_match(self, resume_text: str) -> float:
         """Calculate keyword match score using NLP synonym expansion."""
         if not self.job_keywords:
@@ -108,6 +142,7 @@ class ATSScoreAnalyzer:
         resume_text_lower = resume_text.lower()
         total_weight = 0
         matched_weight = 0
+        matcher = None
 
         for kw in self.job_keywords:
             keyword = kw['keyword']
@@ -128,10 +163,11 @@ class ATSScoreAnalyzer:
 
             # If still not found, check via stem matching against resume keywords
             if not found:
-                for rkw in self.resume_keywords:
-                    if _synonym_expander.are_related(keyword, rkw['keyword']):
-                        found = True
-                        break
+                if matcher is None:
+                    matcher = KeywordMatcher(
+                        (rkw['keyword'] for rkw in self.resume_keywords), _synonym_expander
+                    )
+                found = matcher.matches(keyword)
 
             if found:
                 matched_weight += weight
@@ -180,7 +216,7 @@ class ATSScoreAnalyzer:
         # Missing sections
         if 'structure' in self.analysis:
             details = self.analysis['structure'].get('details', {})
-            missing_sections = [s for s, info in details.items() if not info.get('present')]
+            missing_sections = details.get('missing_sections', [])
             if missing_sections:
                 suggestions.append({
                     'type': 'missing_sections',
@@ -192,14 +228,20 @@ class ATSScoreAnalyzer:
         # Formatting issues
         if 'formatting' in self.analysis:
             for issue in self.analysis['formatting'].get('issues', [])[:5]:
+                # TextAnalyzer.analyze_formatting reports issues as strings
+                if isinstance(issue, dict):
+                    section, description = issue.get('section', 'general'), issue.get('issue', '')
+                else:
+                    section, description = 'general', str(issue)
                 suggestions.append({
                     'type': 'formatting',
-                    'section': issue.get('section', 'general'),
-                    'description': issue.get('issue', ''),
+                    'section': section,
+                    'description': description,
                 })
 
-        # Experience phrasing suggestions
-        phrasing = _text_analyzer.suggest_experience_phrasing(resume_text)
+        # Experience phrasing suggestions (spaCy passive-voice parsing)
+        with self.timer.stage('phrasing'):
+            phrasing = _text_analyzer.suggest_experience_phrasing(resume_text)
         for p in phrasing[:5]:
             suggestions.append({
                 'type': 'phrasing',
@@ -211,8 +253,8 @@ class ATSScoreAnalyzer:
 
         self.suggestions = suggestions
 
-    def _save_keyword_matches(self) -> None:
-        """Save keyword matches to database."""
+    def build_keyword_matches(self) -> List[KeywordMatch]:
+        """Build (unsaved) keyword match rows for this analysis."""
         matches = []
         for kw in self.job_keywords:
             matches.append(KeywordMatch(
@@ -222,10 +264,10 @@ class ATSScoreAnalyzer:
                 importance=kw.get('importance', 'low'),
                 context=kw.get('context', ''),
             ))
-        KeywordMatch.objects.bulk_create(matches)
+        return matches
 
-    def _save_optimization_suggestions(self) -> None:
-        """Save optimization suggestions to database."""
+    def build_optimization_suggestions(self) -> List[OptimizationSuggestion]:
+        """Build (unsaved) optimization suggestion rows for this analysis."""
         objs = []
         for suggestion in self.suggestions:
             objs.append(OptimizationSuggestion(
@@ -235,13 +277,26 @@ class ATSScoreAnalyzer:
                 suggested_text=suggestion.get('description', ''),
                 reason=suggestion.get('reason', suggestion.get('description', '')),
             ))
-        OptimizationSuggestion.objects.bulk_create(objs)
+        return objs
+
+    def _save_keyword_matches(self) -> None:
+        """Save keyword matches to database."""
+        KeywordMatch.objects.bulk_create(self.build_keyword_matches())
+
+    def _save_optimization_suggestions(self) -> None:
+        """Save optimization suggestions to database."""
+        OptimizationSuggestion.objects.bulk_create(self.build_optimization_suggestions())
 
     def _get_resume_text(self) -> str:
         """Convert resume content JSON to plain text."""
-        if isinstance(self.resume_content, dict):
+        return self.resume_to_text(self.resume_content)
+
+    @staticmethod
+    def resume_to_text(resume_content) -> str:
+        """Convert a resume ``content`` JSONField value to plain text."""
+        if isinstance(resume_content, dict):
             parts = []
-            for section, content in self.resume_content.items():
+            for section, content in resume_content.items():
                 if isinstance(content, str):
                     parts.append(content)
                 elif isinstance(content, list):
@@ -253,9 +308,9 @@ class ATSScoreAnalyzer:
                 elif isinstance(content, dict):
                     parts.append(" ".join(str(v) for v in content.values()))
             return " ".join(parts)
-        elif isinstance(self.resume_content, str):
-            return self.resume_content
-        return str(self.resume_content)
+        elif isinstance(resume_content, str):
+            return resume_content
+        return str(resume_content)
 
 
 def analyze_resume(ats_score_id: int) -> ATSScore:
@@ -272,6 +327,207 @@ def analyze_resume(ats_score_id: int) -> ATSScore:
         return None
 
 
+# ---------------------------------------------------------------------------
+# Result cache
+# ---------------------------------------------------------------------------
+# Resubmitting the same resume content against the same job description
+# (page refresh, job tracker) reuses the previous result instead of
+# rerunning the NLP pipeline.
+
+_RESULT_CACHE_HITS_KEY = 'ats:result_cache:hits'
+_RESULT_CACHE_MISSES_KEY = 'ats:result_cache:misses'
+
+
+def result_cache_key(user_id: int, resume_content, job_title: str, job_description: str) -> str:
+    """Key an analysis by resume content, normalized JD, scorer and model."""
+    content_hash = hashlib.sha256(
+        json.dumps(resume_content, sort_keys=True, default=str).encode('utf-8')
+    ).hexdigest()
+    jd_hash = hashlib.sha256(
+        normalize_text(job_title + " " + job_description).encode('utf-8')
+    ).hexdigest()
+    return (
+        f"ats:result:v{SCORER_VERSION}:{_keyword_extractor.model_name}:"
+        f"{user_id}:{content_hash}:{jd_hash}"
+    )
+
+
+def cache_result(analyzer: ATSScoreAnalyzer) -> None:
+    """Store a finished analysis so identical submissions can reuse it."""
+    ats_score = analyzer.ats_score
+    key = result_cache_key(
+        ats_score.user_id, analyzer.resume_content, ats_score.job_title, ats_score.job_description
+    )
+    value = {
+        'score': analyzer.score,
+        'analysis': analyzer.analysis,
+        'suggestions': analyzer.suggestions,
+        'keyword_matches': [
+            {'keyword': m.keyword, 'found': m.found, 'importance': m.importance, 'context': m.context}
+            for m in analyzer.build_keyword_matches()
+        ],
+        'optimization_suggestions': [
+            {
+                'section': o.section,
+                'original_text': o.original_text,
+                'suggested_text': o.suggested_text,
+                'reason': o.reason,
+            }
+            for o in analyzer.build_optimization_suggestions()
+        ],
+    }
+    try:
+        cache.set(key, value, getattr(settings, 'CACHE_TTL_ATS_RESULTS', 86400))
+    except Exception:
+        logger.warning("Could not store ATS result in cache", exc_info=True)
+
+
+def clone_cached_result(ats_score: ATSScore) -> bool:
+    """
+    Fill *ats_score* from a cached identical analysis.
+
+    Returns True on a hit (the score, keyword matches and suggestions are
+    saved); False on a miss, in which case the analysis must be run.
+    """
+    key = result_cache_key(
+        ats_score.user_id, ats_score.resume.content, ats_score.job_title, ats_score.job_description
+    )
+    try:
+        cached = cache.get(key)
+    except Exception:
+        logger.warning("Could not read ATS result cache", exc_info=True)
+        cached = None
+    _record_result_cache_lookup(cached is not None)
+    if cached is None:
+        return False
+
+    with transaction.atomic():
+        ats_score.score = cached['score']
+        # Timings belong to the run that produced the result
+        ats_score.set_analysis({k: v for k, v in cached['analysis'].items() if k != 'timings'})
+        ats_score.suggestions = cached['suggestions']
+        ats_score.save()
+        KeywordMatch.objects.bulk_create([
+            KeywordMatch(ats_score=ats_score, **match) for match in cached['keyword_matches']
+        ])
+        OptimizationSuggestion.objects.bulk_create([
+            OptimizationSuggestion(ats_score=ats_score, **suggestion)
+            for suggestion in cached['optimization_suggestions']
+        ])
+    return True
+
+
+def _record_result_cache_lookup(hit: bool) -> None:
+    key = _RESULT_CACHE_HITS_KEY if hit else _RESULT_CACHE_MISSES_KEY
+    try:
+        # add() is a no-op when the counter exists; incr() is atomic on Redis
+        cache.add(key, 0, timeout=None)
+        cache.incr(key)
+    except Exception:
+        pass
+
+
+def get_result_cache_stats() -> dict:
+    """Return hit/miss counters for the ATS result cache."""
+    try:
+        counts = cache.get_many([_RESULT_CACHE_HITS_KEY, _RESULT_CACHE_MISSES_KEY])
+    except Exception:
+        counts = {}
+    hits = counts.get(_RESULT_CACHE_HITS_KEY, 0)
+    misses = counts.get(_RESULT_CACHE_MISSES_KEY, 0)
+    lookups = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_rate': round(hits / lookups * 100, 2) if lookups else 0,
+    }
+
+
+class BatchATSScorer:
+    """
+    Score one job description against many resumes.
+
+    The job description is extracted once, resume texts are parsed in
+    chunks with ``nlp.pipe`` (``ATS_BATCH_SIZE`` / ``ATS_BATCH_N_PROCESS``),
+    and all ``ATSScore``, ``KeywordMatch`` and ``OptimizationSuggestion``
+    rows are written with ``bulk_create``.
+    """
+
+    def __init__(self, batch: ATSScoreBatch):
+        self.batch = batch
+        self.batch_size = getattr(settings, 'ATS_BATCH_SIZE', 32)
+        self.n_process = getattr(settings, 'ATS_BATCH_N_PROCESS', 1)
+
+    def run(self) -> ATSScoreBatch:
+        """Score every resume in the batch and persist the results."""
+        batch = self.batch
+        batch.status = 'processing'
+        batch.save(update_fields=['status'])
+
+        try:
+            job_keywords = _keyword_extractor.extract_keywords(
+                batch.job_title + " " + batch.job_description
+            )
+            resumes = list(
+                Resume.objects.filter(id__in=batch.resume_ids, user=batch.user).order_by('id')
+            )
+            texts = [ATSScoreAnalyzer.resume_to_text(resume.content) for resume in resumes]
+            resume_keywords = _keyword_extractor.extract_keywords_batch(
+                texts, batch_size=self.batch_size, n_process=self.n_process
+            )
+
+            analyzers = []
+            for resume, text, keywords in zip(resumes, texts, resume_keywords):
+                analyzer = ATSScoreAnalyzer(ATSScore(
+                    user=batch.user,
+                    resume=resume,
+                    job_title=batch.job_title,
+                    job_description=batch.job_description,
+                    batch=batch,
+                ))
+                # _calculate_keyword_match annotates the dicts in place
+                analyzer.job_keywords = [dict(kw) for kw in job_keywords]
+                analyzer.resume_keywords = keywords
+                analyzer.score_resume(text)
+                analyzer.ats_score.score = analyzer.score
+                analyzer.ats_score.set_analysis(analyzer.analysis)
+                analyzer.ats_score.suggestions = analyzer.suggestions
+                analyzers.append(analyzer)
+
+            with transaction.atomic():
+                ATSScore.objects.bulk_create([a.ats_score for a in analyzers])
+                KeywordMatch.objects.bulk_create(
+                    [m for a in analyzers for m in a.build_keyword_matches()],
+                    batch_size=1000,
+                )
+                OptimizationSuggestion.objects.bulk_create(
+                    [o for a in analyzers for o in a.build_optimization_suggestions()],
+                    batch_size=1000,
+                )
+                batch.status = 'completed'
+                batch.completed_at = timezone.now()
+                batch.save(update_fields=['status', 'completed_at'])
+
+        except Exception as e:
+            logger.error(f"Error scoring batch {batch.id}: {str(e)}", exc_info=True)
+            batch.status = 'failed'
+            batch.error = str(e)
+            batch.completed_at = timezone.now()
+            batch.save(update_fields=['status', 'error', 'completed_at'])
+
+        return batch
+
+
+def analyze_batch(batch_id: int) -> ATSScoreBatch:
+    """Score an ATSScoreBatch. Called from Celery task."""
+    try:
+        batch = ATSScoreBatch.objects.select_related('user').get(id=batch_id)
+    except ATSScoreBatch.DoesNotExist:
+        logger.error(f"ATSScoreBatch with ID {batch_id} does not exist")
+        return None
+    return BatchATSScorer(batch).run()
+
+
 def apply_suggestion(suggestion_id: int) -> bool:
     """Mark a suggestion as applied."""
     try:
@@ -0,0 +1,17 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import JobTitleSynonym
+from .nlp.synonym_index import invalidate_synonym_index
+
+
+@receiver(post_save, sender=JobTitleSynonym)
+@receiver(post_delete, sender=JobTitleSynonym)
+def invalidate_synonym_index_on_change(sender, **kwargs):
+    """
+    Rebuild the in-memory synonym index after a JobTitleSynonym changes.
+
+    The version bump waits for the commit: a process that rebuilt from the
+    still-uncommitted rows would keep the old index under the new version.
+    """
+    transaction.on_commit(invalidate_synonym_index)
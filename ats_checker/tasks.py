@@ -6,3 +6,11 @@ def analyze_resume_task(ats_score_id):
     """Analyze a resume against a job description asynchronously."""
     from .services import analyze_resume
     return analyze_resume(ats_score_id)
+
+
+@shared_task
+def analyze_batch_task(batch_id):
+    """Score one job description against every resume in a batch."""
+    from .services import analyze_batch
+    batch = analyze_batch(batch_id)
+    return batch.status if batch else None
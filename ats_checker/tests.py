@@ -1,3 +1,72 @@
-from django.test import TestCase
+from io import StringIO
 
-# Create your tests here.
+import pytest
+from django.core.management import call_command
+
+from resumes.models import Resume
+
+from .models import ATSScore, JobTitleSynonym, OptimizationSuggestion
+from .nlp import synonym_index
+
+RESUME_CONTENT = {
+    'personal': {'name': 'Test User', 'summary': 'Engineer'},
+    'skills': ['Python'],
+}
+
+
+@pytest.fixture
+def ats_score(sample_user):
+    resume = Resume.objects.create(user=sample_user, title='CV', content=RESUME_CONTENT)
+    return ATSScore.objects.create(
+        user=sample_user, resume=resume, job_title='Backend Engineer',
+        job_description='Python, Django, PostgreSQL, Docker, Kubernetes and AWS experience required.',
+        score=0,
+    )
+
+
+def _rescore(tmp_path):
+    call_command(
+        'rescore_ats_scores', checkpoint=str(tmp_path / 'checkpoint'), restart=True,
+        n_process=1, stdout=StringIO(),
+    )
+
+
+def test_rescore_keeps_applied_suggestions_without_duplicating_them(ats_score, tmp_path):
+    _rescore(tmp_path)
+    suggestions = list(OptimizationSuggestion.objects.filter(ats_score=ats_score))
+    assert suggestions
+
+    applied = suggestions[0]
+    applied.applied = True
+    applied.save(update_fields=['applied'])
+
+    _rescore(tmp_path)
+    rows = OptimizationSuggestion.objects.filter(ats_score=ats_score)
+    same = rows.filter(section=applied.section, suggested_text=applied.suggested_text)
+    assert list(same.values_list('pk', 'applied')) == [(applied.pk, True)]
+    assert rows.count() == len(suggestions)
+
+
+def test_synonym_version_is_bumped_only_on_commit(db, django_capture_on_commit_callbacks):
+    before = synonym_index._shared_version()
+    with django_capture_on_commit_callbacks() as callbacks:
+        JobTitleSynonym.objects.create(title='Developer', synonyms=['Engineer'])
+        assert synonym_index._shared_version() == before
+    assert callbacks == [synonym_index.invalidate_synonym_index]
+    callbacks[0]()
+    assert synonym_index._shared_version() == before + 1
+
+
+
+def test_failed_synonym_index_build_is_cached(monkeypatch):
+    builds = []
+    monkeypatch.setattr(synonym_index, '_build_index', lambda: builds.append(1))
+    monkeypatch.setattr(synonym_index, '_index', None)
+    monkeypatch.setattr(synonym_index, '_index_version', None)
+    monkeypatch.setattr(synonym_index, '_checked_at', 0.0)
+    assert len(synonym_index.get_synonym_index()) == 0
+    assert len(synonym_index.get_synonym_index()) == 0
+    assert builds == [1]
+    monkeypatch.setattr(synonym_index, '_checked_at', 0.0)
+    synonym_index.get_synonym_index()
+    assert builds == [1, 1]
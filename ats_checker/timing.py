@@ -0,0 +1,159 @@
+"""
+Lightweight per-stage timing for the NLP pipelines.
+
+Usage::
+
+    timer = StageTimer('ats.analyze', ats_score_id=ats_score.id)
+    with timer.stage('extract_job_keywords'):
+        ...
+    with timer.stage('keyword_match'):
+        ...
+    timings = timer.finish()   # {'extract_job_keywords': 12.5, ..., 'total': 40.1}
+
+``finish()`` writes one ``stage timings`` log record whose ``pipeline``,
+``timings`` and context fields become top-level keys under the JSON log
+formatter.  It also appends the timings to a bounded sample window;
+``stage_percentiles`` aggregates those samples for the admin analytics
+endpoint.  With the Redis cache backend the window is a Redis list shared
+by all processes, appended with ``RPUSH`` + ``LTRIM`` so concurrent
+requests never overwrite each other; other backends keep a per-process
+window in memory (as ``LocMemCache`` would).  ATS analyses also store their timings in
+``ATSScore.analysis['timings']``, so they are aggregated from the database.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional
+
+from django.core.cache import caches
+from django.core.cache.backends.redis import RedisCache
+
+logger = logging.getLogger(__name__)
+
+# Samples kept per pipeline
+SAMPLE_WINDOW = 1000
+
+_SAMPLES_KEY = 'timings:samples:{pipeline}'
+
+_local_samples = defaultdict(lambda: deque(maxlen=SAMPLE_WINDOW))
+_local_lock = threading.Lock()
+
+
+class StageTimer:
+    """
+    Accumulates wall-clock milliseconds per named stage.
+
+    Args:
+        pipeline: Name reported in logs and aggregates (e.g. ``ats.analyze``).
+        context:  Extra fields attached to the log record (ids, sizes...).
+    """
+
+    def __init__(self, pipeline: str, **context):
+        self.pipeline = pipeline
+        self.context = context
+        self._stages: Dict[str, float] = {}
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time the enclosed block; repeated stages are summed."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            self._stages[name] = self._stages.get(name, 0.0) + elapsed
+
+    @property
+    def timings(self) -> Dict[str, float]:
+        """Milliseconds per stage so far, plus ``total`` since creation."""
+        timings = {name: round(ms, 2) for name, ms in self._stages.items()}
+        timings['total'] = round((time.perf_counter() - self._started) * 1000, 2)
+        return timings
+
+    def finish(self, record: bool = True) -> Dict[str, float]:
+        """Log the timings (and add them to the sample window) and return them."""
+        timings = self.timings
+        logger.info(
+            "stage timings %s: %s",
+            self.pipeline,
+            " ".join(f"{name}={ms}ms" for name, ms in timings.items()),
+            extra={'pipeline': self.pipeline, 'timings': timings, **self.context},
+        )
+        if record:
+            record_sample(self.pipeline, timings)
+        return timings
+
+
+def _redis_list(pipeline: str):
+    """Return ``(client, key)`` of the shared sample list, or None without Redis."""
+    cache = caches['default']
+    if not isinstance(cache, RedisCache):
+        return None
+    key = cache.make_and_validate_key(_SAMPLES_KEY.format(pipeline=pipeline))
+    return cache._cache.get_client(key, write=True), key
+
+
+def record_sample(pipeline: str, timings: Dict[str, float]) -> None:
+    """Append *timings* to the pipeline's sample window (best effort)."""
+    try:
+        shared = _redis_list(pipeline)
+        if shared is None:
+            with _local_lock:
+                _local_samples[pipeline].append(timings)
+            return
+        client, key = shared
+        with client.pipeline() as pipe:
+            pipe.rpush(key, json.dumps(timings))
+            pipe.ltrim(key, -SAMPLE_WINDOW, -1)
+            pipe.execute()
+    except Exception:
+        # Timing must never break the request
+        pass
+
+
+def recent_samples(pipeline: str) -> List[Dict[str, float]]:
+    """Return the sampled timings recorded for *pipeline*."""
+    try:
+        shared = _redis_list(pipeline)
+        if shared is None:
+            with _local_lock:
+                return list(_local_samples.get(pipeline, ()))
+        client, key = shared
+        return [json.loads(sample) for sample in client.lrange(key, 0, -1)]
+    except Exception:
+        return []
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def stage_percentiles(samples: Iterable[Optional[dict]]) -> Dict[str, dict]:
+    """Aggregate timing dicts into ``{stage: {count, p50, p95, p99}}`` (ms)."""
+    per_stage: Dict[str, List[float]] = {}
+    for timings in samples:
+        if not isinstance(timings, dict):
+            continue
+        for name, ms in timings.items():
+            try:
+                per_stage.setdefault(name, []).append(float(ms))
+            except (TypeError, ValueError):
+                continue
+
+    result = {}
+    for name, values in per_stage.items():
+        values.sort()
+        result[name] = {
+            'count': len(values),
+            'p50': round(_percentile(values, 50), 2),
+            'p95': round(_percentile(values, 95), 2),
+            'p99': round(_percentile(values, 99), 2),
+        }
+    return result
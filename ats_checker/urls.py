@@ -1,10 +1,11 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import ATSScoreViewSet, JobTitleSynonymViewSet
+from .views import ATSScoreViewSet, ATSScoreBatchViewSet, JobTitleSynonymViewSet
 
 # Create a router and register our viewsets with it
 router = DefaultRouter()
 router.register(r'scores', ATSScoreViewSet)
+router.register(r'batches', ATSScoreBatchViewSet)
 router.register(r'job-title-synonyms', JobTitleSynonymViewSet)
 
 # The API URLs are now determined automatically by the router
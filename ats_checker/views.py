@@ -1,17 +1,18 @@
-from rest_framework import viewsets, permissions, status
+from rest_framework import mixins, viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
-from .models import ATSScore, KeywordMatch, OptimizationSuggestion, JobTitleSynonym
+from .models import ATSScore, ATSScoreBatch, KeywordMatch, OptimizationSuggestion, JobTitleSynonym
 from .serializers import (
     ATSScoreSerializer, ATSScoreCreateSerializer, KeywordMatchSerializer,
+    ATSScoreBatchSerializer, ATSScoreBatchDetailSerializer, ATSScoreBatchCreateSerializer,
     OptimizationSuggestionSerializer, JobTitleSynonymSerializer, ApplySuggestionSerializer,
     ResumeOptimizeSerializer, OptimizedResumeSerializer,
 )
-from .services import apply_suggestion
+from .services import apply_suggestion, clone_cached_result
 from .optimizer import ResumeOptimizer
 from .jd_parser import JobDescriptionParser
-from .tasks import analyze_resume_task
+from .tasks import analyze_batch_task, analyze_resume_task
 from resumes.models import Resume, ResumeVersion
 from users.permissions import IsAdminUser, IsOwnerOrAdmin
 
@@ -43,15 +44,26 @@ class ATSScoreViewSet(viewsets.ModelViewSet):
         return ATSScoreSerializer
     
     def perform_create(self, serializer):
-        """Create an ATS score and trigger async analysis."""
+        """
+        Create an ATS score and trigger async analysis, unless an identical
+        submission has already been analysed.
+        """
         ats_score = serializer.save()
-        analyze_resume_task.delay(ats_score.id)
+        self.cache_hit = clone_cached_result(ats_score)
+        if not self.cache_hit:
+            analyze_resume_task.delay(ats_score.id)
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         self.perform_create(serializer)
         headers = self.get_success_headers(serializer.data)
+        if self.cache_hit:
+            return Response(
+                ATSScoreSerializer(serializer.instance, context=self.get_serializer_context()).data,
+                status=status.HTTP_201_CREATED,
+                headers=headers,
+            )
         return Response(
             {"message": "ATS analysis started. Results will be available shortly.", "id": serializer.instance.id},
             status=status.HTTP_202_ACCEPTED,
@@ -198,6 +210,59 @@ class ATSScoreViewSet(viewsets.ModelViewSet):
         return Response({"language": detect_lang(text)})
 
 
+class ATSScoreBatchViewSet(mixins.CreateModelMixin,
+                           mixins.ListModelMixin,
+                           mixins.RetrieveModelMixin,
+                           viewsets.GenericViewSet):
+    """
+    ViewSet for scoring one job description against many resumes.
+
+    ``POST`` starts a batch (up to ``ATS_BATCH_MAX_RESUMES`` resumes);
+    ``GET /<id>/`` returns its status and the resumes ranked by score.
+    """
+    queryset = ATSScoreBatch.objects.all()
+    serializer_class = ATSScoreBatchSerializer
+    permission_classes = [permissions.IsAuthenticated, IsOwnerOrAdmin]
+
+    def get_queryset(self):
+        """
+        Filter batches based on user permissions.
+        """
+        if getattr(self, 'swagger_fake_view', False):
+            return ATSScoreBatch.objects.none()
+        if self.request.user.role == 'admin':
+            return ATSScoreBatch.objects.all()
+        return ATSScoreBatch.objects.filter(user=self.request.user)
+
+    def get_serializer_class(self):
+        """
+        Return appropriate serializer class based on the action.
+        """
+        if self.action == 'create':
+            return ATSScoreBatchCreateSerializer
+        if self.action == 'retrieve':
+            return ATSScoreBatchDetailSerializer
+        return ATSScoreBatchSerializer
+
+    def perform_create(self, serializer):
+        """Create the batch and trigger async scoring."""
+        batch = serializer.save()
+        analyze_batch_task.delay(batch.id)
+
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        self.perform_create(serializer)
+        return Response(
+            {
+                "message": "Batch ATS analysis started. Results will be available shortly.",
+                "id": serializer.instance.id,
+                "resume_count": len(serializer.instance.resume_ids),
+            },
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+
 class JobTitleSynonymViewSet(viewsets.ModelViewSet):
     """
     ViewSet for JobTitleSynonym model.
@@ -10,5 +10,11 @@ python -m spacy download en_core_web_lg
 # Download NLTK data for synonym expansion
 python -c "import nltk; nltk.download('wordnet'); nltk.download('omw-1.4'); nltk.download('averaged_perceptron_tagger'); nltk.download('punkt')"
 
+# Precompile WordNet into a memory-mapped lookup file for the workers
+python manage.py build_wordnet_lookup
+
+# Save the spaCy pipelines with the skills EntityRuler so workers skip rebuilding it
+python manage.py build_nlp_model_cache
+
 python manage.py migrate
 python manage.py collectstatic --no-input
@@ -2,6 +2,8 @@ import pytest
 from rest_framework.test import APIClient
 from django.contrib.auth import get_user_model
 
+from resumeit.query_inspector import collect_reports
+
 User = get_user_model()
 
 
@@ -46,3 +48,27 @@ def authenticated_client(api_client, sample_user):
 def admin_client(api_client, admin_user):
     api_client.force_authenticate(user=admin_user)
     return api_client
+
+
+@pytest.fixture
+def query_inspector(settings):
+    """
+    Record the queries of every request made by the test.
+
+    Requests over their view's ``query_budget`` raise
+    ``QueryBudgetExceeded``; repeated query shapes (likely N+1) fail the
+    test at teardown unless ``reports.allow_duplicates`` is set.
+    """
+    settings.QUERY_INSPECTOR_ENABLED = True
+    settings.QUERY_INSPECTOR_ENFORCE = True
+
+    class Reports(list):
+        allow_duplicates = False
+
+    collected = Reports()
+    with collect_reports(collected):
+        yield collected
+
+    offenders = [report for report in collected if report.duplicates]
+    if offenders and not collected.allow_duplicates:
+        pytest.fail('Repeated queries detected:\n' + '\n'.join(r.format() for r in offenders))
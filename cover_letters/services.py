@@ -14,6 +14,8 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from ats_checker.nlp import SpaCyKeywordExtractor, SynonymExpander, TextAnalyzer
 from ats_checker.nlp.keyword_extractor import _load_spacy_model
+from ats_checker.nlp.pipeline_profiles import run_profile
+from ats_checker.timing import StageTimer
 
 logger = logging.getLogger(__name__)
 
@@ -172,6 +174,9 @@ class CoverLetterGenerator:
         # Tone config
         self._tc = _TONE_CONFIG[self.tone]
 
+        # Milliseconds per step of the last generate() call
+        self.timings: Dict[str, float] = {}
+
     # ==================================================================
     # Public API
     # ==================================================================
@@ -191,16 +196,22 @@ class CoverLetterGenerator:
         Returns:
             The full cover letter as a single string.
         """
+        timer = StageTimer("cover_letter.generate", tone=self.tone)
+
         # Step 1 & 2: keyword extraction
-        job_keywords = self.extractor.extract_keywords(self.job_description)
-        resume_text = self._resume_content_to_text()
-        resume_keywords = self.extractor.extract_keywords(resume_text)
+        with timer.stage("extract_job_keywords"):
+            job_keywords = self.extractor.extract_keywords(self.job_description)
+        with timer.stage("extract_resume_keywords"):
+            resume_text = self._resume_content_to_text()
+            resume_keywords = self.extractor.extract_keywords(resume_text)
 
         # Step 3: skill matching
-        matched_skills = self._match_skills(job_keywords, resume_keywords)
+        with timer.stage("match_skills"):
+            matched_skills = self._match_skills(job_keywords, resume_keywords)
 
         # Step 4: relevant experience
-        relevant_experience = self._extract_relevant_experience(job_keywords)
+        with timer.stage("relevant_experience"):
+            relevant_experience = self._extract_relevant_experience(job_keywords)
 
         # Step 5: user info
         user_info = self._get_user_info()
@@ -209,11 +220,12 @@ class CoverLetterGenerator:
         domain = self._infer_domain(job_keywords)
 
         # Step 7: build paragraphs
-        greeting = random.choice(self._tc["greetings"])
-        opening = self._build_opening(user_info, domain)
-        skills_paragraph = self._build_skills_paragraph(matched_skills, job_keywords)
-        experience_paragraph = self._build_experience_paragraph(relevant_experience, job_keywords)
-        closing = self._build_closing()
+        with timer.stage("build_paragraphs"):
+            greeting = random.choice(self._tc["greetings"])
+            opening = self._build_opening(user_info, domain)
+            skills_paragraph = self._build_skills_paragraph(matched_skills, job_keywords)
+            experience_paragraph = self._build_experience_paragraph(relevant_experience, job_keywords)
+            closing = self._build_closing()
 
         # Assemble the user's name for the sign-off
         user_name = user_info.get("name", "")
@@ -234,6 +246,7 @@ class CoverLetterGenerator:
             user_name,
         ]
 
+        self.timings = timer.finish()
         return "\n".join(parts)
 
     # ==================================================================
@@ -424,6 +437,14 @@ class CoverLetterGenerator:
 
         entries = self._normalize_experience(experience_section)
 
+        # The job description is parsed once, not once per entry
+        job_doc = None
+        if self.nlp and len(self.job_description) > 20:
+            try:
+                job_doc = run_profile(self.nlp, self.job_description[:1000], "similarity")
+            except Exception:
+                pass
+
         for entry in entries:
             title = entry.get("title", entry.get("position", entry.get("role", "")))
             company = entry.get("company", entry.get("organization", entry.get("employer", "")))
@@ -447,10 +468,9 @@ class CoverLetterGenerator:
 
             # Semantic similarity boost if spaCy is available
             similarity_score = 0.0
-            if self.nlp and len(self.job_description) > 20 and len(entry_text) > 20:
+            if job_doc is not None and len(entry_text) > 20:
                 try:
-                    job_doc = self.nlp(self.job_description[:1000])
-                    entry_doc = self.nlp(entry_text[:500])
+                    entry_doc = run_profile(self.nlp, entry_text[:500], "similarity")
                     similarity_score = job_doc.similarity(entry_doc)
                 except Exception:
                     pass
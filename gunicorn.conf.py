@@ -0,0 +1,45 @@
+"""
+Gunicorn configuration.
+
+The application -- including the spaCy model and the other NLP data -- is
+loaded once in the master process and shared copy-on-write with the
+workers; see ``ats_checker.nlp.warmup``.
+"""
+
+import os
+import shutil
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = int(os.getenv('WEB_CONCURRENCY', '2'))
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '120'))
+preload_app = True
+
+
+def on_starting(server):
+    # Metrics files from a previous run would be aggregated into this one
+    multiproc_dir = os.getenv('PROMETHEUS_MULTIPROC_DIR')
+    if multiproc_dir:
+        shutil.rmtree(multiproc_dir, ignore_errors=True)
+        os.makedirs(multiproc_dir, exist_ok=True)
+
+
+def when_ready(server):
+    from ats_checker.nlp.warmup import warmup
+
+    status = warmup()
+    server.log.info(
+        "NLP stack loaded in %ss (model=%s)", status['load_seconds'], status['spacy_model']
+    )
+
+
+def post_fork(server, worker):
+    from ats_checker.nlp.warmup import after_fork
+
+    after_fork()
+
+
+def child_exit(server, worker):
+    if os.getenv('PROMETHEUS_MULTIPROC_DIR'):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
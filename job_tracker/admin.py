@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import JobApplication, InterviewRound, ApplicationNote
+from .models import JobApplication, JobApplicationStats, InterviewRound, ApplicationNote
 
 
 class InterviewRoundInline(admin.TabularInline):
@@ -100,3 +100,19 @@ class ApplicationNoteAdmin(admin.ModelAdmin):
     def short_note(self, obj):
         """Return a truncated version of the note for list display."""
         return obj.note[:80] + '...' if len(obj.note) > 80 else obj.note
+
+
+@admin.register(JobApplicationStats)
+class JobApplicationStatsAdmin(admin.ModelAdmin):
+    """
+    Read-only view of the materialized per-user statistics.
+    """
+    list_display = ('user', 'total', 'applied_count', 'responded_count', 'updated_at')
+    search_fields = ('user__username', 'user__email')
+    raw_id_fields = ('user',)
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
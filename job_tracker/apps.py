@@ -5,3 +5,6 @@ class JobTrackerConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'job_tracker'
     verbose_name = 'Job Application Tracker'
+
+    def ready(self):
+        import job_tracker.signals  # noqa
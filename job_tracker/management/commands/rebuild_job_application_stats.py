@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from job_tracker.stats import rebuild_all_stats, rebuild_user_stats
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the materialized per-user job application statistics from scratch'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--user', type=int, action='append', default=None,
+            help='Only rebuild the stats of this user id (repeatable)',
+        )
+
+    def handle(self, *args, **options):
+        if options['user']:
+            for user_id in options['user']:
+                rebuild_user_stats(user_id)
+            count = len(options['user'])
+        else:
+            count = rebuild_all_stats()
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt job application stats for {count} user(s).'))
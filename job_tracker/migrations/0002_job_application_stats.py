@@ -0,0 +1,123 @@
+# Generated by Django 5.2.18 on 2026-10-17 23:35
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def _bump(counts, key):
+    counts[key] = counts.get(key, 0) + 1
+
+
+def backfill_stats(apps, schema_editor):
+    # Self-contained copy of job_tracker.stats.rebuild_all_stats as of this
+    # migration, so later changes there cannot alter it
+    JobApplication = apps.get_model("job_tracker", "JobApplication")
+    JobApplicationStats = apps.get_model("job_tracker", "JobApplicationStats")
+
+    by_user = {}
+    rows = (
+        JobApplication.objects.order_by()
+        .values_list(
+            "user_id", "status", "priority", "work_type", "source",
+            "applied_date", "response_date",
+        )
+        .iterator(chunk_size=1000)
+    )
+    for user_id, status, priority, work_type, source, applied_date, response_date in rows:
+        stats = by_user.get(user_id)
+        if stats is None:
+            stats = by_user[user_id] = JobApplicationStats(
+                user_id=user_id, by_status={}, by_priority={}, by_work_type={}, by_source={},
+            )
+        stats.total += 1
+        _bump(stats.by_status, status)
+        _bump(stats.by_priority, priority)
+        _bump(stats.by_work_type, work_type)
+        if source:
+            _bump(stats.by_source, source)
+        if applied_date is not None:
+            stats.applied_count += 1
+            if response_date is not None:
+                stats.responded_count += 1
+                stats.response_days_total += (response_date - applied_date).days
+
+    JobApplicationStats.objects.all().delete()
+    JobApplicationStats.objects.bulk_create(by_user.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("job_tracker", "0001_initial"),
+        ("users", "0005_user_admin_notes_user_deleted_at_user_industry_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="JobApplicationStats",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="job_application_stats",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="User",
+                    ),
+                ),
+                ("total", models.PositiveIntegerField(default=0, verbose_name="Total")),
+                (
+                    "by_status",
+                    models.JSONField(
+                        blank=True, default=dict, verbose_name="By Status"
+                    ),
+                ),
+                (
+                    "by_priority",
+                    models.JSONField(
+                        blank=True, default=dict, verbose_name="By Priority"
+                    ),
+                ),
+                (
+                    "by_work_type",
+                    models.JSONField(
+                        blank=True, default=dict, verbose_name="By Work Type"
+                    ),
+                ),
+                (
+                    "by_source",
+                    models.JSONField(
+                        blank=True, default=dict, verbose_name="By Source"
+                    ),
+                ),
+                (
+                    "applied_count",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Applied Count"
+                    ),
+                ),
+                (
+                    "responded_count",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Responded Count"
+                    ),
+                ),
+                (
+                    "response_days_total",
+                    models.IntegerField(default=0, verbose_name="Response Days Total"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="Updated At"),
+                ),
+            ],
+            options={
+                "verbose_name": "Job Application Stats",
+                "verbose_name_plural": "Job Application Stats",
+            },
+        ),
+        migrations.RunPython(backfill_stats, migrations.RunPython.noop),
+    ]
@@ -194,3 +194,36 @@ class ApplicationNote(models.Model):
 
     def __str__(self):
         return f"Note on {self.application.job_title} - {self.created_at:%Y-%m-%d %H:%M}"
+
+
+class JobApplicationStats(models.Model):
+    """
+    Per-user summary of job applications, read by the ``statistics`` action.
+
+    Kept current by the ``JobApplication`` save/delete signals (see
+    ``job_tracker.stats``); ``manage.py rebuild_job_application_stats``
+    recomputes it from scratch after bulk updates that bypass signals.
+    """
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='job_application_stats',
+        verbose_name=_('User'),
+    )
+    total = models.PositiveIntegerField(_('Total'), default=0)
+    by_status = models.JSONField(_('By Status'), default=dict, blank=True)
+    by_priority = models.JSONField(_('By Priority'), default=dict, blank=True)
+    by_work_type = models.JSONField(_('By Work Type'), default=dict, blank=True)
+    by_source = models.JSONField(_('By Source'), default=dict, blank=True)
+    applied_count = models.PositiveIntegerField(_('Applied Count'), default=0)
+    responded_count = models.PositiveIntegerField(_('Responded Count'), default=0)
+    response_days_total = models.IntegerField(_('Response Days Total'), default=0)
+    updated_at = models.DateTimeField(_('Updated At'), auto_now=True)
+
+    class Meta:
+        verbose_name = _('Job Application Stats')
+        verbose_name_plural = _('Job Application Stats')
+
+    def __str__(self):
+        return f"Job application stats for {self.user}"
@@ -47,7 +47,7 @@ class JobApplicationListSerializer(serializers.ModelSerializer):
     status_display = serializers.CharField(source='get_status_display', read_only=True)
     priority_display = serializers.CharField(source='get_priority_display', read_only=True)
     work_type_display = serializers.CharField(source='get_work_type_display', read_only=True)
-    interview_count = serializers.IntegerField(source='interview_rounds.count', read_only=True)
+    interview_count = serializers.SerializerMethodField()
 
     class Meta:
         model = JobApplication
@@ -70,6 +70,12 @@ class JobApplicationListSerializer(serializers.ModelSerializer):
         )
         read_only_fields = ('id', 'created_at', 'updated_at')
 
+    def get_interview_count(self, obj):
+        # Annotated by JobApplicationViewSet to avoid one COUNT per card
+        if hasattr(obj, 'interview_count'):
+            return obj.interview_count
+        return obj.interview_rounds.count()
+
 
 class JobApplicationDetailSerializer(serializers.ModelSerializer):
     """
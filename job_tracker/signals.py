@@ -0,0 +1,46 @@
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from .models import JobApplication
+from .stats import TRACKED_FIELDS, snapshot, stored_snapshot, update_stats
+
+
+# update_fields may name the owner as either "user" or "user_id"
+_TRACKED_NAMES = frozenset(TRACKED_FIELDS) | {'user'}
+
+
+def _touches_stats(update_fields):
+    return update_fields is None or not _TRACKED_NAMES.isdisjoint(update_fields)
+
+
+@receiver(pre_save, sender=JobApplication)
+def remember_application_stats(sender, instance, raw=False, update_fields=None, **kwargs):
+    """
+    Capture the saved values an application is about to overwrite.
+
+    Callers that already know them (the ``move`` action) set
+    ``instance._stats_previous`` to skip the lookup.
+    """
+    if raw or not _touches_stats(update_fields):
+        return
+    if hasattr(instance, '_stats_previous'):
+        return
+    instance._stats_previous = stored_snapshot(instance.pk) if instance.pk else None
+
+
+@receiver(post_save, sender=JobApplication)
+def update_application_stats_on_save(sender, instance, raw=False, **kwargs):
+    """Move the application's contribution to the owner's stats row."""
+    if not hasattr(instance, '_stats_previous'):
+        return
+    previous = instance.__dict__.pop('_stats_previous')
+    current = snapshot(instance) or stored_snapshot(instance.pk)
+    update_stats(previous, current)
+
+
+@receiver(post_delete, sender=JobApplication)
+def update_application_stats_on_delete(sender, instance, **kwargs):
+    """Remove a deleted application from the owner's stats row."""
+    previous = snapshot(instance)
+    if previous is not None:
+        update_stats(previous, None)
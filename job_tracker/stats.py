@@ -0,0 +1,201 @@
+"""
+Materialized per-user job application statistics.
+
+``JobApplicationStats`` holds one row per user with the counters behind the
+``statistics`` endpoint.  Each ``JobApplication`` contributes a fixed set of
+values (status, priority, work type, source, applied/response dates); the
+signals in ``job_tracker.signals`` subtract an application's previous
+contribution and add its new one on every save, and subtract it on delete,
+so reading the statistics is a single-row fetch.
+
+Writes that bypass model signals (``QuerySet.update``, raw SQL, fixtures)
+leave the rows stale; ``manage.py rebuild_job_application_stats`` rebuilds
+them from the applications table.
+"""
+
+from django.db import transaction
+
+from .models import JobApplication, JobApplicationStats
+
+# JobApplication fields that feed the statistics
+TRACKED_FIELDS = (
+    'user_id', 'status', 'priority', 'work_type', 'source',
+    'applied_date', 'response_date',
+)
+
+TOP_SOURCES = 10
+
+_COUNTERS = ('total', 'applied_count', 'responded_count', 'response_days_total')
+_BREAKDOWNS = ('by_status', 'by_priority', 'by_work_type', 'by_source')
+
+
+def snapshot(application):
+    """
+    Return the tracked values of *application* as a tuple, or None when
+    some of them were deferred and would cost a query to read.
+    """
+    if application.get_deferred_fields().intersection(TRACKED_FIELDS):
+        return None
+    values = {name: getattr(application, name) for name in TRACKED_FIELDS}
+    for name in ('applied_date', 'response_date'):
+        values[name] = JobApplication._meta.get_field(name).to_python(values[name])
+    return tuple(values.values())
+
+
+def stored_snapshot(pk):
+    """Return the tracked values of the saved application *pk*, or None."""
+    return (
+        JobApplication.objects.filter(pk=pk)
+        .values_list(*TRACKED_FIELDS)
+        .first()
+    )
+
+
+def _bump(counts, key, sign):
+    count = counts.get(key, 0) + sign
+    if count:
+        counts[key] = count
+    else:
+        counts.pop(key, None)
+
+
+def apply_contribution(stats, values, sign):
+    """Add (``sign=1``) or remove (``sign=-1``) one application's values."""
+    _, status, priority, work_type, source, applied_date, response_date = values
+    stats.total += sign
+    _bump(stats.by_status, status, sign)
+    _bump(stats.by_priority, priority, sign)
+    _bump(stats.by_work_type, work_type, sign)
+    if source:
+        _bump(stats.by_source, source, sign)
+    if applied_date is not None:
+        stats.applied_count += sign
+        if response_date is not None:
+            stats.responded_count += sign
+            stats.response_days_total += sign * (response_date - applied_date).days
+
+
+def _empty_stats(user_id):
+    return JobApplicationStats(
+        user_id=user_id, by_status={}, by_priority={}, by_work_type={}, by_source={},
+    )
+
+
+def update_stats(old, new):
+    """
+    Move an application's contribution from *old* to *new* values.
+
+    Either side may be None (creation / deletion).  Rows are locked while
+    they are updated so concurrent saves for the same user do not lose
+    increments.  A user without a stats row yet is rebuilt from scratch
+    instead, which already reflects the saved application.
+    """
+    if old == new:
+        return
+    changes = {}
+    if old is not None:
+        changes.setdefault(old[0], []).append((old, -1))
+    if new is not None:
+        changes.setdefault(new[0], []).append((new, 1))
+
+    with transaction.atomic():
+        for user_id, contributions in changes.items():
+            stats = JobApplicationStats.objects.select_for_update().filter(user_id=user_id).first()
+            if stats is None:
+                if any(sign > 0 for _, sign in contributions):
+                    rebuild_user_stats(user_id)
+                # Otherwise nothing to maintain (e.g. the user is being deleted)
+                continue
+            for values, sign in contributions:
+                apply_contribution(stats, values, sign)
+            stats.save()
+
+
+def _fold(rows):
+    """Build unsaved stats rows from an iterable of tracked-value tuples."""
+    by_user = {}
+    for values in rows:
+        stats = by_user.get(values[0])
+        if stats is None:
+            stats = by_user[values[0]] = _empty_stats(values[0])
+        apply_contribution(stats, values, 1)
+    return by_user
+
+
+def rebuild_user_stats(user_id):
+    """Recompute and store the stats row of one user; returns it."""
+    rows = JobApplication.objects.filter(user_id=user_id).values_list(*TRACKED_FIELDS)
+    stats = _fold(rows).get(user_id) or _empty_stats(user_id)
+    defaults = {name: getattr(stats, name) for name in _COUNTERS + _BREAKDOWNS}
+    stats, _ = JobApplicationStats.objects.update_or_create(user_id=user_id, defaults=defaults)
+    return stats
+
+
+def rebuild_all_stats(batch_size=1000):
+    """
+    Replace every stats row with one computed from the applications table.
+    Returns the number of rows written.
+    """
+    rows = (
+        JobApplication.objects.order_by()
+        .values_list(*TRACKED_FIELDS)
+        .iterator(chunk_size=batch_size)
+    )
+    built = _fold(rows)
+    with transaction.atomic():
+        JobApplicationStats.objects.all().delete()
+        JobApplicationStats.objects.bulk_create(built.values(), batch_size=batch_size)
+    return len(built)
+
+
+def get_user_stats(user):
+    """Return the stats row for *user*, building it on first use."""
+    stats = JobApplicationStats.objects.filter(user=user).first()
+    if stats is None:
+        stats = rebuild_user_stats(user.pk)
+    return stats
+
+
+def _filled(counts, choices):
+    result = dict(counts)
+    for key, _ in choices:
+        result.setdefault(key, 0)
+    return result
+
+
+def stats_payload(rows):
+    """Combine one or more stats rows into the ``statistics`` response."""
+    merged = _empty_stats(None)
+    for stats in rows:
+        for name in _COUNTERS:
+            setattr(merged, name, getattr(merged, name) + getattr(stats, name))
+        for name in _BREAKDOWNS:
+            target = getattr(merged, name)
+            for key, count in getattr(stats, name).items():
+                _bump(target, key, count)
+
+    response_rate = (
+        round((merged.responded_count / merged.applied_count) * 100, 1)
+        if merged.applied_count > 0
+        else 0.0
+    )
+    avg_days_to_response = (
+        round(merged.response_days_total / merged.responded_count, 1)
+        if merged.responded_count > 0
+        else None
+    )
+    top_sources = sorted(merged.by_source.items(), key=lambda item: (-item[1], item[0]))
+    return {
+        'total': merged.total,
+        'by_status': _filled(merged.by_status, JobApplication.STATUS_CHOICES),
+        'by_priority': _filled(merged.by_priority, JobApplication.PRIORITY_CHOICES),
+        'by_work_type': _filled(merged.by_work_type, JobApplication.WORK_TYPE_CHOICES),
+        'response_rate': response_rate,
+        'avg_days_to_response': avg_days_to_response,
+        'applied_count': merged.applied_count,
+        'responded_count': merged.responded_count,
+        'top_sources': [
+            {'source': source, 'count': count}
+            for source, count in top_sources[:TOP_SOURCES]
+        ],
+    }
@@ -0,0 +1,44 @@
+import pytest
+
+from .models import ApplicationNote, InterviewRound, JobApplication
+
+
+@pytest.fixture
+def applications(sample_user):
+    statuses = ['wishlist', 'applied', 'interview', 'offer', 'rejected']
+    created = []
+    for i in range(15):
+        application = JobApplication.objects.create(
+            user=sample_user,
+            job_title=f'Engineer {i}',
+            company_name=f'Company {i}',
+            status=statuses[i % len(statuses)],
+        )
+        InterviewRound.objects.create(application=application, round_number=1)
+        ApplicationNote.objects.create(application=application, note='Followed up')
+        created.append(application)
+    return created
+
+
+def _assert_within_budget(reports, action):
+    report = next(report for report in reports if report.action == action)
+    assert report.budget is not None, f'{action} declares no query budget'
+    assert report.count <= report.budget
+
+
+def test_list_within_query_budget(authenticated_client, applications, query_inspector):
+    response = authenticated_client.get('/api/v1/job-tracker/')
+    assert response.status_code == 200
+    _assert_within_budget(query_inspector, 'list')
+
+
+def test_retrieve_within_query_budget(authenticated_client, applications, query_inspector):
+    response = authenticated_client.get(f'/api/v1/job-tracker/{applications[0].pk}/')
+    assert response.status_code == 200
+    _assert_within_budget(query_inspector, 'retrieve')
+
+
+def test_kanban_within_query_budget(authenticated_client, applications, query_inspector):
+    response = authenticated_client.get('/api/v1/job-tracker/kanban/')
+    assert response.status_code == 200
+    _assert_within_budget(query_inspector, 'kanban')
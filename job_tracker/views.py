@@ -1,10 +1,12 @@
 from rest_framework import viewsets, permissions, status, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from django.db.models import Count, Q, Avg, F
+from rest_framework.exceptions import ValidationError
+from django.db.models import Count, Q, F, Window
+from django.db.models.functions import RowNumber
 from django.utils import timezone
 
-from .models import JobApplication, InterviewRound, ApplicationNote
+from .models import JobApplication, JobApplicationStats, InterviewRound, ApplicationNote
 from .serializers import (
     JobApplicationListSerializer,
     JobApplicationDetailSerializer,
@@ -13,6 +15,7 @@ from .serializers import (
     ApplicationNoteSerializer,
     KanbanSerializer,
 )
+from .stats import get_user_stats, snapshot, stats_payload
 from users.permissions import IsOwnerOrAdmin
 
 
@@ -31,6 +34,8 @@ class JobApplicationViewSet(viewsets.ModelViewSet):
     filter_backends = [filters.OrderingFilter]
     ordering_fields = ['created_at', 'updated_at', 'applied_date', 'company_name', 'job_title', 'priority']
     ordering = ['-updated_at']
+    # Enforced by the query_inspector test fixture (resumeit.query_inspector)
+    query_budget = {'list': 2, 'retrieve': 3, 'kanban': 1}
 
     def get_queryset(self):
         """
@@ -87,6 +92,15 @@ class JobApplicationViewSet(viewsets.ModelViewSet):
                 | Q(location__icontains=search)
             )
 
+        if self.action == 'list':
+            # Read by JobApplicationListSerializer.interview_count
+            queryset = queryset.annotate(interview_count=Count('interview_rounds'))
+        elif self.action == 'retrieve':
+            # user for IsOwnerOrAdmin; the rest for JobApplicationDetailSerializer
+            queryset = queryset.select_related('user', 'resume').prefetch_related(
+                'interview_rounds', 'activity_notes',
+            )
+
         return queryset
 
     def get_serializer_class(self):
@@ -114,29 +128,80 @@ class JobApplicationViewSet(viewsets.ModelViewSet):
         Return all applications grouped by status for the Kanban board.
         Each column contains a list of applications serialized with the
         list serializer.
+
+        The board is read with a single query: a window function numbers
+        the cards within each status column and counts the column, so
+        optional per-column pagination happens in the database:
+          ?limit=20    at most 20 cards per column (``count`` stays the
+                       column total)
+          ?offset=20   skip the first 20 cards of every column
         """
+        limit = self._non_negative_int_param('limit')
+        offset = self._non_negative_int_param('offset') or 0
+
         if request.user.role == 'admin':
             queryset = JobApplication.objects.all()
         else:
             queryset = JobApplication.objects.filter(user=request.user)
 
+        by_status = Window(Count('id'), partition_by=[F('status')])
+        position = Window(
+            RowNumber(), partition_by=[F('status')], order_by=F('updated_at').desc()
+        )
+        cards = (
+            queryset
+            .annotate(
+                interview_count=Count('interview_rounds'),
+                column_count=by_status,
+                position=position,
+            )
+            .order_by('status', '-updated_at')
+        )
+        if offset:
+            cards = cards.filter(position__gt=offset)
+        if limit is not None:
+            cards = cards.filter(position__lte=offset + limit)
+
+        grouped = {status_key: [] for status_key, _ in JobApplication.STATUS_CHOICES}
+        counts = {}
+        for application in cards:
+            grouped.setdefault(application.status, []).append(application)
+            counts[application.status] = application.column_count
+
+        if offset or limit == 0:
+            # Columns whose cards were all paged out still need a total
+            counts = dict(
+                queryset.values_list('status').annotate(count=Count('id')).order_by()
+            )
+
         # Preserve the defined column order from STATUS_CHOICES
         columns = []
         for status_key, status_label in JobApplication.STATUS_CHOICES:
-            apps_in_column = queryset.filter(status=status_key).order_by('-updated_at')
             columns.append({
                 'status': status_key,
                 'status_display': status_label,
-                'count': apps_in_column.count(),
-                'applications': JobApplicationListSerializer(apps_in_column, many=True).data,
+                'count': counts.get(status_key, 0),
+                'applications': JobApplicationListSerializer(grouped[status_key], many=True).data,
             })
 
         data = {
             'columns': columns,
-            'total': queryset.count(),
+            'total': sum(counts.values()),
         }
         return Response(data)
 
+    def _non_negative_int_param(self, name):
+        value = self.request.query_params.get(name)
+        if value in (None, ''):
+            return None
+        try:
+            value = int(value)
+        except ValueError:
+            raise ValidationError({name: 'Must be a non-negative integer.'})
+        if value < 0:
+            raise ValidationError({name: 'Must be a non-negative integer.'})
+        return value
+
     @action(detail=True, methods=['post'], url_path='move')
     def move(self, request, pk=None):
         """
@@ -162,6 +227,9 @@ class JobApplicationViewSet(viewsets.ModelViewSet):
             )
 
         old_status = application.status
+        # The loaded values are what the save replaces; spares the stats
+        # signal a lookup
+        application._stats_previous = snapshot(application)
         application.status = new_status
 
         # Auto-fill applied_date when first moving to 'applied'
@@ -193,82 +261,15 @@ class JobApplicationViewSet(viewsets.ModelViewSet):
         - by_priority: count per priority
         - response_rate: percentage of applications that received a response
         - avg_days_to_response: average calendar days between applied_date and response_date
+
+        Served from the materialized ``JobApplicationStats`` rows (see
+        ``job_tracker.stats``).
         """
         if request.user.role == 'admin':
-            queryset = JobApplication.objects.all()
-        else:
-            queryset = JobApplication.objects.filter(user=request.user)
-
-        total = queryset.count()
-
-        # Count by status
-        by_status = {}
-        status_counts = queryset.values('status').annotate(count=Count('id'))
-        for entry in status_counts:
-            by_status[entry['status']] = entry['count']
-
-        # Ensure all statuses appear even if count is 0
-        for status_key, _ in JobApplication.STATUS_CHOICES:
-            by_status.setdefault(status_key, 0)
-
-        # Count by priority
-        by_priority = {}
-        priority_counts = queryset.values('priority').annotate(count=Count('id'))
-        for entry in priority_counts:
-            by_priority[entry['priority']] = entry['count']
-        for priority_key, _ in JobApplication.PRIORITY_CHOICES:
-            by_priority.setdefault(priority_key, 0)
-
-        # Response rate: applications that have a response_date out of those that have applied_date
-        applied_qs = queryset.filter(applied_date__isnull=False)
-        applied_count = applied_qs.count()
-        responded_count = applied_qs.filter(response_date__isnull=False).count()
-        response_rate = (
-            round((responded_count / applied_count) * 100, 1)
-            if applied_count > 0
-            else 0.0
-        )
-
-        # Average days to response
-        avg_days_to_response = (
-            applied_qs.filter(response_date__isnull=False)
-            .annotate(days=F('response_date') - F('applied_date'))
-            .aggregate(avg_days=Avg('days'))
-        )
-        avg_days_val = avg_days_to_response.get('avg_days')
-        if avg_days_val is not None:
-            # avg_days_val is a timedelta when using date subtraction
-            avg_days_result = round(avg_days_val.days if hasattr(avg_days_val, 'days') else float(avg_days_val), 1)
+            rows = JobApplicationStats.objects.all()
         else:
-            avg_days_result = None
-
-        # Count by work type
-        by_work_type = {}
-        work_type_counts = queryset.values('work_type').annotate(count=Count('id'))
-        for entry in work_type_counts:
-            by_work_type[entry['work_type']] = entry['count']
-        for wt_key, _ in JobApplication.WORK_TYPE_CHOICES:
-            by_work_type.setdefault(wt_key, 0)
-
-        # Top sources
-        top_sources = list(
-            queryset.exclude(source='')
-            .values('source')
-            .annotate(count=Count('id'))
-            .order_by('-count')[:10]
-        )
-
-        data = {
-            'total': total,
-            'by_status': by_status,
-            'by_priority': by_priority,
-            'by_work_type': by_work_type,
-            'response_rate': response_rate,
-            'avg_days_to_response': avg_days_result,
-            'applied_count': applied_count,
-            'responded_count': responded_count,
-            'top_sources': top_sources,
-        }
+            rows = [get_user_stats(request.user)]
+        data = stats_payload(rows)
         return Response(data)
 
     @action(detail=True, methods=['post'], url_path='add-note')
@@ -1,8 +1,28 @@
 import os
 from celery import Celery
+from celery.signals import worker_init, worker_process_init
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'resumeit.settings')
 
 app = Celery('resumeit')
 app.config_from_object('django.conf:settings', namespace='CELERY')
 app.autodiscover_tasks()
+
+
+@worker_init.connect
+def warmup_nlp(**kwargs):
+    """Load the NLP stack in the main worker process, before the pool forks."""
+    import django
+
+    django.setup()
+
+    from ats_checker.nlp.warmup import warmup
+
+    warmup()
+
+
+@worker_process_init.connect
+def init_worker_process(**kwargs):
+    from ats_checker.nlp.warmup import after_fork
+
+    after_fork()
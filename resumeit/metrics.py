@@ -0,0 +1,102 @@
+"""
+Prometheus metrics for HTTP requests.
+
+Recorded by ``RequestLoggingMiddleware`` and exposed in the Prometheus
+text format on ``/metrics`` to the addresses listed in
+``METRICS_ALLOWED_IPS``.  Requests are labelled by the resolved URL name
+(``view_name``, e.g. ``atsscore-optimize-resume``) rather than the raw
+path, so ids in URLs do not explode the label cardinality.
+
+``prometheus_client`` is optional: without it requests are only logged and
+``/metrics`` answers 503.
+
+Under gunicorn each worker keeps its own counters.  Set
+``PROMETHEUS_MULTIPROC_DIR`` to an empty, writable directory to have the
+workers write them to shared memory-mapped files that ``/metrics``
+aggregates (``gunicorn.conf.py`` prepares the directory and cleans up
+after dead workers).
+"""
+
+import ipaddress
+import os
+
+from django.conf import settings
+from django.http import HttpResponse, JsonResponse
+
+try:
+    import prometheus_client
+    from prometheus_client import CollectorRegistry, Histogram, multiprocess
+except ImportError:  # pragma: no cover - optional dependency
+    prometheus_client = None
+
+MULTIPROCESS = bool(os.environ.get('PROMETHEUS_MULTIPROC_DIR'))
+
+if prometheus_client is not None:
+    REQUEST_LATENCY = Histogram(
+        'http_request_duration_seconds',
+        'Request latency by route',
+        ['method', 'route', 'status'],
+        buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+    )
+    RESPONSE_SIZE = Histogram(
+        'http_response_size_bytes',
+        'Response body size by route',
+        ['route'],
+        buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304),
+    )
+    DB_QUERIES = Histogram(
+        'http_db_queries',
+        'Database queries per request by route',
+        ['route'],
+        buckets=(0, 1, 2, 5, 10, 20, 50, 100, 250),
+    )
+    DB_QUERY_DURATION = Histogram(
+        'http_db_query_duration_seconds',
+        'Total database time per request by route',
+        ['route'],
+        buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5),
+    )
+
+
+def observe_request(method, route, status, duration, size, query_count, query_time):
+    """Record one request; a no-op without ``prometheus_client``."""
+    if prometheus_client is None:
+        return
+    REQUEST_LATENCY.labels(method, route, str(status)).observe(duration)
+    if size is not None:
+        RESPONSE_SIZE.labels(route).observe(size)
+    DB_QUERIES.labels(route).observe(query_count)
+    DB_QUERY_DURATION.labels(route).observe(query_time)
+
+
+def _client_allowed(request):
+    remote_addr = request.META.get('REMOTE_ADDR', '')
+    try:
+        address = ipaddress.ip_address(remote_addr)
+    except ValueError:
+        return False
+    for allowed in getattr(settings, 'METRICS_ALLOWED_IPS', []):
+        try:
+            if address in ipaddress.ip_network(allowed, strict=False):
+                return True
+        except ValueError:
+            continue
+    return False
+
+
+def metrics_view(request):
+    """Expose the collected metrics in the Prometheus text format."""
+    if not _client_allowed(request):
+        return JsonResponse({'error': 'Forbidden'}, status=403)
+    if prometheus_client is None:
+        return JsonResponse({'error': 'prometheus_client is not installed'}, status=503)
+
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = prometheus_client.REGISTRY
+    return HttpResponse(
+        prometheus_client.generate_latest(registry),
+        content_type=prometheus_client.CONTENT_TYPE_LATEST,
+    )
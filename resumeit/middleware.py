@@ -1,25 +1,68 @@
 import logging
 import time
+from contextlib import ExitStack
+
+from django.db import connections
+
+from resumeit.metrics import observe_request
 
 logger = logging.getLogger('resumeit.request')
 
 
+class _QueryCounter:
+    """``execute_wrapper`` that counts queries and sums their duration."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+
+
 class RequestLoggingMiddleware:
-    """Logs method, path, status code, and response time for every request."""
+    """
+    Logs method, path, status code, and response time for every request,
+    and records latency, response size and DB usage per route
+    (see ``resumeit.metrics``).
+    """
 
     def __init__(self, get_response):
         self.get_response = get_response
 
     def __call__(self, request):
-        start_time = time.time()
-        response = self.get_response(request)
-        duration = time.time() - start_time
+        queries = _QueryCounter()
+        start_time = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(queries))
+            response = self.get_response(request)
+        duration = time.perf_counter() - start_time
 
+        match = getattr(request, 'resolver_match', None)
+        route = (match.view_name if match else None) or 'unmatched'
+        size = None if response.streaming else len(response.content)
+
+        observe_request(
+            request.method, route, response.status_code, duration,
+            size, queries.count, queries.duration,
+        )
         logger.info(
             '%s %s %s %.2fms',
             request.method,
             request.get_full_path(),
             response.status_code,
             duration * 1000,
+            extra={
+                'route': route,
+                'db_queries': queries.count,
+                'db_time_ms': round(queries.duration * 1000, 2),
+                'response_bytes': size,
+            },
         )
         return response
@@ -0,0 +1,232 @@
+"""
+Per-request SQL inspection: N+1 detection and query budgets.
+
+When ``QUERY_INSPECTOR_ENABLED`` is set, ``QueryInspectorMiddleware``
+records every query a request runs and builds a ``QueryReport``:
+
+- Queries are grouped by *shape* -- the SQL with literals and parameter
+  lists collapsed -- and a shape repeated at least
+  ``QUERY_INSPECTOR_DUPLICATE_THRESHOLD`` times is flagged as a likely
+  N+1.  Each query is attributed to the DRF serializer field being
+  rendered when it ran (e.g. ``JobApplicationListSerializer.interview_count``)
+  or else to the innermost project frame.
+- Views declare a budget with a ``query_budget`` attribute, either an int
+  or a dict keyed by viewset action::
+
+      class JobApplicationViewSet(viewsets.ModelViewSet):
+          query_budget = {'list': 4, 'kanban': 3}
+
+  Exceeding it logs a warning, or raises ``QueryBudgetExceeded`` when
+  ``QUERY_INSPECTOR_ENFORCE`` is set (the ``query_inspector`` pytest
+  fixture turns both on).
+
+Streaming responses are reported once their body has been consumed, so
+queries run while streaming count towards the budget.
+"""
+
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import ExitStack, contextmanager
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger('resumeit.queries')
+
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PARAM_LIST_RE = re.compile(r"\(\s*(?:%s|\?)(?:\s*,\s*(?:%s|\?))*\s*\)")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+_PROJECT_ROOT = str(settings.BASE_DIR)
+# Frames of the query wrappers themselves are never the culprit
+_WRAPPER_FILES = {__file__, os.path.join(os.path.dirname(__file__), 'middleware.py')}
+
+_collectors = []
+_collectors_lock = threading.Lock()
+
+
+class QueryBudgetExceeded(AssertionError):
+    """A view ran more queries than its declared ``query_budget``."""
+
+
+def normalize_sql(sql):
+    """Return the shape of *sql*: literals and IN-lists collapsed."""
+    shape = _STRING_RE.sub('?', sql)
+    shape = _NUMBER_RE.sub('?', shape)
+    shape = _PARAM_LIST_RE.sub('(...)', shape)
+    return _WHITESPACE_RE.sub(' ', shape).strip()
+
+
+def _attribute(frame):
+    """Name the serializer field (or project code) that issued a query."""
+    fallback = None
+    while frame is not None:
+        code = frame.f_code
+        filename = code.co_filename
+        if code.co_name == 'to_representation' and filename.endswith(
+            os.path.join('rest_framework', 'serializers.py')
+        ):
+            field = frame.f_locals.get('field')
+            owner = frame.f_locals.get('self')
+            if field is not None and owner is not None:
+                return f'{type(owner).__name__}.{field.field_name}'
+        if (
+            fallback is None
+            and filename.startswith(_PROJECT_ROOT)
+            and 'site-packages' not in filename
+            and filename not in _WRAPPER_FILES
+        ):
+            fallback = f'{os.path.relpath(filename, _PROJECT_ROOT)}:{frame.f_lineno} ({code.co_name})'
+        frame = frame.f_back
+    return fallback or 'unknown'
+
+
+class QueryRecorder:
+    """``execute_wrapper`` collecting (shape, duration, source) per query."""
+
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append((
+                normalize_sql(sql),
+                time.perf_counter() - start,
+                _attribute(sys._getframe(1)),
+            ))
+
+    @contextmanager
+    def record(self):
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(self))
+            yield self
+
+
+class QueryReport:
+    """Queries run by one request, grouped by shape."""
+
+    def __init__(self, method, path, view, action, budget, queries, threshold):
+        self.method = method
+        self.path = path
+        self.view = view
+        self.action = action
+        self.budget = budget
+        self.count = len(queries)
+        self.duration = sum(duration for _, duration, _ in queries)
+
+        by_shape = defaultdict(list)
+        for shape, _, source in queries:
+            by_shape[shape].append(source)
+        self.duplicates = [
+            {'sql': shape, 'count': len(sources), 'sources': Counter(sources).most_common()}
+            for shape, sources in by_shape.items()
+            if len(sources) >= threshold
+        ]
+        self.duplicates.sort(key=lambda dup: -dup['count'])
+
+    @property
+    def over_budget(self):
+        return self.budget is not None and self.count > self.budget
+
+    def format(self):
+        target = f'{self.view}.{self.action}' if self.action else self.view
+        lines = [
+            f'{self.method} {self.path} ({target}): {self.count} queries '
+            f'in {self.duration * 1000:.1f}ms'
+            + (f', budget {self.budget}' if self.budget is not None else '')
+        ]
+        for dup in self.duplicates:
+            sources = ', '.join(f'{source} x{n}' for source, n in dup['sources'])
+            lines.append(f"  repeated {dup['count']}x from {sources}: {dup['sql'][:200]}")
+        return '\n'.join(lines)
+
+
+def _view_budget(request):
+    """Return (view name, action, budget) for the resolved view."""
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return None, None, None
+    func = match.func
+    view_class = getattr(func, 'cls', None) or getattr(func, 'view_class', None)
+    actions = getattr(func, 'actions', None) or {}
+    action = actions.get(request.method.lower())
+    name = view_class.__name__ if view_class else match.view_name
+
+    budget = getattr(view_class, 'query_budget', None)
+    if isinstance(budget, dict):
+        budget = budget.get(action) if action else budget.get(request.method.lower())
+    return name, action, budget
+
+
+@contextmanager
+def collect_reports(reports=None):
+    """Collect the ``QueryReport`` of every request made inside the block."""
+    reports = [] if reports is None else reports
+    with _collectors_lock:
+        _collectors.append(reports)
+    try:
+        yield reports
+    finally:
+        with _collectors_lock:
+            _collectors.remove(reports)
+
+
+class QueryInspectorMiddleware:
+    """Record queries per request; see the module docstring."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not getattr(settings, 'QUERY_INSPECTOR_ENABLED', False):
+            return self.get_response(request)
+
+        recorder = QueryRecorder()
+        with recorder.record():
+            response = self.get_response(request)
+
+        if response.streaming:
+            # The body (e.g. a streamed CSV export) queries as it is consumed
+            response.streaming_content = self._record_stream(
+                request, response, recorder, response.streaming_content,
+            )
+            return response
+        self._report(request, response, recorder)
+        return response
+
+    def _record_stream(self, request, response, recorder, content):
+        iterator = iter(content)
+        while True:
+            with recorder.record():
+                chunk = next(iterator, None)
+            if chunk is None:
+                break
+            yield chunk
+        self._report(request, response, recorder)
+
+    def _report(self, request, response, recorder):
+        view, action, budget = _view_budget(request)
+        report = QueryReport(
+            request.method, request.path, view, action, budget, recorder.queries,
+            getattr(settings, 'QUERY_INSPECTOR_DUPLICATE_THRESHOLD', 3),
+        )
+        with _collectors_lock:
+            for reports in _collectors:
+                reports.append(report)
+
+        if settings.DEBUG and not response.streaming:
+            response['X-Query-Count'] = str(report.count)
+        if report.duplicates or report.over_budget:
+            logger.warning('Query inspector:\n%s', report.format())
+        if report.over_budget and getattr(settings, 'QUERY_INSPECTOR_ENFORCE', False):
+            raise QueryBudgetExceeded(report.format())
@@ -74,6 +74,7 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
     'resumeit.middleware.RequestLoggingMiddleware',
+    'resumeit.query_inspector.QueryInspectorMiddleware',
 ]
 
 ROOT_URLCONF = 'resumeit.urls'
@@ -228,6 +229,13 @@ CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
 CELERY_TASK_ALWAYS_EAGER = DEBUG  # Run tasks synchronously in development
 
+# Batch ATS scoring (one job description against many resumes).
+# n_process > 1 forks spaCy workers; keep it at 1 under Celery's prefork
+# pool, whose daemonic children cannot start processes of their own.
+ATS_BATCH_MAX_RESUMES = int(os.getenv('ATS_BATCH_MAX_RESUMES', 200))
+ATS_BATCH_SIZE = int(os.getenv('ATS_BATCH_SIZE', 32))
+ATS_BATCH_N_PROCESS = int(os.getenv('ATS_BATCH_N_PROCESS', 1))
+
 # Payment gateway settings
 RAZORPAY_KEY_ID = os.getenv('RAZORPAY_KEY_ID', '')
 RAZORPAY_KEY_SECRET = os.getenv('RAZORPAY_KEY_SECRET', '')
@@ -253,6 +261,65 @@ CACHES = {
 CACHE_TTL_TEMPLATES = 900      # 15 minutes
 CACHE_TTL_PLANS = 3600         # 1 hour
 CACHE_TTL_ANALYTICS = 300      # 5 minutes
+CACHE_TTL_NLP_KEYWORDS = 3600  # 1 hour
+CACHE_TTL_ATS_RESULTS = int(os.getenv('CACHE_TTL_ATS_RESULTS', 86400))  # 1 day
+
+# NLP keyword cache: per-process LRU byte budget, optionally shared
+# between web and Celery workers through CACHES['default']
+NLP_KEYWORD_CACHE_MAX_BYTES = int(os.getenv('NLP_KEYWORD_CACHE_MAX_BYTES', 32 * 1024 * 1024))
+NLP_KEYWORD_CACHE_SHARED = os.getenv('NLP_KEYWORD_CACHE_SHARED', 'False') == 'True'
+
+# Precompiled WordNet lookup file (python manage.py build_wordnet_lookup).
+# When missing, SynonymExpander falls back to the NLTK corpus reader.
+WORDNET_LOOKUP_PATH = os.getenv('WORDNET_LOOKUP_PATH') or str(BASE_DIR / 'nlp_data' / 'wordnet_lookup.tsv')
+
+# spaCy pipelines with the skills EntityRuler, saved per SKILLS_DB hash
+# (python manage.py build_nlp_model_cache)
+NLP_MODEL_CACHE_DIR = os.getenv('NLP_MODEL_CACHE_DIR') or str(BASE_DIR / 'nlp_data' / 'models')
+
+# Rendered PDF/DOCX exports kept in default_storage under EXPORT_CACHE_PREFIX,
+# pruned least-recently-downloaded first above EXPORT_CACHE_MAX_BYTES.
+# EXPORT_PRERENDER renders them in Celery whenever a resume version is saved.
+EXPORT_CACHE_PREFIX = os.getenv('EXPORT_CACHE_PREFIX', 'exports')
+EXPORT_CACHE_MAX_BYTES = int(os.getenv('EXPORT_CACHE_MAX_BYTES', 512 * 1024 * 1024))
+EXPORT_PRERENDER = os.getenv('EXPORT_PRERENDER', 'True') == 'True'
+EXPORT_PRERENDER_FORMATS = [
+    fmt.strip() for fmt in os.getenv('EXPORT_PRERENDER_FORMATS', 'pdf,docx').split(',') if fmt.strip()
+]
+
+# PDF rendering runs in a pool of PDF_RENDER_WORKERS processes per web or
+# Celery process (0 renders in-process).  Workers are recycled after
+# MAX_TASKS_PER_CHILD jobs and capped at MEMORY_LIMIT_MB of address space.
+# A render running past PDF_RENDER_TIMEOUT has its worker killed.  Downloads
+# render inline only for documents (content JSON + template HTML/CSS) under
+# EXPORT_SYNC_MAX_CONTENT_BYTES; the rest become background export jobs.
+PDF_RENDER_WORKERS = int(os.getenv('PDF_RENDER_WORKERS', 2))
+PDF_RENDER_MAX_TASKS_PER_CHILD = int(os.getenv('PDF_RENDER_MAX_TASKS_PER_CHILD', 50))
+PDF_RENDER_MEMORY_LIMIT_MB = int(os.getenv('PDF_RENDER_MEMORY_LIMIT_MB', 512))
+PDF_RENDER_TIMEOUT = int(os.getenv('PDF_RENDER_TIMEOUT', 60))
+EXPORT_SYNC_MAX_CONTENT_BYTES = int(os.getenv('EXPORT_SYNC_MAX_CONTENT_BYTES', 20000))
+
+# Full user data exports (ZIP) stream straight to the response for accounts
+# with up to USER_DATA_EXPORT_SYNC_MAX_RECORDS records whose resume PDFs are
+# all cached; the rest are built by Celery into default_storage under
+# USER_DATA_EXPORT_PREFIX and deleted USER_DATA_EXPORT_RETENTION_DAYS after
+# they complete (users.tasks.cleanup_data_exports_task).
+USER_DATA_EXPORT_SYNC_MAX_RECORDS = int(os.getenv('USER_DATA_EXPORT_SYNC_MAX_RECORDS', 500))
+USER_DATA_EXPORT_PREFIX = os.getenv('USER_DATA_EXPORT_PREFIX', 'data-exports')
+USER_DATA_EXPORT_RETENTION_DAYS = int(os.getenv('USER_DATA_EXPORT_RETENTION_DAYS', 7))
+
+# Prometheus /metrics endpoint: client addresses or CIDR ranges allowed
+# to scrape it.  Set PROMETHEUS_MULTIPROC_DIR for multi-worker gunicorn.
+METRICS_ALLOWED_IPS = [
+    ip.strip() for ip in os.getenv('METRICS_ALLOWED_IPS', '127.0.0.1,::1').split(',') if ip.strip()
+]
+
+# Per-request query inspection (N+1 detection and view query budgets).
+# ENFORCE turns budget overruns into errors; the query_inspector pytest
+# fixture enables both.
+QUERY_INSPECTOR_ENABLED = os.getenv('QUERY_INSPECTOR_ENABLED', 'False') == 'True'
+QUERY_INSPECTOR_ENFORCE = os.getenv('QUERY_INSPECTOR_ENFORCE', 'False') == 'True'
+QUERY_INSPECTOR_DUPLICATE_THRESHOLD = int(os.getenv('QUERY_INSPECTOR_DUPLICATE_THRESHOLD', 3))
 
 # Structured logging
 # Use JSON formatter in production if python-json-logger is installed
@@ -15,6 +15,8 @@ from rest_framework_simplejwt.views import (
 from rest_framework.throttling import ScopedRateThrottle
 from django.http import JsonResponse
 
+from resumeit.metrics import metrics_view
+
 
 class ThrottledTokenObtainPairView(TokenObtainPairView):
     throttle_classes = [ScopedRateThrottle]
@@ -52,6 +54,17 @@ def health_check(request):
     return JsonResponse({"status": "healthy", "version": "1.0.0"})
 
 
+def nlp_health_check(request):
+    """Readiness probe: 503 until the NLP stack has been warmed up."""
+    from ats_checker.nlp.warmup import nlp_status
+
+    status = nlp_status()
+    return JsonResponse(
+        {"status": "ready" if status["ready"] else "loading", **status},
+        status=200 if status["ready"] else 503,
+    )
+
+
 # Schema view for API documentation
 schema_view = get_schema_view(
     openapi.Info(
@@ -71,6 +84,7 @@ api_v1_patterns = [
     path('token/', ThrottledTokenObtainPairView.as_view(), name='token_obtain_pair'),
     path('token/refresh/', ThrottledTokenRefreshView.as_view(), name='token_refresh'),
     path('health/', health_check, name='health-check'),
+    path('health/nlp/', nlp_health_check, name='health-check-nlp'),
     path('users/', include('users.urls')),
     path('resumes/', include('resumes.urls')),
     path('templates/', include('templates.urls')),
@@ -85,6 +99,7 @@ api_v1_patterns = [
 urlpatterns = [
     path('', home_view),
     path('admin/', admin.site.urls),
+    path('metrics', metrics_view, name='metrics'),
 
     # API documentation
     path('swagger/', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
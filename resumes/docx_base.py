@@ -0,0 +1,161 @@
+"""
+Prebuilt base document for DOCX exports.
+
+Every export used to start from python-docx's blank template and format
+each run by hand (size, colour, bold), which costs CPU per run and repeats
+the same ``<w:rPr>`` block throughout ``document.xml``.  Instead, a base
+.docx with the page margins and the named styles below is built once per
+process and kept in memory as bytes; each export opens a copy and adds
+paragraphs that only reference a style.
+
+Paragraph styles:  ``Resume Name``, ``Resume Contact``, ``Resume Entry``,
+``Resume Meta``, ``Resume Body``, ``Resume Bullet`` (section titles keep
+the built-in ``Heading 2``).  Character style: ``Resume Label``.
+
+DOCX output is not template-specific today, so all templates share one
+base; bump ``BASE_DOCUMENT_VERSION`` (and ``EXPORT_RENDERER_VERSION``) when
+the styles change.
+"""
+
+import threading
+from io import BytesIO
+
+from docx import Document
+from docx.enum.style import WD_STYLE_TYPE
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml.ns import qn
+from docx.shared import Inches, Pt, RGBColor
+
+BASE_DOCUMENT_VERSION = 1
+
+NAME = "Resume Name"
+CONTACT = "Resume Contact"
+ENTRY = "Resume Entry"
+META = "Resume Meta"
+BODY = "Resume Body"
+BULLET = "Resume Bullet"
+LABEL = "Resume Label"
+SECTION_HEADING = "Heading 2"
+
+_base_bytes = None
+_style_ids = {}
+_base_lock = threading.Lock()
+
+
+def _add_paragraph_style(styles, name, base, size, color=None, bold=None, center=False):
+    style = styles.add_style(name, WD_STYLE_TYPE.PARAGRAPH)
+    style.base_style = styles[base]
+    style.font.size = Pt(size)
+    if color is not None:
+        style.font.color.rgb = color
+    if bold is not None:
+        style.font.bold = bold
+    if center:
+        style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    return style
+
+
+def _prune_styles(doc, used_ids) -> None:
+    """
+    Drop the styles nothing can reference, and the latent style table.
+
+    python-docx's blank template defines ~160 styles and 137 latent ones;
+    every export re-parses them, and they make up most of the package.
+    Kept: *used_ids*, the defaults, and everything they are based on,
+    linked to or followed by.
+    """
+    root = doc.styles.element
+    latent = root.find(qn("w:latentStyles"))
+    if latent is not None:
+        root.remove(latent)
+
+    by_id = {style.get(qn("w:styleId")): style for style in root.findall(qn("w:style"))}
+    keep = set(used_ids)
+    keep.update(
+        style_id for style_id, style in by_id.items() if style.get(qn("w:default")) in ("1", "true")
+    )
+    pending = list(keep)
+    while pending:
+        style = by_id.get(pending.pop())
+        if style is None:
+            continue
+        for tag in ("w:basedOn", "w:link", "w:next"):
+            ref = style.find(qn(tag))
+            if ref is not None and ref.get(qn("w:val")) not in keep:
+                keep.add(ref.get(qn("w:val")))
+                pending.append(ref.get(qn("w:val")))
+
+    for style_id, style in by_id.items():
+        if style_id not in keep:
+            root.remove(style)
+
+
+def build_base_document():
+    """
+    Build the styled, empty base document.  Returns its .docx bytes and
+    the style id of every named style.
+    """
+    doc = Document()
+
+    for section in doc.sections:
+        section.top_margin = Inches(0.6)
+        section.bottom_margin = Inches(0.6)
+        section.left_margin = Inches(0.75)
+        section.right_margin = Inches(0.75)
+
+    styles = doc.styles
+    _add_paragraph_style(styles, NAME, "Title", 22, color=RGBColor(0x1A, 0x1A, 0x2E), center=True)
+    _add_paragraph_style(styles, CONTACT, "Normal", 10, color=RGBColor(0x55, 0x55, 0x55), center=True)
+    _add_paragraph_style(styles, ENTRY, "Normal", 11, bold=True)
+    _add_paragraph_style(styles, META, "Normal", 9, color=RGBColor(0x77, 0x77, 0x77))
+    _add_paragraph_style(styles, BODY, "Normal", 10)
+    _add_paragraph_style(styles, BULLET, "List Bullet", 10)
+
+    label = styles.add_style(LABEL, WD_STYLE_TYPE.CHARACTER)
+    label.font.bold = True
+
+    style_ids = {
+        name: styles[name].style_id
+        for name in (NAME, CONTACT, ENTRY, META, BODY, BULLET, LABEL, SECTION_HEADING)
+    }
+    _prune_styles(doc, set(style_ids.values()))
+    buffer = BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue(), style_ids
+
+
+def get_base_document_bytes() -> bytes:
+    """Return the base document, building it on first use."""
+    global _base_bytes
+    if _base_bytes is None:
+        with _base_lock:
+            if _base_bytes is None:
+                data, style_ids = build_base_document()
+                _style_ids.update(style_ids)
+                _base_bytes = data
+    return _base_bytes
+
+
+def new_document():
+    """Open a fresh copy of the base document."""
+    return Document(BytesIO(get_base_document_bytes()))
+
+
+# python-docx resolves a style given to add_paragraph()/add_run() by
+# scanning every style in styles.xml (to compare it with the default), which
+# dominated export time.  The ids of the base document's styles are known,
+# so they are written to the XML directly.
+
+def add_paragraph(doc, text: str = "", style: str = BODY):
+    """Append a paragraph in the named base-document *style*."""
+    paragraph = doc.add_paragraph(text)
+    paragraph._p.style = _style_ids[style]
+    return paragraph
+
+
+def add_run(paragraph, text: str, style: str = None):
+    """Append a run, optionally in a named character *style*."""
+    run = paragraph.add_run(text)
+    if style is not None:
+        run._r.style = _style_ids[style]
+    return run
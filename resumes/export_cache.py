@@ -0,0 +1,275 @@
+"""
+Content-addressed cache of rendered resume exports.
+
+Rendering a PDF through xhtml2pdf (or a DOCX through python-docx) is the
+slowest thing a download does, and most downloads are of a resume that has
+not changed since the last one.  Rendered bytes are therefore stored in
+``default_storage`` under a key hashing everything that shapes the output:
+
+- ``resume.content`` and ``resume.title`` (the fallback name),
+- the template id and ``updated_at`` (its HTML and CSS),
+- the export format and ``EXPORT_RENDERER_VERSION``.
+
+The key doubles as the HTTP ``ETag``, so an unchanged resume answers
+``If-None-Match`` with 304 without touching storage at all.
+
+Artifacts are rendered ahead of time when a ``ResumeVersion`` is created
+(``prerender_resume_exports_task``), and the least recently downloaded ones
+are pruned once the cache exceeds ``EXPORT_CACHE_MAX_BYTES``
+(``manage.py prune_export_cache`` does the same on demand).
+
+Downloads whose PDF is not cached render inline only for small documents
+(``renders_inline``, decided before rendering starts); anything larger
+becomes an ``ExportJob`` rendered by Celery, which the client polls and
+then downloads, so a slow export never holds a web worker.
+"""
+
+import hashlib
+import json
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models import Sum
+from django.utils import timezone
+from django.utils.http import parse_etags
+
+from .models import ExportArtifact, ExportJob, Resume
+
+logger = logging.getLogger(__name__)
+
+# Bump when ResumeExporter output changes for the same input
+EXPORT_RENDERER_VERSION = 2
+
+EXPORT_FORMATS = {
+    'pdf': 'application/pdf',
+    'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+}
+
+# last_accessed is only rewritten this often, not on every download
+_TOUCH_INTERVAL = timedelta(hours=1)
+
+
+def artifact_key(resume, fmt: str) -> str:
+    """Return the content hash identifying *resume* rendered as *fmt*."""
+    template = resume.template
+    payload = json.dumps(
+        {
+            'content': resume.content or {},
+            'title': resume.title,
+            'template': [template.pk, template.updated_at.isoformat()] if template else None,
+            'format': fmt,
+            'renderer': EXPORT_RENDERER_VERSION,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def etag_for(key: str) -> str:
+    return f'"{key}"'
+
+
+def etag_matches(request, etag: str) -> bool:
+    """True when the request's ``If-None-Match`` covers *etag*."""
+    header = request.META.get('HTTP_IF_NONE_MATCH')
+    if not header:
+        return False
+    candidates = [tag[2:] if tag.startswith('W/') else tag for tag in parse_etags(header)]
+    return '*' in candidates or etag in candidates
+
+
+def _artifact_path(key: str, fmt: str) -> str:
+    prefix = getattr(settings, 'EXPORT_CACHE_PREFIX', 'exports')
+    return f'{prefix}/{fmt}/{key[:2]}/{key}.{fmt}'
+
+
+def render(resume, fmt: str, timeout: float = None) -> bytes:
+    """
+    Render *resume* as *fmt* without the cache.  PDFs go through the
+    renderer pool and may raise ``RenderTimeout`` after *timeout* seconds.
+    """
+    from .export_service import ResumeExporter
+
+    exporter = ResumeExporter(resume)
+    return exporter.export_pdf(timeout=timeout) if fmt == 'pdf' else exporter.export_docx()
+
+
+def get_artifact(resume, fmt: str, key: str = None, timeout: float = None) -> bytes:
+    """Return the exported bytes, from the cache or freshly rendered."""
+    key = key or artifact_key(resume, fmt)
+    data = read_artifact(key)
+    if data is None:
+        data = render(resume, fmt, timeout=timeout)
+        store_artifact(key, fmt, data)
+    return data
+
+
+def open_artifact(key: str):
+    """Return an open storage file for *key*, or None on a miss."""
+    artifact = ExportArtifact.objects.filter(key=key).first()
+    if artifact is None:
+        return None
+    try:
+        fh = default_storage.open(artifact.path, 'rb')
+    except (OSError, ValueError):
+        logger.warning("Export artifact %s is missing from storage", artifact.path)
+        artifact.delete()
+        return None
+
+    now = timezone.now()
+    if now - artifact.last_accessed > _TOUCH_INTERVAL:
+        ExportArtifact.objects.filter(pk=artifact.pk).update(last_accessed=now)
+    return fh
+
+
+def read_artifact(key: str):
+    """Return the cached bytes for *key*, or None on a miss."""
+    fh = open_artifact(key)
+    if fh is None:
+        return None
+    with fh:
+        return fh.read()
+
+
+def store_artifact(key: str, fmt: str, data: bytes) -> None:
+    """Save rendered bytes under *key* and prune the cache if it grew too big."""
+    path = _artifact_path(key, fmt)
+    try:
+        if not default_storage.exists(path):
+            path = default_storage.save(path, ContentFile(data))
+        artifact, created = ExportArtifact.objects.get_or_create(
+            key=key,
+            defaults={
+                'format': fmt,
+                'path': path,
+                'size': len(data),
+                'last_accessed': timezone.now(),
+            },
+        )
+    except Exception:
+        # The download itself must not fail because of the cache
+        logger.warning("Could not cache export artifact %s", key, exc_info=True)
+        return
+    if not created and artifact.path != path:
+        # Another worker stored the same artifact first
+        default_storage.delete(path)
+    if created:
+        prune_export_cache()
+
+
+def prune_export_cache(max_bytes: int = None) -> int:
+    """
+    Delete least recently accessed artifacts until the cache fits in
+    *max_bytes* (``EXPORT_CACHE_MAX_BYTES`` by default).  Returns the
+    number of artifacts removed.
+    """
+    if max_bytes is None:
+        max_bytes = getattr(settings, 'EXPORT_CACHE_MAX_BYTES', 512 * 1024 * 1024)
+    total = ExportArtifact.objects.aggregate(total=Sum('size'))['total'] or 0
+    if total <= max_bytes:
+        return 0
+
+    removed = []
+    for pk, path, size in (
+        ExportArtifact.objects.order_by('last_accessed').values_list('pk', 'path', 'size').iterator()
+    ):
+        if total <= max_bytes:
+            break
+        try:
+            default_storage.delete(path)
+        except OSError:
+            logger.warning("Could not delete export artifact %s", path, exc_info=True)
+        removed.append(pk)
+        total -= size
+    ExportArtifact.objects.filter(pk__in=removed).delete()
+    return len(removed)
+
+
+def prerender_resume_exports(resume_id: int) -> list:
+    """
+    Render and cache every ``EXPORT_PRERENDER_FORMATS`` export of a resume
+    that is not cached yet.  Returns the formats rendered.
+    """
+    resume = (
+        Resume.objects.select_related('template')
+        .filter(pk=resume_id, is_deleted=False)
+        .first()
+    )
+    if resume is None:
+        return []
+
+    rendered = []
+    for fmt in getattr(settings, 'EXPORT_PRERENDER_FORMATS', list(EXPORT_FORMATS)):
+        if fmt not in EXPORT_FORMATS:
+            continue
+        key = artifact_key(resume, fmt)
+        if ExportArtifact.objects.filter(key=key).exists():
+            continue
+        try:
+            store_artifact(key, fmt, render(resume, fmt))
+        except Exception:
+            logger.warning("Could not prerender %s export of resume %s", fmt, resume_id, exc_info=True)
+            continue
+        rendered.append(fmt)
+    return rendered
+
+
+def renders_inline(resume, fmt: str) -> bool:
+    """
+    Whether a cache miss may be rendered inside the request.
+
+    DOCX output is cheap; PDFs are only rendered inline when the resume
+    content (as JSON) plus the template's HTML and CSS -- what xhtml2pdf
+    has to lay out -- stay under ``EXPORT_SYNC_MAX_CONTENT_BYTES``.
+    """
+    if fmt != 'pdf':
+        return True
+    limit = getattr(settings, 'EXPORT_SYNC_MAX_CONTENT_BYTES', 20000)
+    size = len(json.dumps(resume.content or {}, default=str))
+    template = resume.template
+    if template is not None:
+        size += len(template.html_structure or '') + len(template.css_styles or '')
+    return size <= limit
+
+
+def submit_export_job(resume, fmt: str, user):
+    """Create an ``ExportJob`` and queue it for rendering."""
+    from .tasks import render_export_job_task
+
+    job = ExportJob.objects.create(user=user, resume=resume, format=fmt)
+    transaction.on_commit(lambda: render_export_job_task.delay(str(job.pk)))
+    return job
+
+
+def run_export_job(job_id):
+    """Render an export job into the export cache. Called from Celery."""
+    job = ExportJob.objects.select_related('resume__template').filter(pk=job_id).first()
+    if job is None:
+        logger.error("ExportJob with ID %s does not exist", job_id)
+        return None
+    if job.status == 'completed':
+        return job
+
+    job.status = 'processing'
+    job.save(update_fields=['status'])
+    try:
+        key = artifact_key(job.resume, job.format)
+        if not ExportArtifact.objects.filter(key=key).exists():
+            store_artifact(key, job.format, render(job.resume, job.format))
+            if not ExportArtifact.objects.filter(key=key).exists():
+                raise RuntimeError("The rendered export could not be stored.")
+        job.artifact_key = key
+        job.status = 'completed'
+        job.error = ''
+    except Exception as e:
+        logger.error("Export job %s failed: %s", job_id, e, exc_info=True)
+        job.status = 'failed'
+        job.error = str(e)
+    job.completed_at = timezone.now()
+    job.save(update_fields=['status', 'artifact_key', 'error', 'completed_at'])
+    return job
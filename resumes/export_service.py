@@ -2,10 +2,9 @@ import logging
 from io import BytesIO
 from html import escape
 
-from xhtml2pdf import pisa
-from docx import Document
-from docx.shared import Pt, Inches, RGBColor
-from docx.enum.text import WD_ALIGN_PARAGRAPH
+from . import docx_base
+from .pdf_renderer import RenderError, RenderTimeout, render_pdf
+from .render_plan import get_render_plan
 
 logger = logging.getLogger(__name__)
 
@@ -32,97 +31,65 @@ class ResumeExporter:
     # Public API
     # ------------------------------------------------------------------
 
-    def export_pdf(self) -> bytes:
+    def export_pdf(self, timeout: float = None) -> bytes:
         """Export resume as PDF using xhtml2pdf.
 
         Builds HTML from resume content JSON, applies template CSS if available,
-        then converts to PDF. Returns PDF bytes.
+        then converts to PDF in the renderer process pool (see
+        ``pdf_renderer``), waiting at most *timeout* seconds. Returns PDF bytes.
         """
         html = self._build_html()
-        buffer = BytesIO()
-
-        pisa_status = pisa.CreatePDF(html, dest=buffer, encoding="utf-8")
-
-        if pisa_status.err:
+        try:
+            return render_pdf(html, timeout=timeout)
+        except RenderTimeout:
+            raise
+        except RenderError as e:
             logger.error(
                 "PDF generation failed for resume %s: %s",
                 self.resume.id,
-                pisa_status.err,
+                e,
             )
             raise RuntimeError("Failed to generate PDF for the resume.")
 
-        pdf_bytes = buffer.getvalue()
-        buffer.close()
-        return pdf_bytes
-
     def export_docx(self) -> bytes:
         """Export resume as DOCX using python-docx.
 
-        Builds a Word document from resume content JSON.
-        Returns DOCX bytes.
+        Builds a Word document from resume content JSON on a copy of the
+        prebuilt base document (see ``docx_base``), so paragraphs only
+        reference named styles. Returns DOCX bytes.
         """
-        doc = Document()
+        doc = docx_base.new_document()
         content = self.resume.content or {}
 
-        # ---- Page margins ----
-        for section in doc.sections:
-            section.top_margin = Inches(0.6)
-            section.bottom_margin = Inches(0.6)
-            section.left_margin = Inches(0.75)
-            section.right_margin = Inches(0.75)
-
         # ---- Personal / Header ----
         personal = content.get("personal", {})
         name = personal.get("name", self.resume.title or "Untitled Resume")
-
-        name_para = doc.add_heading(name, level=0)
-        name_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        for run in name_para.runs:
-            run.font.size = Pt(22)
-            run.font.color.rgb = RGBColor(0x1A, 0x1A, 0x2E)
+        docx_base.add_paragraph(doc, name, docx_base.NAME)
 
         # Contact line
-        contact_parts = []
-        if personal.get("email"):
-            contact_parts.append(personal["email"])
-        if personal.get("phone"):
-            contact_parts.append(personal["phone"])
-        if personal.get("address"):
-            contact_parts.append(personal["address"])
-        if personal.get("linkedin"):
-            contact_parts.append(personal["linkedin"])
-        if personal.get("website"):
-            contact_parts.append(personal["website"])
-
+        contact_parts = [
+            personal[key]
+            for key in ("email", "phone", "address", "linkedin", "website")
+            if personal.get(key)
+        ]
         if contact_parts:
-            contact_para = doc.add_paragraph(" | ".join(contact_parts))
-            contact_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            for run in contact_para.runs:
-                run.font.size = Pt(10)
-                run.font.color.rgb = RGBColor(0x55, 0x55, 0x55)
+            docx_base.add_paragraph(doc, " | ".join(contact_parts), docx_base.CONTACT)
 
         # Summary / Objective
         summary = personal.get("summary", "")
         if summary:
-            doc.add_heading("Professional Summary", level=2)
-            summary_para = doc.add_paragraph(summary)
-            for run in summary_para.runs:
-                run.font.size = Pt(10)
+            docx_base.add_paragraph(doc, "Professional Summary", docx_base.SECTION_HEADING)
+            docx_base.add_paragraph(doc, summary, docx_base.BODY)
 
         # ---- Experience ----
         experience = content.get("experience", [])
         if experience:
-            doc.add_heading("Work Experience", level=2)
+            docx_base.add_paragraph(doc, "Work Experience", docx_base.SECTION_HEADING)
             for exp in experience:
                 # Position / Company line
-                position = exp.get("position", "")
-                company = exp.get("company", "")
-                header_text = " — ".join(filter(None, [position, company]))
+                header_text = " — ".join(filter(None, [exp.get("position", ""), exp.get("company", "")]))
                 if header_text:
-                    exp_heading = doc.add_paragraph()
-                    run = exp_heading.add_run(header_text)
-                    run.bold = True
-                    run.font.size = Pt(11)
+                    docx_base.add_paragraph(doc, header_text, docx_base.ENTRY)
 
                 # Date / Location line
                 date_parts = []
@@ -134,41 +101,28 @@ class ResumeExporter:
                 if location:
                     date_parts.append(location)
                 if date_parts:
-                    meta_para = doc.add_paragraph(" | ".join(date_parts))
-                    for run in meta_para.runs:
-                        run.font.size = Pt(9)
-                        run.font.color.rgb = RGBColor(0x77, 0x77, 0x77)
+                    docx_base.add_paragraph(doc, " | ".join(date_parts), docx_base.META)
 
                 # Description
                 description = exp.get("description", "")
                 if description:
-                    desc_para = doc.add_paragraph(description)
-                    for run in desc_para.runs:
-                        run.font.size = Pt(10)
+                    docx_base.add_paragraph(doc, description, docx_base.BODY)
 
                 # Achievements as bullet points
                 achievements = exp.get("achievements", [])
                 if isinstance(achievements, list):
                     for achievement in achievements:
-                        bullet = doc.add_paragraph(str(achievement), style="List Bullet")
-                        for run in bullet.runs:
-                            run.font.size = Pt(10)
+                        docx_base.add_paragraph(doc, str(achievement), docx_base.BULLET)
 
         # ---- Education ----
         education = content.get("education", [])
         if education:
-            doc.add_heading("Education", level=2)
+            docx_base.add_paragraph(doc, "Education", docx_base.SECTION_HEADING)
             for edu in education:
-                degree = edu.get("degree", "")
-                field = edu.get("field", "")
-                institution = edu.get("institution", "")
-                degree_text = " in ".join(filter(None, [degree, field]))
-                header_text = " — ".join(filter(None, [degree_text, institution]))
+                degree_text = " in ".join(filter(None, [edu.get("degree", ""), edu.get("field", "")]))
+                header_text = " — ".join(filter(None, [degree_text, edu.get("institution", "")]))
                 if header_text:
-                    edu_heading = doc.add_paragraph()
-                    run = edu_heading.add_run(header_text)
-                    run.bold = True
-                    run.font.size = Pt(11)
+                    docx_base.add_paragraph(doc, header_text, docx_base.ENTRY)
 
                 date_parts = []
                 start = edu.get("start_date", "")
@@ -179,79 +133,51 @@ class ResumeExporter:
                 if gpa:
                     date_parts.append(f"GPA: {gpa}")
                 if date_parts:
-                    meta_para = doc.add_paragraph(" | ".join(date_parts))
-                    for run in meta_para.runs:
-                        run.font.size = Pt(9)
-                        run.font.color.rgb = RGBColor(0x77, 0x77, 0x77)
+                    docx_base.add_paragraph(doc, " | ".join(date_parts), docx_base.META)
 
                 description = edu.get("description", "")
                 if description:
-                    desc_para = doc.add_paragraph(description)
-                    for run in desc_para.runs:
-                        run.font.size = Pt(10)
+                    docx_base.add_paragraph(doc, description, docx_base.BODY)
 
         # ---- Skills ----
         skills = content.get("skills", None)
         if skills:
-            doc.add_heading("Skills", level=2)
+            docx_base.add_paragraph(doc, "Skills", docx_base.SECTION_HEADING)
             if isinstance(skills, list):
-                skills_para = doc.add_paragraph(", ".join(str(s) for s in skills))
-                for run in skills_para.runs:
-                    run.font.size = Pt(10)
+                docx_base.add_paragraph(doc, ", ".join(str(s) for s in skills), docx_base.BODY)
             elif isinstance(skills, dict):
                 for category, items in skills.items():
-                    cat_para = doc.add_paragraph()
-                    cat_run = cat_para.add_run(f"{category}: ")
-                    cat_run.bold = True
-                    cat_run.font.size = Pt(10)
                     if isinstance(items, list):
-                        items_run = cat_para.add_run(", ".join(str(s) for s in items))
-                    else:
-                        items_run = cat_para.add_run(str(items))
-                    items_run.font.size = Pt(10)
+                        items = ", ".join(str(s) for s in items)
+                    self._add_labelled_docx_paragraph(doc, f"{category}: ", str(items))
 
         # ---- Projects ----
         projects = content.get("projects", [])
         if projects:
-            doc.add_heading("Projects", level=2)
+            docx_base.add_paragraph(doc, "Projects", docx_base.SECTION_HEADING)
             for proj in projects:
                 proj_name = proj.get("name", "")
                 if proj_name:
-                    proj_heading = doc.add_paragraph()
-                    run = proj_heading.add_run(proj_name)
-                    run.bold = True
-                    run.font.size = Pt(11)
+                    docx_base.add_paragraph(doc, proj_name, docx_base.ENTRY)
 
                 description = proj.get("description", "")
                 if description:
-                    desc_para = doc.add_paragraph(description)
-                    for run in desc_para.runs:
-                        run.font.size = Pt(10)
+                    docx_base.add_paragraph(doc, description, docx_base.BODY)
 
                 technologies = proj.get("technologies", "")
                 if technologies:
                     if isinstance(technologies, list):
                         technologies = ", ".join(str(t) for t in technologies)
-                    tech_para = doc.add_paragraph()
-                    label_run = tech_para.add_run("Technologies: ")
-                    label_run.bold = True
-                    label_run.font.size = Pt(10)
-                    tech_run = tech_para.add_run(str(technologies))
-                    tech_run.font.size = Pt(10)
+                    self._add_labelled_docx_paragraph(doc, "Technologies: ", str(technologies))
 
                 url = proj.get("url", "")
                 if url:
-                    url_para = doc.add_paragraph()
-                    label_run = url_para.add_run("URL: ")
-                    label_run.bold = True
-                    label_run.font.size = Pt(10)
-                    url_run = url_para.add_run(str(url))
-                    url_run.font.size = Pt(10)
+                    self._add_labelled_docx_paragraph(doc, "URL: ", str(url))
 
         # ---- Certifications ----
         certifications = content.get("certifications", [])
         if certifications:
-            doc.add_heading("Certifications", level=2)
+            docx_base.add_paragraph(doc, "Certifications", docx_base.SECTION_HEADING)
             for cert in certifications:
                 cert_name = cert.get("name", "")
                 issuer = cert.get("issuer", "")
@@ -261,10 +187,7 @@ class ResumeExporter:
                 if issuer:
                     header_text = f"{cert_name} — {issuer}" if cert_name else issuer
                 if header_text:
-                    cert_heading = doc.add_paragraph()
-                    run = cert_heading.add_run(header_text)
-                    run.bold = True
-                    run.font.size = Pt(11)
+                    docx_base.add_paragraph(doc, header_text, docx_base.ENTRY)
 
                 meta_parts = []
                 if cert_date:
@@ -273,10 +196,7 @@ class ResumeExporter:
                 if cert_url:
                     meta_parts.append(cert_url)
                 if meta_parts:
-                    meta_para = doc.add_paragraph(" | ".join(meta_parts))
-                    for run in meta_para.runs:
-                        run.font.size = Pt(9)
-                        run.font.color.rgb = RGBColor(0x77, 0x77, 0x77)
+                    docx_base.add_paragraph(doc, " | ".join(meta_parts), docx_base.META)
 
         # ---- Serialize to bytes ----
         buffer = BytesIO()
@@ -285,6 +205,13 @@ class ResumeExporter:
         buffer.close()
         return docx_bytes
 
+    @staticmethod
+    def _add_labelled_docx_paragraph(doc, label: str, text: str) -> None:
+        """Add a body paragraph starting with a bold ``Resume Label`` run."""
+        paragraph = docx_base.add_paragraph(doc)
+        docx_base.add_run(paragraph, label, docx_base.LABEL)
+        docx_base.add_run(paragraph, text)
+
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
@@ -307,7 +234,7 @@ class ResumeExporter:
 
         # Determine body HTML
         if template and getattr(template, "html_structure", None):
-            body_html = self._render_template_html(template.html_structure, content)
+            body_html = self._render_template_html(template, content)
         else:
             body_html = self._build_default_body(content)
 
@@ -327,50 +254,39 @@ class ResumeExporter:
         )
         return html
 
-    def _render_template_html(self, html_structure: str, content: dict) -> str:
+    def _render_template_html(self, template, content: dict) -> str:
         """Render the template's html_structure by replacing placeholders with
         content values.
 
-        Supports simple ``{{key}}`` and ``{{section.field}}`` placeholders.
-        Unresolved placeholders are replaced with empty strings.
+        Supports simple ``{{key}}`` (personal fields), ``{{section.field}}``
+        and ``{{<section>_section}}`` block placeholders, resolved in that
+        order. Unresolved placeholders are replaced with empty strings.
+        The template is tokenized once and cached (see ``render_plan``).
         """
-        import re
-
-        rendered = html_structure
-
-        # Flatten personal fields for simple {{name}}, {{email}}, etc.
+        plan = get_render_plan(template)
         personal = content.get("personal", {})
-        for key, value in personal.items():
-            placeholder = "{{" + key + "}}"
-            rendered = rendered.replace(placeholder, escape(str(value)))
-
-        # Replace {{section.field}} patterns
-        pattern = re.compile(r"\{\{(\w+)\.(\w+)\}\}")
-        def replacer(match):
-            section_key = match.group(1)
-            field_key = match.group(2)
-            section_data = content.get(section_key, {})
-            if isinstance(section_data, dict):
-                return escape(str(section_data.get(field_key, "")))
+        blocks = {}
+
+        def resolve(slot):
+            if slot.name in personal:
+                return escape(str(personal[slot.name]))
+            if slot.section_field is not None:
+                section_key, field_key = slot.section_field
+                section_data = content.get(section_key, {})
+                if isinstance(section_data, dict):
+                    return escape(str(section_data.get(field_key, "")))
+                return ""
+            if slot.block is not None:
+                if slot.block not in blocks:
+                    section_data = content.get(slot.block)
+                    blocks[slot.block] = (
+                        "" if section_data is None
+                        else self._build_section_html(slot.block, section_data)
+                    )
+                return blocks[slot.block]
             return ""
 
-        rendered = pattern.sub(replacer, rendered)
-
-        # Inject rendered section blocks for list-based sections
-        for section_key in ("education", "experience", "skills", "projects", "certifications"):
-            section_data = content.get(section_key)
-            if section_data is None:
-                continue
-
-            section_html = self._build_section_html(section_key, section_data)
-            # Replace a block placeholder like {{education_section}}
-            block_placeholder = "{{" + section_key + "_section}}"
-            rendered = rendered.replace(block_placeholder, section_html)
-
-        # Remove any remaining unresolved placeholders
-        rendered = re.sub(r"\{\{[^}]+\}\}", "", rendered)
-
-        return rendered
+        return plan.render(resolve)
 
     def _build_default_body(self, content: dict) -> str:
         """Build the full body HTML using the default layout."""
@@ -0,0 +1,147 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import types
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from resumes.models import Resume
+
+_SAMPLE_CONTENT = {
+    "personal": {
+        "name": "Priya Sharma",
+        "email": "priya@example.com",
+        "phone": "+91 98765 43210",
+        "address": "Bengaluru, India",
+        "linkedin": "linkedin.com/in/priyasharma",
+        "summary": "Backend engineer with six years of experience building Python services.",
+    },
+    "experience": [
+        {
+            "company": f"Company {i}",
+            "position": "Senior Software Engineer",
+            "start_date": "2019-01",
+            "end_date": "2023-06",
+            "location": "Remote",
+            "description": "Built and operated payment and notification microservices.",
+            "achievements": [
+                "Cut p95 latency of the checkout API by 40%",
+                "Migrated 30 services to Kubernetes",
+                "Mentored four junior engineers",
+            ],
+        }
+        for i in range(4)
+    ],
+    "education": [
+        {"institution": "IIT Delhi", "degree": "B.Tech", "field": "Computer Science",
+         "start_date": "2011", "end_date": "2015", "gpa": "8.9"},
+    ],
+    "skills": {"Languages": ["Python", "Go", "SQL"], "Platforms": ["AWS", "Kubernetes", "Kafka"]},
+    "projects": [
+        {"name": "resumeit", "description": "Resume builder", "technologies": ["Django", "Celery"],
+         "url": "https://example.com"},
+    ],
+    "certifications": [
+        {"name": "AWS Solutions Architect", "issuer": "Amazon", "date": "2022"},
+    ],
+}
+
+
+def time_export(title, content, docs):
+    """Return ``(docs/s, bytes)`` of ``ResumeExporter.export_docx`` on one resume."""
+    from resumes.export_service import ResumeExporter
+
+    resume = types.SimpleNamespace(id=None, title=title, content=content, template=None)
+    export = ResumeExporter(resume).export_docx
+    # Warm up (builds the base document once) before timing
+    size = len(export())
+    start = time.perf_counter()
+    for _ in range(docs):
+        export()
+    elapsed = time.perf_counter() - start
+    return (docs / elapsed if elapsed else 0.0), size
+
+
+# Run inside a checkout of another revision; only relies on ResumeExporter
+_REF_SCRIPT = """
+import json, sys, time, types
+import django
+django.setup()
+from resumes.export_service import ResumeExporter
+args = json.load(sys.stdin)
+resume = types.SimpleNamespace(id=None, title=args['title'], content=args['content'], template=None)
+export = ResumeExporter(resume).export_docx
+size = len(export())
+start = time.perf_counter()
+for _ in range(args['docs']):
+    export()
+print(json.dumps([args['docs'] / (time.perf_counter() - start), size]))
+"""
+
+
+class Command(BaseCommand):
+    help = (
+        'Measure DOCX export throughput, optionally against a baseline rate '
+        '(--baseline) or the exporter at another git revision (--ref)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--docs', type=int, default=200, help='Documents per run (default 200)')
+        parser.add_argument('--resume', type=int, default=None, help='Benchmark this resume id instead of a sample')
+        parser.add_argument('--baseline', type=float, default=None, help='Baseline throughput in docs/s')
+        parser.add_argument('--ref', default=None, help='Git revision whose exporter is the baseline')
+
+    def handle(self, *args, **options):
+        if options['resume']:
+            resume = Resume.objects.filter(pk=options['resume']).first()
+            if resume is None:
+                raise CommandError(f"Resume {options['resume']} does not exist.")
+            title, content = resume.title, resume.content
+        else:
+            title, content = 'Sample', _SAMPLE_CONTENT
+
+        baseline = options['baseline']
+        if options['ref']:
+            rate, size = self._time_ref(options['ref'], title, content, options['docs'])
+            self.stdout.write(f"  {options['ref']:<14} {rate:8.1f} docs/s  {size:>8} bytes")
+            baseline = rate
+
+        rate, size = time_export(title, content, options['docs'])
+        self.stdout.write(f"  {'current':<14} {rate:8.1f} docs/s  {size:>8} bytes")
+        if baseline:
+            self.stdout.write(self.style.SUCCESS(f"current: {rate / baseline:.2f}x the baseline"))
+
+    def _time_ref(self, ref, title, content, docs):
+        """Time the exporter of *ref* in a temporary git worktree."""
+        base_dir = str(settings.BASE_DIR)
+        with tempfile.TemporaryDirectory() as tmp:
+            checkout = os.path.join(tmp, 'tree')
+            try:
+                subprocess.run(
+                    ['git', 'worktree', 'add', '--detach', checkout, ref],
+                    cwd=base_dir, check=True, capture_output=True, text=True,
+                )
+            except (OSError, subprocess.CalledProcessError) as e:
+                raise CommandError(f"Could not check out {ref}: {getattr(e, 'stderr', e)}")
+            try:
+                result = subprocess.run(
+                    [sys.executable, '-c', _REF_SCRIPT],
+                    cwd=checkout,
+                    input=json.dumps({'title': title, 'content': content, 'docs': docs}),
+                    env={**os.environ, 'DJANGO_SETTINGS_MODULE': os.environ.get(
+                        'DJANGO_SETTINGS_MODULE', 'resumeit.settings')},
+                    capture_output=True, text=True,
+                )
+            finally:
+                subprocess.run(
+                    ['git', 'worktree', 'remove', '--force', checkout],
+                    cwd=base_dir, capture_output=True,
+                )
+        if result.returncode:
+            raise CommandError(f"Benchmark at {ref} failed:\n{result.stderr[-2000:]}")
+        rate, size = json.loads(result.stdout.strip().splitlines()[-1])
+        return rate, size
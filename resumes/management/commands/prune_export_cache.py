@@ -0,0 +1,26 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db.models import Sum
+
+from resumes.export_cache import prune_export_cache
+from resumes.models import ExportArtifact
+
+
+class Command(BaseCommand):
+    help = 'Delete least recently downloaded resume export artifacts above EXPORT_CACHE_MAX_BYTES'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--max-bytes', type=int, default=None,
+            help='Size cap to prune to (default: EXPORT_CACHE_MAX_BYTES; 0 empties the cache)',
+        )
+
+    def handle(self, *args, **options):
+        max_bytes = options['max_bytes']
+        if max_bytes is None:
+            max_bytes = settings.EXPORT_CACHE_MAX_BYTES
+        removed = prune_export_cache(max_bytes)
+        remaining = ExportArtifact.objects.aggregate(total=Sum('size'))['total'] or 0
+        self.stdout.write(self.style.SUCCESS(
+            f'Removed {removed} export artifact(s); {remaining} bytes cached.'
+        ))
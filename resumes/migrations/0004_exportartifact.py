@@ -0,0 +1,46 @@
+# Generated by Django 5.2.18 on 2026-10-17 23:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("resumes", "0003_resume_deleted_at_resume_is_deleted"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ExportArtifact",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "key",
+                    models.CharField(max_length=64, unique=True, verbose_name="Key"),
+                ),
+                ("format", models.CharField(max_length=10, verbose_name="Format")),
+                ("path", models.CharField(max_length=255, verbose_name="Storage Path")),
+                ("size", models.PositiveIntegerField(verbose_name="Size (bytes)")),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="Created At"),
+                ),
+                (
+                    "last_accessed",
+                    models.DateTimeField(db_index=True, verbose_name="Last Accessed"),
+                ),
+            ],
+            options={
+                "verbose_name": "Export Artifact",
+                "verbose_name_plural": "Export Artifacts",
+            },
+        ),
+    ]
@@ -1,3 +1,5 @@
+import uuid
+
 from django.db import models
 from django.contrib.auth import get_user_model
 from django.utils.translation import gettext_lazy as _
@@ -47,6 +49,65 @@ class ResumeVersion(models.Model):
         return f"{self.resume.title} - v{self.version_number}"
 
 
+class ExportArtifact(models.Model):
+    """
+    A rendered PDF/DOCX export kept in ``default_storage``.
+
+    Artifacts are content-addressed (see ``resumes.export_cache``): the key
+    hashes everything that shapes the output, so a changed resume or
+    template simply misses.  ``last_accessed`` drives LRU pruning.
+    """
+    key = models.CharField(_('Key'), max_length=64, unique=True)
+    format = models.CharField(_('Format'), max_length=10)
+    path = models.CharField(_('Storage Path'), max_length=255)
+    size = models.PositiveIntegerField(_('Size (bytes)'))
+    created_at = models.DateTimeField(_('Created At'), auto_now_add=True)
+    last_accessed = models.DateTimeField(_('Last Accessed'), db_index=True)
+
+    class Meta:
+        verbose_name = _('Export Artifact')
+        verbose_name_plural = _('Export Artifacts')
+
+    def __str__(self):
+        return f"{self.format} {self.key[:12]} ({self.size} bytes)"
+
+
+class ExportJob(models.Model):
+    """
+    A background PDF/DOCX export: submitted, rendered by Celery into the
+    export cache, then polled and downloaded by the client.
+    """
+    STATUS_CHOICES = (
+        ('pending', 'Pending'),
+        ('processing', 'Processing'),
+        ('completed', 'Completed'),
+        ('failed', 'Failed'),
+    )
+
+    FORMAT_CHOICES = (
+        ('pdf', 'PDF'),
+        ('docx', 'DOCX'),
+    )
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='export_jobs')
+    resume = models.ForeignKey(Resume, on_delete=models.CASCADE, related_name='export_jobs')
+    format = models.CharField(_('Format'), max_length=10, choices=FORMAT_CHOICES)
+    status = models.CharField(_('Status'), max_length=20, choices=STATUS_CHOICES, default='pending')
+    artifact_key = models.CharField(_('Artifact Key'), max_length=64, blank=True)
+    error = models.TextField(_('Error'), blank=True)
+    created_at = models.DateTimeField(_('Created At'), auto_now_add=True)
+    completed_at = models.DateTimeField(_('Completed At'), null=True, blank=True)
+
+    class Meta:
+        verbose_name = _('Export Job')
+        verbose_name_plural = _('Export Jobs')
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.resume.title} ({self.format}) - {self.status}"
+
+
 class ResumeSection(models.Model):
     """
     Model for defining resume sections.
@@ -0,0 +1,286 @@
+"""
+Isolated PDF rendering in a bounded pool of worker processes.
+
+``pisa.CreatePDF`` is CPU-bound, holds the GIL for the whole render and can
+hang or balloon on pathological ``Template.css_styles``.  Running it in the
+web worker lets one bad template stall a gunicorn worker, so HTML is handed
+to a small pool of dedicated renderer processes instead:
+
+- up to ``PDF_RENDER_WORKERS`` processes per web/Celery process, started
+  on demand (0 renders in-process, e.g. for tests);
+- each render checks out one idle worker and talks to it over its own pipe;
+- each worker is recycled after ``PDF_RENDER_MAX_TASKS_PER_CHILD`` jobs, so
+  leaks in xhtml2pdf/reportlab do not accumulate;
+- each worker's address space is capped at ``PDF_RENDER_MEMORY_LIMIT_MB``
+  (``RLIMIT_AS``) -- a runaway render dies with MemoryError instead of
+  taking the host down;
+- a job not finished within its timeout raises ``RenderTimeout`` and only
+  the worker running it is killed; renders in the other workers carry on,
+  and a replacement worker is started when next needed.
+
+Callers wait for an idle worker up to their own timeout.
+
+This module must stay importable without Django configured: worker
+processes import it to run ``_worker_main``.
+"""
+
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from io import BytesIO
+
+logger = logging.getLogger(__name__)
+
+
+class RenderError(RuntimeError):
+    """The PDF could not be rendered."""
+
+
+class RenderTimeout(RenderError):
+    """The render did not finish in time (or no worker was free)."""
+
+
+def _init_worker(memory_limit):
+    if not memory_limit:
+        return
+    try:
+        import resource
+
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+    except (ImportError, ValueError, OSError):
+        # Not available on this platform
+        pass
+
+
+def _render(html: str) -> bytes:
+    """Convert an HTML document to PDF bytes with xhtml2pdf."""
+    from xhtml2pdf import pisa
+
+    buffer = BytesIO()
+    pisa_status = pisa.CreatePDF(html, dest=buffer, encoding="utf-8")
+    if pisa_status.err:
+        raise RenderError(f"xhtml2pdf reported {pisa_status.err} error(s)")
+    return buffer.getvalue()
+
+
+def _worker_main(conn, memory_limit, render_func):
+    """Renderer process loop: one job in, ``(error kind or None, bytes or message)`` out."""
+    _init_worker(memory_limit)
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, OSError):
+            return
+        if job is None:
+            return
+        try:
+            result = (None, render_func(job))
+        except MemoryError:
+            result = ("render", "The PDF renderer ran out of memory.")
+        except ImportError as e:
+            result = ("import", str(e))
+        except Exception as e:
+            result = ("render", str(e) or e.__class__.__name__)
+        try:
+            conn.send(result)
+        except (EOFError, OSError):
+            return
+
+
+class _Worker:
+    """One renderer process and the parent's end of its pipe."""
+
+    def __init__(self, context, memory_limit, render_func, generation):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main,
+            args=(child_conn, memory_limit, render_func),
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.generation = generation
+        self.tasks = 0
+
+    @property
+    def pid(self):
+        return self.process.pid
+
+    def stop(self, kill=False) -> None:
+        if kill:
+            self.process.kill()
+        else:
+            try:
+                self.conn.send(None)
+            except (EOFError, OSError):
+                self.process.kill()
+        self.conn.close()
+        self.process.join(timeout=1)
+
+
+class PDFRenderPool:
+    """
+    A lazily started, self-healing pool of renderer processes.
+
+    Args:
+        workers:              Renderer processes.
+        max_tasks_per_child:  Jobs before a worker is replaced.
+        memory_limit:         Address-space cap per worker in bytes (0: none).
+        start_method:         multiprocessing start method.
+        render_func:          Picklable ``html -> bytes`` run in the workers.
+    """
+
+    def __init__(self, workers=2, max_tasks_per_child=50, memory_limit=0, start_method=None,
+                 render_func=_render):
+        self.workers = workers
+        self.max_tasks_per_child = max_tasks_per_child
+        self.memory_limit = memory_limit
+        self.render_func = render_func
+        self.start_method = start_method or (
+            "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        )
+        self._lock = threading.Lock()
+        self._idle = queue.LifoQueue()
+        self._started = 0
+        self._generation = 0
+        self._pid = os.getpid()
+
+    def _context(self):
+        context = multiprocessing.get_context(self.start_method)
+        if self.start_method == "forkserver" and self.render_func is _render:
+            context.set_forkserver_preload(["xhtml2pdf.pisa"])
+        return context
+
+    def _reset_after_fork(self) -> None:
+        # Workers (and the lock state) belong to the parent process
+        if self._pid != os.getpid():
+            self._lock = threading.Lock()
+            self._idle = queue.LifoQueue()
+            self._started = 0
+            self._pid = os.getpid()
+
+    def _checkout(self, timeout: float) -> _Worker:
+        """Return an idle worker, starting one while the pool is not full."""
+        self._reset_after_fork()
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+            with self._lock:
+                start = self._started < self.workers
+                if start:
+                    self._started += 1
+                generation = self._generation
+            if start:
+                try:
+                    return _Worker(self._context(), self.memory_limit, self.render_func, generation)
+                except Exception:
+                    with self._lock:
+                        self._started -= 1
+                    raise
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise RenderTimeout("All PDF renderers are busy.")
+            try:
+                # Wake up now and then: a killed worker frees its slot
+                # without ever becoming idle
+                return self._idle.get(timeout=min(remaining, 0.5))
+            except queue.Empty:
+                continue
+
+    def _retire(self, worker: _Worker, kill=False) -> None:
+        with self._lock:
+            if worker.generation == self._generation:
+                self._started -= 1
+        worker.stop(kill=kill)
+
+    def _checkin(self, worker: _Worker) -> None:
+        worker.tasks += 1
+        if worker.generation != self._generation or worker.tasks >= self.max_tasks_per_child:
+            self._retire(worker)
+        else:
+            self._idle.put(worker)
+
+    def render(self, html: str, timeout: float) -> bytes:
+        """Render *html* to PDF, raising ``RenderTimeout`` after *timeout* seconds."""
+        worker = self._checkout(timeout)
+        started = time.monotonic()
+        try:
+            worker.conn.send(html)
+            if not worker.conn.poll(timeout):
+                logger.error(
+                    "PDF render exceeded %ss; killing renderer process %s", timeout, worker.pid,
+                )
+                self._retire(worker, kill=True)
+                raise RenderTimeout(f"PDF rendering took longer than {timeout}s.")
+            error, payload = worker.conn.recv()
+        except (EOFError, OSError):
+            logger.error(
+                "PDF renderer process %s died after %.1fs", worker.pid, time.monotonic() - started,
+            )
+            self._retire(worker, kill=True)
+            raise RenderError("The PDF renderer crashed (the document may be too large).")
+        self._checkin(worker)
+        if error == "import":
+            raise ImportError(payload)
+        if error:
+            raise RenderError(payload)
+        return payload
+
+    def shutdown(self) -> None:
+        """Stop the idle workers; busy ones stop when their job returns."""
+        with self._lock:
+            self._generation += 1
+            self._started = 0
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            worker.stop()
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pdf_render_pool():
+    """Return the process-wide pool, or None when ``PDF_RENDER_WORKERS`` is 0."""
+    global _pool
+    from django.conf import settings
+
+    workers = getattr(settings, "PDF_RENDER_WORKERS", 2)
+    if workers <= 0:
+        return None
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = PDFRenderPool(
+                    workers=workers,
+                    max_tasks_per_child=getattr(settings, "PDF_RENDER_MAX_TASKS_PER_CHILD", 50),
+                    memory_limit=getattr(settings, "PDF_RENDER_MEMORY_LIMIT_MB", 512) * 1024 * 1024,
+                    start_method=getattr(settings, "PDF_RENDER_START_METHOD", None),
+                )
+    return _pool
+
+
+def render_pdf(html: str, timeout: float = None) -> bytes:
+    """
+    Render *html* to PDF in the renderer pool.
+
+    *timeout* defaults to ``PDF_RENDER_TIMEOUT``.  Raises ``RenderTimeout``
+    or ``RenderError``; ``ImportError`` when xhtml2pdf is not installed.
+    """
+    from django.conf import settings
+
+    if timeout is None:
+        timeout = getattr(settings, "PDF_RENDER_TIMEOUT", 60)
+    pool = get_pdf_render_pool()
+    if pool is None:
+        return _render(html)
+    return pool.render(html, timeout)
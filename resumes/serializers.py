@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from .models import Resume, ResumeVersion, ResumeSection
+from .models import Resume, ResumeVersion, ResumeSection, ExportJob
 from users.serializers import UserSerializer
 
 
@@ -22,6 +22,35 @@ class ResumeVersionSerializer(serializers.ModelSerializer):
         read_only_fields = ('id', 'created_at')
 
 
+class ExportJobSerializer(serializers.ModelSerializer):
+    """
+    Serializer for the ExportJob model.
+    """
+    download_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ExportJob
+        fields = (
+            'id', 'resume', 'format', 'status', 'error',
+            'download_url', 'created_at', 'completed_at',
+        )
+        read_only_fields = fields
+
+    def get_download_url(self, obj):
+        if obj.status != 'completed':
+            return None
+        url = f'/api/v1/resumes/export-jobs/{obj.id}/download/'
+        request = self.context.get('request')
+        return request.build_absolute_uri(url) if request else url
+
+
+class ExportJobCreateSerializer(serializers.Serializer):
+    """
+    Serializer for submitting an export job.
+    """
+    format = serializers.ChoiceField(choices=ExportJob.FORMAT_CHOICES)
+
+
 class ResumeSerializer(serializers.ModelSerializer):
     """
     Serializer for the Resume model.
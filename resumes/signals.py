@@ -1,3 +1,5 @@
+from django.conf import settings
+from django.db import transaction
 from django.db.models.signals import post_save, post_delete
 from django.db.models import F
 from django.dispatch import receiver
@@ -57,4 +59,17 @@ def create_user_activity_on_version_creation(sender, instance, created, **kwargs
             user=instance.resume.user,
             activity_type='resume_version_creation',
             description=f'Created version {instance.version_number} of resume: {instance.resume.title}'
-        )
\ No newline at end of file
+        )
+
+
+@receiver(post_save, sender=ResumeVersion)
+def prerender_exports_on_version_creation(sender, instance, created, **kwargs):
+    """
+    Render the new content's exports in the background so the next
+    download is served from the export cache.
+    """
+    if created and getattr(settings, 'EXPORT_PRERENDER', True):
+        from .tasks import prerender_resume_exports_task
+
+        resume_id = instance.resume_id
+        transaction.on_commit(lambda: prerender_resume_exports_task.delay(resume_id))
@@ -0,0 +1,16 @@
+from celery import shared_task
+
+
+@shared_task
+def prerender_resume_exports_task(resume_id):
+    """Render and cache the PDF/DOCX exports of a resume ahead of download."""
+    from .export_cache import prerender_resume_exports
+    return prerender_resume_exports(resume_id)
+
+
+@shared_task
+def render_export_job_task(job_id):
+    """Render a submitted export job into the export cache."""
+    from .export_cache import run_export_job
+    job = run_export_job(job_id)
+    return job.status if job else None
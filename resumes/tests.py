@@ -1,3 +1,104 @@
-from django.test import TestCase
+import threading
+import time
 
-# Create your tests here.
+import pytest
+
+from .models import ExportJob, Resume
+from .pdf_renderer import PDFRenderPool, RenderTimeout
+
+CONTENT = {
+    'personal': {'name': 'Ann Lee', 'email': 'ann@example.com'},
+    'summary': 'Backend engineer.',
+    'experience': [{'title': 'Engineer', 'company': 'Acme', 'description': 'Built APIs.'}],
+}
+
+
+@pytest.fixture
+def export_settings(settings, tmp_path):
+    settings.PDF_RENDER_WORKERS = 0
+    settings.MEDIA_ROOT = str(tmp_path)
+    settings.EXPORT_PRERENDER = False
+    return settings
+
+
+@pytest.fixture
+def resume(sample_user):
+    return Resume.objects.create(user=sample_user, title='Backend CV', content=CONTENT)
+
+
+def test_small_pdf_export_renders_inline(authenticated_client, export_settings, resume):
+    response = authenticated_client.get(f'/api/v1/resumes/{resume.pk}/export_pdf/')
+    assert response.status_code == 200
+    assert response.content.startswith(b'%PDF')
+
+    cached = authenticated_client.get(
+        f'/api/v1/resumes/{resume.pk}/export_pdf/', HTTP_IF_NONE_MATCH=response['ETag'],
+    )
+    assert cached.status_code == 304
+
+
+def test_large_pdf_export_is_queued_and_downloadable(
+    authenticated_client, export_settings, resume, django_capture_on_commit_callbacks,
+):
+    export_settings.EXPORT_SYNC_MAX_CONTENT_BYTES = 10
+    with django_capture_on_commit_callbacks(execute=True):
+        response = authenticated_client.get(f'/api/v1/resumes/{resume.pk}/export_pdf/')
+    assert response.status_code == 202
+    assert response.data['download_url'] is None
+
+    job = authenticated_client.get(f"/api/v1/resumes/export-jobs/{response.data['id']}/")
+    assert job.data['status'] == 'completed'
+
+    download = authenticated_client.get(job.data['download_url'])
+    assert download.status_code == 200
+    assert b''.join(download.streaming_content).startswith(b'%PDF')
+
+
+def test_download_of_unfinished_job_conflicts(authenticated_client, resume, sample_user):
+    job = ExportJob.objects.create(user=sample_user, resume=resume, format='pdf')
+    response = authenticated_client.get(f'/api/v1/resumes/export-jobs/{job.pk}/download/')
+    assert response.status_code == 409
+    assert response.data['status'] == 'pending'
+
+
+def test_download_of_pruned_artifact_is_gone(authenticated_client, resume, sample_user):
+    job = ExportJob.objects.create(
+        user=sample_user, resume=resume, format='pdf', status='completed', artifact_key='0' * 64,
+    )
+    response = authenticated_client.get(f'/api/v1/resumes/export-jobs/{job.pk}/download/')
+    assert response.status_code == 410
+
+
+def test_render_pool_timeout_kills_only_the_hung_worker():
+    # time.sleep stands in for a render: the "html" is the seconds it takes
+    pool = PDFRenderPool(workers=2, render_func=time.sleep)
+    try:
+        results = {}
+
+        def slow_but_healthy():
+            results['healthy'] = pool.render(1.5, timeout=10)
+
+        thread = threading.Thread(target=slow_but_healthy)
+        thread.start()
+        with pytest.raises(RenderTimeout):
+            pool.render(30, timeout=0.5)
+        thread.join()
+
+        assert results == {'healthy': None}
+        assert pool.render(0, timeout=10) is None
+    finally:
+        pool.shutdown()
+
+
+def test_render_pool_recycles_workers():
+    pool = PDFRenderPool(workers=1, max_tasks_per_child=2, render_func=len)
+    try:
+        pids = []
+        for html in ('a', 'bb', 'ccc'):
+            worker = pool._checkout(timeout=10)
+            pids.append(worker.pid)
+            pool._idle.put(worker)
+            assert pool.render(html, timeout=10) == len(html)
+        assert pids[0] == pids[1] != pids[2]
+    finally:
+        pool.shutdown()
@@ -1,9 +1,11 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import ResumeViewSet, ResumeSectionViewSet
+from .views import ResumeViewSet, ResumeSectionViewSet, ExportJobViewSet
 
 # Create a router and register our viewsets with it
 router = DefaultRouter()
+# Before the '' prefix, whose detail route would otherwise match it
+router.register(r'export-jobs', ExportJobViewSet)
 router.register(r'', ResumeViewSet)
 router.register(r'sections', ResumeSectionViewSet)
 
@@ -1,12 +1,13 @@
 from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from django.http import HttpResponse
+from django.http import FileResponse, HttpResponse, HttpResponseNotModified
 from django.utils import timezone
-from .models import Resume, ResumeVersion, ResumeSection
+from .models import Resume, ResumeVersion, ResumeSection, ExportJob
 from .serializers import (
     ResumeSerializer, ResumeCreateSerializer, ResumeUpdateSerializer,
-    ResumeDetailSerializer, ResumeVersionSerializer, ResumeSectionSerializer
+    ResumeDetailSerializer, ResumeVersionSerializer, ResumeSectionSerializer,
+    ExportJobSerializer, ExportJobCreateSerializer,
 )
 from users.permissions import IsOwnerOrAdmin
 
@@ -103,44 +104,79 @@ class ResumeViewSet(viewsets.ModelViewSet):
 
     @action(detail=True, methods=['get'])
     def export_pdf(self, request, pk=None):
-        """Export resume as PDF."""
-        resume = self.get_object()
-        try:
-            from .export_service import ResumeExporter
-            exporter = ResumeExporter(resume)
-            pdf_bytes = exporter.export_pdf()
-            response = HttpResponse(pdf_bytes, content_type='application/pdf')
-            response['Content-Disposition'] = f'attachment; filename="{resume.title}.pdf"'
-            return response
-        except ImportError:
-            return Response(
-                {"error": "PDF export dependencies not installed. Install xhtml2pdf."},
-                status=status.HTTP_501_NOT_IMPLEMENTED
-            )
-        except Exception as e:
-            return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        """Export resume as PDF (cached; honours If-None-Match)."""
+        return self._export(
+            request, 'pdf',
+            "PDF export dependencies not installed. Install xhtml2pdf.",
+        )
 
     @action(detail=True, methods=['get'])
     def export_docx(self, request, pk=None):
-        """Export resume as DOCX."""
+        """Export resume as DOCX (cached; honours If-None-Match)."""
+        return self._export(
+            request, 'docx',
+            "DOCX export dependencies not installed. Install python-docx.",
+        )
+
+    def _export(self, request, fmt, missing_dependency_error):
+        """
+        Serve an export from the artifact cache (see ``export_cache``),
+        answering 304 when the client already has the current version.
+
+        A cache miss is rendered inline only when ``renders_inline`` judges
+        the document cheap; otherwise an export job is queued and 202 is
+        returned with the job to poll.  The choice is made before rendering,
+        so a render is never abandoned and repeated by a job.
+        """
         resume = self.get_object()
         try:
-            from .export_service import ResumeExporter
-            exporter = ResumeExporter(resume)
-            docx_bytes = exporter.export_docx()
-            response = HttpResponse(
-                docx_bytes,
-                content_type='application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+            from .export_cache import (
+                EXPORT_FORMATS, artifact_key, etag_for, etag_matches, get_artifact,
+                read_artifact, renders_inline,
             )
-            response['Content-Disposition'] = f'attachment; filename="{resume.title}.docx"'
-            return response
+            key = artifact_key(resume, fmt)
+            etag = etag_for(key)
+            if etag_matches(request, etag):
+                response = HttpResponseNotModified()
+            else:
+                data = read_artifact(key)
+                if data is None:
+                    if not renders_inline(resume, fmt):
+                        return self._queued_export(request, resume, fmt)
+                    data = get_artifact(resume, fmt, key)
+                response = HttpResponse(data, content_type=EXPORT_FORMATS[fmt])
+                response['Content-Disposition'] = f'attachment; filename="{resume.title}.{fmt}"'
         except ImportError:
             return Response(
-                {"error": "DOCX export dependencies not installed. Install python-docx."},
+                {"error": missing_dependency_error},
                 status=status.HTTP_501_NOT_IMPLEMENTED
             )
         except Exception as e:
             return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        response['ETag'] = etag
+        # Let browsers keep the file but revalidate it on every download
+        response['Cache-Control'] = 'private, no-cache'
+        return response
+
+    def _queued_export(self, request, resume, fmt):
+        from .export_cache import submit_export_job
+
+        job = submit_export_job(resume, fmt, request.user)
+        serializer = ExportJobSerializer(job, context={'request': request})
+        return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
+
+    @action(detail=True, methods=['post'], url_path='export-jobs')
+    def export_jobs(self, request, pk=None):
+        """
+        Submit a background export.
+        Expects: { "format": "pdf" | "docx" }
+        Returns the job; poll /resumes/export-jobs/<id>/ and download from
+        its download_url once completed.
+        """
+        resume = self.get_object()
+        serializer = ExportJobCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        return self._queued_export(request, resume, serializer.validated_data['format'])
 
     @action(detail=True, methods=['get'])
     def compare(self, request, pk=None):
@@ -226,3 +262,49 @@ class ResumeSectionViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = ResumeSection.objects.all()
     serializer_class = ResumeSectionSerializer
     permission_classes = [permissions.IsAuthenticated]
+
+
+class ExportJobViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    ViewSet for polling background export jobs and downloading their result.
+    """
+    queryset = ExportJob.objects.all()
+    serializer_class = ExportJobSerializer
+    permission_classes = [permissions.IsAuthenticated, IsOwnerOrAdmin]
+
+    def get_queryset(self):
+        if getattr(self, 'swagger_fake_view', False):
+            return ExportJob.objects.none()
+        if self.request.user.role == 'admin':
+            return ExportJob.objects.all()
+        return ExportJob.objects.filter(user=self.request.user)
+
+    @action(detail=True, methods=['get'])
+    def download(self, request, pk=None):
+        """Stream a completed job's file from the export cache."""
+        from .export_cache import EXPORT_FORMATS, etag_for, etag_matches, open_artifact
+
+        job = self.get_object()
+        if job.status != 'completed':
+            serializer = self.get_serializer(job)
+            return Response(serializer.data, status=status.HTTP_409_CONFLICT)
+
+        etag = etag_for(job.artifact_key)
+        if etag_matches(request, etag):
+            response = HttpResponseNotModified()
+        else:
+            fh = open_artifact(job.artifact_key)
+            if fh is None:
+                return Response(
+                    {"error": "This export has expired. Submit a new export job."},
+                    status=status.HTTP_410_GONE,
+                )
+            response = FileResponse(
+                fh,
+                as_attachment=True,
+                filename=f'{job.resume.title}.{job.format}',
+                content_type=EXPORT_FORMATS[job.format],
+            )
+        response['ETag'] = etag
+        response['Cache-Control'] = 'private, no-cache'
+        return response
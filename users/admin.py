@@ -5,7 +5,7 @@ from django.utils.html import format_html
 from django.urls import reverse
 from django.utils.safestring import mark_safe
 
-from .models import User, UserActivity, Referral
+from .models import User, UserActivity, Referral, DataExport
 
 
 @admin.register(User)
@@ -173,6 +173,17 @@ class ReferralAdmin(admin.ModelAdmin):
         return queryset.select_related('referrer', 'referred')
 
 
+@admin.register(DataExport)
+class DataExportAdmin(admin.ModelAdmin):
+    """
+    Admin configuration for the DataExport model.
+    """
+    list_display = ('user', 'requested_by', 'status', 'size', 'created_at', 'completed_at')
+    list_filter = ('status', 'created_at')
+    search_fields = ('user__username', 'user__email')
+    readonly_fields = ('id', 'user', 'requested_by', 'status', 'path', 'size', 'error', 'created_at', 'completed_at')
+
+
 # Optional: Add inline admin for subscriptions in User admin
 class SubscriptionInline(admin.TabularInline):
     """
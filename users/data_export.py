@@ -0,0 +1,294 @@
+"""
+Streaming ZIP export of everything a user has stored.
+
+The archive holds:
+
+- ``profile.json`` -- the user's profile (no credentials or OTPs);
+- one JSON Lines file per record type: ``resumes.jsonl``,
+  ``resume_versions.jsonl``, ``cover_letters.jsonl``,
+  ``job_applications.jsonl``, ``interview_rounds.jsonl``,
+  ``application_notes.jsonl`` and ``ats_scores.jsonl``;
+- ``resumes/<id>-<title>.pdf`` for every resume that is not deleted,
+  copied from the export cache (the background job renders and caches
+  missing ones);
+- ``manifest.json`` -- record counts and any PDF that could not be
+  included.
+
+``iter_user_data_zip`` is a generator of archive bytes.  Records are read
+with ``.iterator()`` and PDFs are copied in blocks; every write goes
+through a sink that is drained as soon as it holds ``STREAM_CHUNK_SIZE``
+bytes, so memory use does not grow with the account (beyond one small
+``ZipInfo`` per archive member and one PDF while it is rendered).  Entries
+use data descriptors, so nothing is ever seeked back to.
+
+An export streams within the request only when the account has at most
+``USER_DATA_EXPORT_SYNC_MAX_RECORDS`` records and every resume's PDF is
+already cached, so a request never waits on the PDF renderer.  Other
+accounts are exported by Celery (``run_data_export``) into a temporary
+file that is then saved to ``default_storage``; the requester is notified
+when the archive is ready.  ``prune_data_exports`` (periodic task
+``cleanup_data_exports_task``, or ``manage.py cleanup_data_exports``)
+deletes archives completed more than ``USER_DATA_EXPORT_RETENTION_DAYS``
+ago; their downloads then answer 410 Gone.
+"""
+
+import json
+import logging
+import re
+import tempfile
+import zipfile
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils import timezone
+
+from .models import DataExport
+
+logger = logging.getLogger(__name__)
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+PROFILE_FIELDS = (
+    'id', 'username', 'email', 'full_name', 'phone_number', 'role', 'is_verified',
+    'industry', 'years_of_experience', 'location', 'notification_preferences',
+    'date_joined', 'last_login', 'created_at', 'updated_at',
+)
+
+
+class _ChunkSink:
+    """Write-only file object collecting what ``ZipFile`` writes until drained."""
+
+    def __init__(self):
+        self._chunks = []
+        self.size = 0
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self.size += len(data)
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks = []
+        self.size = 0
+        return data
+
+
+def _record_querysets(user):
+    """Yield ``(file name, values queryset)`` for every record type."""
+    from ats_checker.models import ATSScore
+    from cover_letters.models import CoverLetter
+    from job_tracker.models import ApplicationNote, InterviewRound, JobApplication
+    from resumes.models import Resume, ResumeVersion
+
+    yield 'resumes.jsonl', Resume.objects.filter(user=user)
+    yield 'resume_versions.jsonl', ResumeVersion.objects.filter(resume__user=user)
+    yield 'cover_letters.jsonl', CoverLetter.objects.filter(user=user)
+    yield 'job_applications.jsonl', JobApplication.objects.filter(user=user)
+    yield 'interview_rounds.jsonl', InterviewRound.objects.filter(application__user=user)
+    yield 'application_notes.jsonl', ApplicationNote.objects.filter(application__user=user)
+    yield 'ats_scores.jsonl', ATSScore.objects.filter(user=user)
+
+
+def count_user_records(user) -> int:
+    """Number of records ``iter_user_data_zip`` would export for *user*."""
+    return sum(queryset.count() for _, queryset in _record_querysets(user))
+
+
+def exports_inline(user) -> bool:
+    """
+    Whether *user*'s data can be streamed within the request: few enough
+    records, and a cached PDF for every resume.
+    """
+    from resumes.export_cache import artifact_key
+    from resumes.models import ExportArtifact, Resume
+
+    limit = getattr(settings, 'USER_DATA_EXPORT_SYNC_MAX_RECORDS', 500)
+    if count_user_records(user) > limit:
+        return False
+    resumes = Resume.objects.filter(user=user, is_deleted=False).select_related('template')
+    keys = {artifact_key(resume, 'pdf') for resume in resumes}
+    return ExportArtifact.objects.filter(key__in=keys).count() == len(keys)
+
+
+def _pdf_name(resume) -> str:
+    slug = re.sub(r'[^\w.-]+', '-', resume.title).strip('-.')[:80]
+    return f'resumes/{resume.pk}-{slug or "resume"}.pdf'
+
+
+def _open_resume_pdf(resume, render_missing):
+    """
+    Return a readable file with the resume's PDF from the export cache,
+    rendering and caching it on a miss when *render_missing* is set.
+    """
+    from io import BytesIO
+
+    from resumes.export_cache import artifact_key, get_artifact, open_artifact
+
+    key = artifact_key(resume, 'pdf')
+    fh = open_artifact(key)
+    if fh is None:
+        if not render_missing:
+            raise LookupError("The PDF is not in the export cache.")
+        fh = BytesIO(get_artifact(resume, 'pdf', key=key))
+    return fh
+
+
+def iter_user_data_zip(user, include_pdfs=True, render_missing=False):
+    """
+    Yield the ZIP archive of *user*'s data in chunks of about
+    ``STREAM_CHUNK_SIZE`` bytes.
+
+    PDFs come from the export cache; missing ones are rendered only with
+    *render_missing* (never inside a request).  Resumes whose PDF cannot be
+    included are listed under ``missing_pdfs`` in the manifest.
+    """
+    from resumes.models import Resume
+
+    sink = _ChunkSink()
+    manifest = {
+        'user': user.pk,
+        'generated_at': timezone.now().isoformat(),
+        'records': {},
+        'missing_pdfs': [],
+    }
+
+    with zipfile.ZipFile(sink, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        profile = {name: getattr(user, name) for name in PROFILE_FIELDS}
+        archive.writestr('profile.json', json.dumps(profile, cls=DjangoJSONEncoder, indent=2))
+
+        for name, queryset in _record_querysets(user):
+            count = 0
+            with archive.open(name, 'w', force_zip64=True) as entry:
+                for row in queryset.order_by('pk').values().iterator(chunk_size=500):
+                    entry.write(json.dumps(row, cls=DjangoJSONEncoder).encode('utf-8') + b'\n')
+                    count += 1
+                    if sink.size >= STREAM_CHUNK_SIZE:
+                        yield sink.drain()
+            manifest['records'][name] = count
+            if sink.size:
+                yield sink.drain()
+
+        if include_pdfs:
+            resumes = Resume.objects.filter(user=user, is_deleted=False).select_related('template')
+            for resume in resumes.order_by('pk').iterator(chunk_size=100):
+                try:
+                    fh = _open_resume_pdf(resume, render_missing)
+                except Exception as e:
+                    logger.warning("Could not export the PDF of resume %s: %s", resume.pk, e)
+                    manifest['missing_pdfs'].append({'resume': resume.pk, 'error': str(e)})
+                    continue
+                # PDFs are compressed already
+                info = zipfile.ZipInfo(_pdf_name(resume), timezone.now().timetuple()[:6])
+                info.compress_type = zipfile.ZIP_STORED
+                with fh, archive.open(info, 'w', force_zip64=True) as entry:
+                    for block in iter(lambda: fh.read(STREAM_CHUNK_SIZE), b''):
+                        entry.write(block)
+                        if sink.size >= STREAM_CHUNK_SIZE:
+                            yield sink.drain()
+                if sink.size:
+                    yield sink.drain()
+
+        archive.writestr('manifest.json', json.dumps(manifest, indent=2))
+    yield sink.drain()
+
+
+def export_filename(user) -> str:
+    return f'resumeit-data-{user.username}-{timezone.now():%Y%m%d}.zip'
+
+
+def _export_path(export) -> str:
+    prefix = getattr(settings, 'USER_DATA_EXPORT_PREFIX', 'data-exports')
+    return f'{prefix}/{export.user_id}/{export.pk}.zip'
+
+
+def submit_data_export(user, requested_by):
+    """Create a ``DataExport`` and queue it for Celery."""
+    from .tasks import run_data_export_task
+
+    export = DataExport.objects.create(user=user, requested_by=requested_by)
+    transaction.on_commit(lambda: run_data_export_task.delay(str(export.pk)))
+    return export
+
+
+def _notify(export):
+    from notifications.services import create_notification
+
+    recipient = export.requested_by or export.user
+    if export.status == 'completed':
+        title = 'Your data export is ready'
+        message = 'The ZIP archive of your ResumeIt data is ready to download.'
+        if recipient != export.user:
+            title = f'Data export of {export.user.username} is ready'
+            message = f'The ZIP archive of {export.user.username}\'s data is ready to download.'
+    else:
+        title = 'Your data export failed'
+        message = 'We could not build your data export. Please try again later.'
+    create_notification(
+        user=recipient,
+        type='system',
+        title=title,
+        message=message,
+        data={'data_export_id': str(export.pk), 'status': export.status},
+    )
+
+
+def run_data_export(export_id):
+    """Build a data export into ``default_storage``. Called from Celery."""
+    export = DataExport.objects.select_related('user', 'requested_by').filter(pk=export_id).first()
+    if export is None:
+        logger.error("DataExport with ID %s does not exist", export_id)
+        return None
+    if export.status == 'completed':
+        return export
+
+    export.status = 'processing'
+    export.save(update_fields=['status'])
+    try:
+        with tempfile.TemporaryFile() as tmp:
+            for chunk in iter_user_data_zip(export.user, render_missing=True):
+                tmp.write(chunk)
+            export.size = tmp.tell()
+            tmp.seek(0)
+            export.path = default_storage.save(_export_path(export), File(tmp))
+        export.status = 'completed'
+        export.error = ''
+    except Exception as e:
+        logger.error("Data export %s failed: %s", export_id, e, exc_info=True)
+        export.status = 'failed'
+        export.error = str(e)
+    export.completed_at = timezone.now()
+    export.save(update_fields=['status', 'path', 'size', 'error', 'completed_at'])
+    _notify(export)
+    return export
+
+
+def prune_data_exports(max_age_days: int = None) -> int:
+    """
+    Delete the archives of exports completed more than *max_age_days* ago
+    (``USER_DATA_EXPORT_RETENTION_DAYS`` by default).  The ``DataExport``
+    rows stay, without a path, so their downloads answer 410.  Returns the
+    number of archives removed.
+    """
+    if max_age_days is None:
+        max_age_days = getattr(settings, 'USER_DATA_EXPORT_RETENTION_DAYS', 7)
+    threshold = timezone.now() - timedelta(days=max_age_days)
+    expired = DataExport.objects.filter(status='completed', completed_at__lt=threshold).exclude(path='')
+
+    removed = []
+    for pk, path in expired.values_list('pk', 'path').iterator():
+        try:
+            default_storage.delete(path)
+        except OSError:
+            logger.warning("Could not delete data export %s", path, exc_info=True)
+            continue
+        removed.append(pk)
+    DataExport.objects.filter(pk__in=removed).update(path='', size=0)
+    return len(removed)
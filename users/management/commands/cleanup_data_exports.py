@@ -0,0 +1,21 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from users.data_export import prune_data_exports
+
+
+class Command(BaseCommand):
+    help = 'Delete data export archives completed more than USER_DATA_EXPORT_RETENTION_DAYS ago'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days', type=int, default=None,
+            help='Retention in days (default: USER_DATA_EXPORT_RETENTION_DAYS; 0 deletes every archive)',
+        )
+
+    def handle(self, *args, **options):
+        days = options['days']
+        if days is None:
+            days = settings.USER_DATA_EXPORT_RETENTION_DAYS
+        removed = prune_data_exports(days)
+        self.stdout.write(self.style.SUCCESS(f'Deleted {removed} expired data export(s).'))
@@ -135,6 +135,9 @@ class User(AbstractUser):
         Check if user has an active subscription.
         This is a property method that can be called like user.is_subscribed
         """
+        prefetched = getattr(self, 'active_subscriptions', None)
+        if prefetched is not None:
+            return bool(prefetched)
         return self.subscriptions.filter(
             status='active',
             end_date__gte=timezone.now().date()
@@ -145,7 +148,12 @@ class User(AbstractUser):
         """
         Get the user's current active subscription.
         Returns None if no active subscription exists.
+        Uses ``active_subscriptions`` when the queryset prefetched it
+        (see ``UserViewSet.get_queryset``).
         """
+        prefetched = getattr(self, 'active_subscriptions', None)
+        if prefetched is not None:
+            return prefetched[0] if prefetched else None
         return self.subscriptions.filter(
             status='active',
             end_date__gte=timezone.now().date()
@@ -216,4 +224,37 @@ class Referral(models.Model):
     
     def __str__(self):
         referred_user = self.referred.username if self.referred else "Not yet registered"
-        return f"{self.referrer.username} referred {referred_user}"
\ No newline at end of file
+        return f"{self.referrer.username} referred {referred_user}"
+
+
+class DataExport(models.Model):
+    """
+    A background export of all of a user's data as a ZIP archive in
+    ``default_storage`` (see ``users.data_export``).
+    """
+    STATUS_CHOICES = (
+        ('pending', 'Pending'),
+        ('processing', 'Processing'),
+        ('completed', 'Completed'),
+        ('failed', 'Failed'),
+    )
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='data_exports')
+    requested_by = models.ForeignKey(
+        User, on_delete=models.SET_NULL, null=True, blank=True, related_name='requested_data_exports'
+    )
+    status = models.CharField(_('Status'), max_length=20, choices=STATUS_CHOICES, default='pending')
+    path = models.CharField(_('Storage Path'), max_length=500, blank=True)
+    size = models.PositiveBigIntegerField(_('Size (bytes)'), default=0)
+    error = models.TextField(_('Error'), blank=True)
+    created_at = models.DateTimeField(_('Created At'), auto_now_add=True)
+    completed_at = models.DateTimeField(_('Completed At'), null=True, blank=True)
+
+    class Meta:
+        verbose_name = _('Data Export')
+        verbose_name_plural = _('Data Exports')
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.user.username} data export - {self.status}"
@@ -2,7 +2,7 @@ from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
 from django.utils import timezone
-from .models import UserActivity, Referral
+from .models import UserActivity, Referral, DataExport
 
 User = get_user_model()
 
@@ -207,4 +207,23 @@ class ReferralCreateSerializer(serializers.ModelSerializer):
         
         # Send invitation email (to be implemented in views)
         
-        return referral
\ No newline at end of file
+        return referral
+
+
+class DataExportSerializer(serializers.ModelSerializer):
+    """
+    Serializer for the DataExport model.
+    """
+    download_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = DataExport
+        fields = ('id', 'user', 'status', 'size', 'error', 'download_url', 'created_at', 'completed_at')
+        read_only_fields = fields
+
+    def get_download_url(self, obj):
+        if obj.status != 'completed' or not obj.path:
+            return None
+        url = f'/api/v1/users/data-exports/{obj.id}/download/'
+        request = self.context.get('request')
+        return request.build_absolute_uri(url) if request else url
@@ -147,3 +147,19 @@ def cleanup_expired_otps_task():
     ).update(password_reset_otp=None, password_reset_otp_created_at=None)
 
     return f"Cleaned up {updated} expired OTPs"
+
+
+@shared_task
+def run_data_export_task(export_id):
+    """Build a user data export ZIP in storage and notify the requester."""
+    from .data_export import run_data_export
+    export = run_data_export(export_id)
+    return export.status if export else None
+
+
+@shared_task
+def cleanup_data_exports_task():
+    """Periodic task to delete data export archives past their retention."""
+    from .data_export import prune_data_exports
+    removed = prune_data_exports()
+    return f"Deleted {removed} expired data exports"
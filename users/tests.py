@@ -1,3 +1,153 @@
-from django.test import TestCase
+import io
+import json
+import zipfile
+from datetime import timedelta
 
-# Create your tests here.
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.utils import timezone
+
+from notifications.models import Notification
+from resumes.export_cache import prerender_resume_exports
+from resumes.models import Resume, ResumeVersion
+from subscriptions.models import Subscription, SubscriptionPlan
+
+from .models import DataExport
+
+User = get_user_model()
+
+
+@pytest.fixture
+def subscribed_users(db):
+    plan = SubscriptionPlan.objects.create(name='Pro', price=499, duration_months=1)
+    today = timezone.now().date()
+    users = []
+    for i in range(8):
+        user = User.objects.create_user(
+            username=f'member{i}', email=f'member{i}@example.com', password='TestPass123!',
+        )
+        Subscription.objects.create(
+            user=user, plan=plan, status='active',
+            start_date=today, end_date=today + timedelta(days=30),
+        )
+        users.append(user)
+    return users
+
+
+def test_user_list_within_query_budget(admin_client, subscribed_users, query_inspector):
+    response = admin_client.get('/api/v1/users/')
+    assert response.status_code == 200
+
+    report = next(report for report in query_inspector if report.action == 'list')
+    assert report.budget is not None
+    assert report.count <= report.budget
+
+    members = [user for user in response.data['results'] if user['username'].startswith('member')]
+    assert members
+    for user in members:
+        assert user['is_subscribed'] is True
+        assert user['subscription_status']['plan_name'] == 'Pro'
+
+
+@pytest.fixture
+def export_settings(settings, tmp_path):
+    settings.PDF_RENDER_WORKERS = 0
+    settings.MEDIA_ROOT = str(tmp_path)
+    settings.EXPORT_PRERENDER = False
+    return settings
+
+
+@pytest.fixture
+def resumes(sample_user):
+    content = {'personal': {'name': 'Test User'}, 'summary': 'Engineer.'}
+    created = []
+    for i in range(2):
+        resume = Resume.objects.create(user=sample_user, title=f'CV {i}', content=content)
+        ResumeVersion.objects.create(resume=resume, content=content, version_number=1)
+        created.append(resume)
+    return created
+
+
+def _zip(response):
+    body = b''.join(response.streaming_content)
+    return zipfile.ZipFile(io.BytesIO(body))
+
+
+def test_data_export_streams_when_pdfs_are_cached(authenticated_client, export_settings, resumes, sample_user):
+    for resume in resumes:
+        prerender_resume_exports(resume.pk)
+
+    response = authenticated_client.get(f'/api/v1/users/{sample_user.pk}/data-export/')
+    assert response.status_code == 200
+    assert response['Content-Type'] == 'application/zip'
+
+    archive = _zip(response)
+    assert archive.testzip() is None
+    manifest = json.loads(archive.read('manifest.json'))
+    assert manifest['records']['resumes.jsonl'] == 2
+    assert manifest['records']['resume_versions.jsonl'] == 2
+    assert manifest['missing_pdfs'] == []
+    pdfs = [name for name in archive.namelist() if name.endswith('.pdf')]
+    assert len(pdfs) == 2
+    assert archive.read(pdfs[0]).startswith(b'%PDF')
+
+
+def test_data_export_with_uncached_pdfs_is_queued(
+    authenticated_client, export_settings, resumes, sample_user, django_capture_on_commit_callbacks,
+):
+    with django_capture_on_commit_callbacks(execute=True):
+        response = authenticated_client.get(f'/api/v1/users/{sample_user.pk}/data-export/')
+    assert response.status_code == 202
+
+    export = authenticated_client.get(f"/api/v1/users/data-exports/{response.data['id']}/")
+    assert export.data['status'] == 'completed'
+
+    download = authenticated_client.get(export.data['download_url'])
+    assert download.status_code == 200
+    pdfs = [name for name in _zip(download).namelist() if name.endswith('.pdf')]
+    assert len(pdfs) == 2
+    assert Notification.objects.filter(user=sample_user, data__data_export_id=response.data['id']).exists()
+
+
+def test_data_export_of_another_user_is_forbidden(authenticated_client, admin_user):
+    response = authenticated_client.get(f'/api/v1/users/{admin_user.pk}/data-export/')
+    assert response.status_code == 403
+
+
+def test_data_export_download_states(authenticated_client, sample_user):
+    pending = DataExport.objects.create(user=sample_user, requested_by=sample_user)
+    response = authenticated_client.get(f'/api/v1/users/data-exports/{pending.pk}/download/')
+    assert response.status_code == 409
+
+    expired = DataExport.objects.create(
+        user=sample_user, status='completed', path='data-exports/missing.zip',
+    )
+    response = authenticated_client.get(f'/api/v1/users/data-exports/{expired.pk}/download/')
+    assert response.status_code == 410
+
+
+def test_expired_data_exports_are_deleted(authenticated_client, export_settings, sample_user):
+    exports = []
+    for age in (export_settings.USER_DATA_EXPORT_RETENTION_DAYS + 1, 0):
+        path = default_storage.save(f'data-exports/{age}.zip', ContentFile(b'PK'))
+        exports.append(DataExport.objects.create(
+            user=sample_user, status='completed', path=path, size=2,
+            completed_at=timezone.now() - timedelta(days=age),
+        ))
+    old, recent = exports
+    old_path = old.path
+
+    call_command('cleanup_data_exports', stdout=io.StringIO())
+
+    assert not default_storage.exists(old_path)
+    assert default_storage.exists(recent.path)
+    response = authenticated_client.get(f'/api/v1/users/data-exports/{old.pk}/')
+    assert response.data['download_url'] is None
+    response = authenticated_client.get(f'/api/v1/users/data-exports/{old.pk}/download/')
+    assert response.status_code == 410
+    response = authenticated_client.get(f'/api/v1/users/data-exports/{recent.pk}/download/')
+    assert response.status_code == 200
+    response.close()
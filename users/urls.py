@@ -1,12 +1,14 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from .views import (
-    UserViewSet, UserActivityViewSet, ReferralViewSet,
+    UserViewSet, UserActivityViewSet, ReferralViewSet, DataExportViewSet,
     RegisterView, OTPVerificationView, ResendOTPView,
     PasswordResetRequestView, PasswordResetConfirmView
 )
 
 router = DefaultRouter()
+# Before the '' prefix, whose detail route would otherwise match it
+router.register(r'data-exports', DataExportViewSet)
 router.register(r'', UserViewSet)
 router.register(r'activities', UserActivityViewSet)
 router.register(r'referrals', ReferralViewSet)
@@ -2,9 +2,13 @@ from rest_framework import viewsets, permissions, status, generics
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django.contrib.auth import get_user_model
-from .models import UserActivity, Referral
+from django.db.models import Prefetch
+from django.utils import timezone
+from django.core.files.storage import default_storage
+from django.http import FileResponse, StreamingHttpResponse
+from .models import UserActivity, Referral, DataExport
 from .serializers import (
-    UserSerializer, UserRegistrationSerializer, UserActivitySerializer,
+    UserSerializer, UserRegistrationSerializer, UserActivitySerializer, DataExportSerializer,
     ReferralSerializer, ReferralCreateSerializer, OTPVerificationSerializer,
     ResendOTPSerializer, PasswordResetRequestSerializer, PasswordResetConfirmSerializer
 )
@@ -20,6 +24,22 @@ class UserViewSet(viewsets.ModelViewSet):
     queryset = User.objects.all()
     serializer_class = UserSerializer
     permission_classes = [permissions.IsAuthenticated]
+    # Enforced by the query_inspector test fixture (resumeit.query_inspector)
+    query_budget = {'list': 3, 'retrieve': 2}
+
+    def get_queryset(self):
+        """
+        Prefetch each user's active subscriptions (with their plan), which
+        UserSerializer reads for ``is_subscribed`` and ``subscription_status``.
+        """
+        from subscriptions.models import Subscription
+
+        active = Subscription.objects.filter(
+            status='active', end_date__gte=timezone.now().date(),
+        ).select_related('plan')
+        return User.objects.order_by('pk').prefetch_related(
+            Prefetch('subscriptions', queryset=active, to_attr='active_subscriptions')
+        )
 
     def get_permissions(self):
         """
@@ -27,7 +47,7 @@ class UserViewSet(viewsets.ModelViewSet):
         """
         if self.action == 'create':
             permission_classes = [permissions.AllowAny]
-        elif self.action in ['list', 'retrieve', 'update', 'partial_update', 'destroy']:
+        elif self.action in ['list', 'retrieve', 'update', 'partial_update', 'destroy', 'data_export']:
             permission_classes = [IsOwnerOrAdmin]
         else:
             permission_classes = [permissions.IsAuthenticated]
@@ -59,6 +79,71 @@ class UserViewSet(viewsets.ModelViewSet):
         serializer = UserActivitySerializer(activities, many=True)
         return Response(serializer.data)
 
+    @action(detail=True, methods=['get'], url_path='data-export')
+    def data_export(self, request, pk=None):
+        """
+        Download all of a user's data as a ZIP archive.
+
+        Small accounts whose resume PDFs are all cached are streamed
+        directly; others (or ``?background=true``) are queued as a
+        ``DataExport`` and answered with 202 -- poll
+        ``/users/data-exports/<id>/`` until it completes.
+        """
+        from .data_export import export_filename, exports_inline, iter_user_data_zip, submit_data_export
+
+        user = self.get_object()
+        background = request.query_params.get('background', '').lower() in ('1', 'true')
+        if background or not exports_inline(user):
+            export = submit_data_export(user, request.user)
+            serializer = DataExportSerializer(export, context={'request': request})
+            return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
+
+        chunks = iter_user_data_zip(user)
+        response = StreamingHttpResponse(chunks, content_type='application/zip')
+        response['Content-Disposition'] = f'attachment; filename="{export_filename(user)}"'
+        response['Cache-Control'] = 'private, no-store'
+        return response
+
+
+class DataExportViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    ViewSet for polling background data exports and downloading the archive.
+    """
+    queryset = DataExport.objects.all()
+    serializer_class = DataExportSerializer
+    permission_classes = [permissions.IsAuthenticated, IsOwnerOrAdmin]
+
+    def get_queryset(self):
+        if getattr(self, 'swagger_fake_view', False):
+            return DataExport.objects.none()
+        if self.request.user.role == 'admin':
+            return DataExport.objects.all()
+        return DataExport.objects.filter(user=self.request.user)
+
+    @action(detail=True, methods=['get'])
+    def download(self, request, pk=None):
+        """Stream a completed export's archive from storage."""
+        from .data_export import export_filename
+
+        export = self.get_object()
+        if export.status != 'completed':
+            serializer = self.get_serializer(export)
+            return Response(serializer.data, status=status.HTTP_409_CONFLICT)
+        try:
+            if not export.path:
+                raise FileNotFoundError(export.pk)
+            fh = default_storage.open(export.path, 'rb')
+        except (OSError, ValueError):
+            return Response(
+                {"error": "This export is no longer available. Request a new one."},
+                status=status.HTTP_410_GONE,
+            )
+        response = FileResponse(
+            fh, as_attachment=True, filename=export_filename(export.user), content_type='application/zip',
+        )
+        response['Cache-Control'] = 'private, no-store'
+        return response
+
 
 class UserActivityViewSet(viewsets.ReadOnlyModelViewSet):
     """